@@ -0,0 +1,7 @@
+"""
+Playwright audit tooling for the CEP dashboard
+
+Run the modules from apps/cms, e.g.:
+
+    python -m audit.engine --base-url http://localhost:3000 --suite ciclos
+"""
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Cached authenticated storage state for protected dashboard routes
+
+Logs in once, through POST /api/users/login or the dev /dev/auto-login
+route, and saves Playwright's storage_state (the payload-token cookie) per
+host. Every parallel context of every run reuses that file; a new login only
+happens when the token's JWT exp is within EXPIRY_MARGIN of now. A file lock
+keeps concurrent audit processes from logging in at the same time.
+
+Credentials come from PAYLOAD_SUPERADMIN_EMAIL / PAYLOAD_SUPERADMIN_PASSWORD.
+Only a local dev server (localhost, 127.0.0.1) falls back to the defaults of
+app/dev/auto-login/route.ts; any other host needs both variables set, so the
+dev password is never sent anywhere else.
+
+    python -m audit.auth_state --base-url http://localhost:3000            # show / refresh
+    python -m audit.auth_state --base-url http://localhost:3000 --refresh  # force a new login
+"""
+
+import argparse
+import asyncio
+import base64
+import fcntl
+import json
+import os
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright
+
+STATE_DIR = os.path.join(tempfile.gettempdir(), "cep-audit-auth")
+TOKEN_COOKIE = "payload-token"
+EXPIRY_MARGIN = 60   # seconds; refresh a session this close to expiring
+METHODS = ("api", "dev")
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+DEV_CREDENTIALS = ("superadmin@cepcomunicacion.com", "Dev12345!")
+
+
+class AuthError(Exception):
+    pass
+
+
+def is_local(base_url):
+    return urlparse(base_url).hostname in LOCAL_HOSTS
+
+
+def credentials(base_url):
+    """(email, password) for the api login; the dev defaults only for local hosts"""
+    email = os.environ.get("PAYLOAD_SUPERADMIN_EMAIL")
+    password = os.environ.get("PAYLOAD_SUPERADMIN_PASSWORD")
+    if email and password:
+        return email, password
+    if is_local(base_url):
+        return email or DEV_CREDENTIALS[0], password or DEV_CREDENTIALS[1]
+    raise AuthError(f"set PAYLOAD_SUPERADMIN_EMAIL and PAYLOAD_SUPERADMIN_PASSWORD to log in to {base_url}")
+
+
+def state_path(base_url):
+    host = urlparse(base_url).netloc.replace(":", "_")
+    return os.path.join(STATE_DIR, f"{host}.json")
+
+
+def token_expiry(state):
+    """Unix time the session token expires (JWT exp, else the cookie's expiry), or None"""
+    for cookie in state.get("cookies", []):
+        if cookie["name"] != TOKEN_COOKIE:
+            continue
+        try:
+            payload = cookie["value"].split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            expires = cookie.get("expires", -1)
+            return expires if expires > 0 else None
+    return None
+
+
+def load_state(path):
+    """(state, expiry) of a cached session still valid for EXPIRY_MARGIN, else (None, None)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    expiry = token_expiry(state)
+    if expiry is None or expiry - EXPIRY_MARGIN <= time.time():
+        return None, None
+    return state, expiry
+
+
+async def login(p, base_url, method):
+    """Log in with a bare API request context; returns its storage state"""
+    if method == "api":
+        email, password = credentials(base_url)
+    request = await p.request.new_context(base_url=base_url)
+    try:
+        if method == "api":
+            response = await request.post("/api/users/login", data={"email": email, "password": password})
+        else:
+            response = await request.get("/dev/auto-login?redirect=/")
+        if not response.ok:
+            raise AuthError(f"{method} login failed: HTTP {response.status} {(await response.text())[:200]}")
+        state = await request.storage_state()
+    finally:
+        await request.dispose()
+
+    if token_expiry(state) is None:
+        raise AuthError(f"{method} login returned no {TOKEN_COOKIE} cookie")
+    return state
+
+
+def _lock(path):
+    handle = open(path + ".lock", "w")
+    fcntl.flock(handle, fcntl.LOCK_EX)
+    return handle
+
+
+async def ensure(p, base_url, method="api", refresh=False):
+    """Path of a valid storage_state file for base_url, logging in only if needed"""
+    os.makedirs(STATE_DIR, mode=0o700, exist_ok=True)
+    path = state_path(base_url)
+    lock = await asyncio.to_thread(_lock, path)
+    try:
+        state, expiry = (None, None) if refresh else load_state(path)
+        if state is None:
+            started = time.perf_counter()
+            state = await login(p, base_url, method)
+            expiry = token_expiry(state)
+            descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, "w", encoding='utf-8') as f:
+                json.dump(state, f)
+            print(f"🔑 Logged in via {method} in {(time.perf_counter() - started) * 1000:.0f} ms, "
+                  f"session valid for {(expiry - time.time()) / 60:.0f} min")
+        else:
+            print(f"🔑 Reusing cached session ({(expiry - time.time()) / 60:.0f} min left)")
+    finally:
+        lock.close()
+    return path
+
+
+def invalidate(base_url):
+    try:
+        os.unlink(state_path(base_url))
+    except FileNotFoundError:
+        pass
+
+
+async def main_async(args):
+    async with async_playwright() as p:
+        path = await ensure(p, args.base_url.rstrip('/'), args.method, args.refresh)
+    print(f"   storage_state: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Log in once and cache the dashboard session")
+    parser.add_argument("--base-url", default=os.environ.get("CEP_AUDIT_URL", "http://localhost:3000"))
+    parser.add_argument("--method", choices=METHODS, default="api", help="login route to use")
+    parser.add_argument("--refresh", action="store_true", help="log in again even if the session is valid")
+    parser.add_argument("--logout", action="store_true", help="drop the cached session")
+    args = parser.parse_args()
+
+    if args.logout:
+        invalidate(args.base_url.rstrip('/'))
+        print("✅ Cached session removed")
+        return
+    try:
+        asyncio.run(main_async(args))
+    except AuthError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
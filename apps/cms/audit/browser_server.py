@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Persistent browser server that audit scripts attach to
+
+Every audit script used to call p.chromium.launch() and pay Chromium's cold
+start. This keeps one Chromium running behind a websocket (Playwright's
+launchServer, through the driver's `launch-server` command) and scripts
+connect to it instead; browser startup is paid once per session, not once
+per script.
+
+    python -m audit.browser_server start     # background daemon
+    python -m audit.browser_server status
+    python -m audit.browser_server stop
+    python -m audit.browser_server serve     # foreground (Ctrl+C to stop)
+
+Scripts call open_browser() / open_browser_sync(), which connect when a
+server is running in the requested mode (headless or headed, see start
+--headed) or CEP_BROWSER_WS is set, and launch locally otherwise.
+Closing a connected browser only disconnects; the server keeps running.
+
+Contexts cannot be handed between websocket clients, so pre-warming happens
+client side: ContextPool creates contexts ahead of time and refills in the
+background, and stands in for the browser wherever new_context() is called.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+STATE_FILE = os.path.join(tempfile.gettempdir(), "cep-browser-server.json")
+DEFAULT_PORT = 9323
+WS_PATH = "cep-audit"
+START_TIMEOUT = 30.0   # seconds
+
+
+# ---------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except (ProcessLookupError, PermissionError):
+        return False
+    return True
+
+
+def read_state():
+    """The running server's {endpoint, pid, ...}, or None"""
+    try:
+        with open(STATE_FILE, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if _alive(state.get("pid", -1)) else None
+
+
+def endpoint(headless=True):
+    """Websocket endpoint to attach to, or None to launch locally.
+
+    A running server is only used when it was started in the requested mode:
+    a script asking for a headed browser must not get the headless daemon.
+    CEP_BROWSER_WS is taken as is.
+    """
+    if os.environ.get("CEP_BROWSER_WS"):
+        return os.environ["CEP_BROWSER_WS"]
+    state = read_state()
+    if not state:
+        return None
+    if state.get("headless", True) != bool(headless):
+        wanted = "headless" if headless else "headed"
+        print(f"⚠️  Browser server is not {wanted}; launching a {wanted} browser locally")
+        return None
+    return state["endpoint"]
+
+
+def open_browser_sync(p, headless=True, **launch_options):
+    """Attach to the browser server if one is running in the same mode, else launch Chromium"""
+    ws = endpoint(headless)
+    if ws:
+        print(f"🔌 Attached to browser server ({ws})")
+        return p.chromium.connect(ws)
+    return p.chromium.launch(headless=headless, **launch_options)
+
+
+async def open_browser(p, headless=True, **launch_options):
+    ws = endpoint(headless)
+    if ws:
+        print(f"🔌 Attached to browser server ({ws})")
+        return await p.chromium.connect(ws)
+    return await p.chromium.launch(headless=headless, **launch_options)
+
+
+class ContextPool:
+    """Pre-warmed contexts, `size` per set of context options.
+
+    Used in place of the browser: new_context() with one of the pool's
+    option sets returns a context created ahead of time and starts warming
+    a replacement; other options fall through to the browser. Callers close
+    contexts as usual.
+    """
+
+    def __init__(self, browser, size, *option_sets):
+        self.browser = browser
+        self.size = size
+        self.option_sets = {self._key(options): options for options in option_sets}
+        self.ready = {key: asyncio.Queue() for key in self.option_sets}
+        self.warming = set()
+
+    @staticmethod
+    def _key(options):
+        return json.dumps(options, sort_keys=True)
+
+    async def start(self):
+        await asyncio.gather(*(self._warm(key) for key in self.option_sets for _ in range(self.size)))
+        return self
+
+    async def _warm(self, key):
+        await self.ready[key].put(await self.browser.new_context(**self.option_sets[key]))
+
+    def _refill(self, key):
+        task = asyncio.create_task(self._warm(key))
+        self.warming.add(task)
+        task.add_done_callback(self.warming.discard)
+
+    async def new_context(self, **options):
+        key = self._key(options)
+        if key not in self.ready:
+            return await self.browser.new_context(**options)
+        context = await self.ready[key].get()
+        self._refill(key)
+        return context
+
+    async def close(self):
+        for task in list(self.warming):
+            task.cancel()
+        for queue in self.ready.values():
+            while not queue.empty():
+                await queue.get_nowait().close()
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+def serve(port=DEFAULT_PORT, headless=True):
+    """Run Chromium behind a websocket until interrupted"""
+    config = {"headless": headless, "host": "127.0.0.1", "port": port, "wsPath": WS_PATH}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(config, f)
+        config_path = f.name
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium", "--config", config_path],
+        stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        ws = server.stdout.readline().strip()
+        if not ws.startswith("ws"):
+            raise SystemExit("❌ Browser server failed to start")
+        with open(STATE_FILE, "w", encoding='utf-8') as f:
+            json.dump({"endpoint": ws, "pid": os.getpid(), "headless": headless, "started": time.time()}, f)
+        print(f"✅ Browser server listening on {ws}")
+
+        signal.signal(signal.SIGTERM, lambda *_: server.terminate())
+        server.wait()
+    except KeyboardInterrupt:
+        server.terminate()
+        server.wait()
+    finally:
+        os.unlink(config_path)
+        state = read_state()
+        if state is None or state["pid"] == os.getpid():
+            try:
+                os.unlink(STATE_FILE)
+            except FileNotFoundError:
+                pass
+
+
+def start(port=DEFAULT_PORT, headless=True):
+    """Start serve() as a detached background process and wait until it is listening"""
+    if read_state():
+        print(f"✅ Already running: {read_state()['endpoint']}")
+        return
+    command = [sys.executable, "-m", "audit.browser_server", "serve", "--port", str(port)]
+    if not headless:
+        command.append("--headed")
+    daemon = subprocess.Popen(command, stdout=subprocess.DEVNULL, start_new_session=True,
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        state = read_state()
+        if state:
+            print(f"✅ Browser server listening on {state['endpoint']}")
+            return
+        if daemon.poll() is not None:
+            raise SystemExit("❌ Browser server exited during startup")
+        time.sleep(0.1)
+    raise SystemExit(f"❌ Browser server did not start within {START_TIMEOUT:g}s")
+
+
+def stop():
+    state = read_state()
+    if not state:
+        print("⚠️  No browser server running")
+        return
+    os.kill(state["pid"], signal.SIGTERM)
+    print(f"✅ Stopped browser server (pid {state['pid']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent Chromium for the audit scripts")
+    parser.add_argument("command", choices=("start", "stop", "status", "serve"))
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.port, headless=not args.headed)
+    elif args.command == "start":
+        start(args.port, headless=not args.headed)
+    elif args.command == "stop":
+        stop()
+    else:
+        state = read_state()
+        if state:
+            uptime = time.time() - state["started"]
+            print(f"✅ Running: {state['endpoint']} (pid {state['pid']}, up {uptime:.0f}s)")
+        else:
+            print("⚠️  No browser server running")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Performance budget gate for dashboard and legacy routes
+
+budgets.json maps route patterns (fnmatch, optionally scoped to one suite)
+to limits; the first matching entry applies to a route:
+
+    max_lcp_ms  max_js_bytes  max_requests  max_api_ms
+    max_fcp_ms  max_ttfb_ms   max_tbt_ms    max_cls
+
+Every run measures the suites with vitals.py (or reads saved vitals JSON
+reports) and compares the budget's percentile of each metric against its
+limit. A budgeted route that did not load, or has no value for a budgeted
+metric, is a violation too (except API latency: a page that made no /api/*
+calls has none to wait for). Violations are printed in the audit's ✅/❌
+summary format and the gate exits 1, the way scripts/audit_dashboard.py
+fails on missing auth protection.
+
+    python -m audit.budget                                   # dashboard + legacy suites
+    python -m audit.budget --suite ciclos --base-url http://localhost:3000
+    python -m audit.budget --base-url http://localhost:3000 --legacy-url http://localhost:8080
+    python -m audit.budget --report /tmp/cep_audit/vitals.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from fnmatch import fnmatch
+
+from audit import engine, vitals
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets.json")
+
+# budget key -> (vitals metric, unit)
+LIMITS = {
+    "max_lcp_ms": ("lcp", "ms"),
+    "max_fcp_ms": ("fcp", "ms"),
+    "max_ttfb_ms": ("ttfb", "ms"),
+    "max_tbt_ms": ("tbt", "ms"),
+    "max_cls": ("cls", ""),
+    "max_js_bytes": ("js_bytes", "bytes"),
+    "max_requests": ("requests", "requests"),
+    "max_api_ms": ("api_ms", "ms"),
+}
+# vitals leaves these unset when there is nothing to measure (api_ms: the page
+# made no /api/* calls), which meets any budget
+ZERO_WHEN_ABSENT = ("api_ms",)
+
+LABELS = {"lcp": "LCP", "fcp": "FCP", "ttfb": "TTFB", "tbt": "TBT", "cls": "CLS",
+          "js_bytes": "JS bytes", "requests": "Request count", "api_ms": "API latency"}
+
+
+class BudgetError(Exception):
+    pass
+
+
+def load_budgets(path=BUDGETS_PATH):
+    """(percentile, budget entries), validated"""
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    percentile = config.get("percentile", 75)
+    if percentile not in vitals.PERCENTILES:
+        raise BudgetError(f"percentile must be one of {vitals.PERCENTILES}, not {percentile}")
+    entries = config.get("budgets", [])
+    for index, entry in enumerate(entries):
+        if "pattern" not in entry:
+            raise BudgetError(f"budget #{index + 1} has no pattern")
+        unknown = set(entry) - set(LIMITS) - {"pattern", "suite"}
+        if unknown:
+            raise BudgetError(f"budget #{index + 1} ({entry['pattern']}): unknown keys {sorted(unknown)}")
+        if entry.get("suite") and entry["suite"] not in engine.SUITES:
+            raise BudgetError(f"budget #{index + 1} ({entry['pattern']}): unknown suite {entry['suite']!r}")
+    return percentile, entries
+
+
+def budget_for(entries, suite, path):
+    """The first budget entry matching a route, or None"""
+    for entry in entries:
+        if entry.get("suite") in (None, suite) and fnmatch(path, entry["pattern"]):
+            return entry
+    return None
+
+
+def format_value(value, unit):
+    if unit == "bytes":
+        return f"{value / 1024:.0f} KB"
+    if unit == "ms":
+        return f"{value:.0f} ms"
+    if unit == "requests":
+        return f"{value:.0f}"
+    return f"{value:.3f}"
+
+
+def check_report(report, percentile, entries):
+    """Result rows (name, passed, detail) for one vitals report.
+
+    A budgeted route that failed to load, or has no value for a budgeted
+    metric, is a FAIL row: a route that never loads must not pass its budget.
+    Metrics in ZERO_WHEN_ABSENT count as 0 when the route did load.
+    """
+    suite = report.get("suite", "all")
+    results = []
+    for name, route in report["routes"].items():
+        entry = budget_for(entries, suite, route["path"])
+        if entry is None:
+            continue
+        samples = route.get("samples", [])
+        errors = [sample["error"] for sample in samples if "error" in sample]
+        loaded = len(errors) < len(samples)
+        if errors:
+            results.append((f"[{suite}] {route['path']} loads ({name})", False,
+                            f"{len(errors)}/{len(samples)} runs failed: {errors[0]}"))
+        summary = route["summary"]
+        for key, (metric, unit) in LIMITS.items():
+            if key not in entry:
+                continue
+            row = f"[{suite}] {route['path']} {LABELS[metric]} ({name})"
+            value = summary.get(metric, {}).get(f"p{percentile}")
+            if value is None and metric in ZERO_WHEN_ABSENT and loaded:
+                value = 0
+            if value is None:
+                results.append((row, False, f"no {metric} samples to check against the budget"
+                                            f" (pattern {entry['pattern']})"))
+                continue
+            limit = entry[key]
+            detail = (f"p{percentile} {format_value(value, unit)} > budget {format_value(limit, unit)}"
+                      f" (pattern {entry['pattern']})")
+            results.append((row, value <= limit, detail))
+    return results
+
+
+def print_results(results):
+    print("\n" + "="*60)
+    print("PERFORMANCE BUDGET")
+    print("="*60)
+
+    for name, passed, detail in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+        if not passed:
+            print(f"       {detail}")
+
+    failed = sum(not passed for _, passed, _ in results)
+    print(f"\n{len(results) - failed}/{len(results)} budgets met")
+    return failed
+
+
+async def measure_suites(args):
+    """Run vitals for each requested suite; returns their reports"""
+    reports = []
+    for suite in args.suite:
+        suite_args = argparse.Namespace(**vars(args))
+        suite_args.suite = suite
+        # --base-url is the dashboard; the legacy site has its own host
+        if suite in engine.SUITE_URLS:
+            suite_args.base_url = args.legacy_url
+        routes, results = await vitals.collect_suite(suite_args)
+        vitals.print_table(routes, results)
+        reports.append(vitals.build_report(engine.site_url(suite_args), suite, args.runs, routes, results))
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when routes exceed their performance budget",
+                                     conflict_handler="resolve")
+    engine.add_arguments(parser)
+    parser.add_argument("--budgets", default=BUDGETS_PATH, help="budget file (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=3, help="samples per route")
+    parser.add_argument("--report", action="append", help="check saved vitals JSON reports instead of measuring")
+    parser.add_argument("--legacy-url", help=f"site for the legacy suite (default: {engine.LEGACY_URL})")
+    # One run at a time, as in vitals.py; --suite is repeatable here
+    parser.set_defaults(concurrency=1, suite=None)
+    parser.add_argument("--suite", action="append", choices=sorted(engine.SUITES), help="suites to measure")
+    args = parser.parse_args()
+
+    try:
+        percentile, entries = load_budgets(args.budgets)
+    except (OSError, ValueError, BudgetError) as e:
+        print(f"❌ Invalid budget file {args.budgets}: {e}")
+        sys.exit(2)
+
+    if args.report:
+        reports = []
+        for path in args.report:
+            with open(path, encoding='utf-8') as f:
+                reports.append(json.load(f))
+    else:
+        args.suite = args.suite or ["all", "legacy"]
+        reports = asyncio.run(measure_suites(args))
+
+    results = [row for report in reports for row in check_report(report, percentile, entries)]
+    if not results:
+        print("❌ No budgeted routes were checked; nothing matched budgets.json")
+        sys.exit(1)
+    if print_results(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Concurrent route auditor built on playwright.async_api
+
+Every route runs in its own browser context inside one shared Chromium, at
+most --concurrency at a time, each bounded by its own timeout. A full audit
+takes about as long as its slowest route instead of the sum of all of them.
+Routes wait on named readiness probes (readiness.py), not networkidle or
+fixed sleeps. The PASS/FAIL summary is the one scripts/audit_dashboard.py
+prints, followed by how long each route spent waiting and on what.
+
+    python -m audit.engine                                  # auth + data audit (production)
+    python -m audit.engine --base-url http://localhost:3000 --suite ciclos
+    python -m audit.engine --suite legacy                   # static site (CEP_LEGACY_URL)
+    python -m audit.engine --suite all --har replay         # offline, from recorded HARs (har.py)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from urllib.parse import urlparse
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from audit import auth_state, har, readiness, stand_in
+from audit.browser_server import ContextPool, open_browser
+
+BASE_URL = os.environ.get("CEP_AUDIT_URL", "http://46.62.222.138")
+LEGACY_URL = os.environ.get("CEP_LEGACY_URL", "http://localhost")
+SCREENSHOTS_DIR = "/tmp/cep_audit"
+DEFAULT_CONCURRENCY = 6
+DEFAULT_TIMEOUT = 30.0   # seconds per route
+DEFAULT_CONTEXT = {"viewport": {"width": 1920, "height": 1080}}
+
+# What "loaded" means for each kind of route (see readiness.PROBES)
+STATIC_READY = ("fonts-loaded", "api-idle")
+DASHBOARD_READY = ("sidebar-hydrated", "kpi-cards", "api-idle")
+SECTION_READY = ("sidebar-hydrated", "api-idle")
+
+
+@dataclass
+class Route:
+    """A page to visit and the check run on it.
+
+    check is an async callable taking the page and returning a list of
+    (name, passed, detail) results, the rows of the summary table. ready
+    names the readiness probes awaited before the check runs; auth routes
+    run with the cached login session (auth_state.py). har, when set, is
+    the har.Har the route's context records to or replays from; stand_in,
+    the URL of a stand_in.py server answering the route's /api/* calls.
+    """
+    name: str
+    path: str
+    check: object
+    screenshot: str = None
+    timeout: float = DEFAULT_TIMEOUT
+    ready: tuple = STATIC_READY
+    auth: bool = False
+    har: object = None
+    stand_in: str = None
+
+
+@dataclass
+class RouteResult:
+    route: Route
+    results: list = field(default_factory=list)
+    url: str = ""
+    elapsed: float = 0.0
+    console_errors: list = field(default_factory=list)
+    waits: list = field(default_factory=list)
+    error: str = None
+
+
+# ---------------------------------------------------------------------------
+# Checks (ported from scripts/audit_dashboard.py and test_dashboard_ciclos.py)
+# ---------------------------------------------------------------------------
+
+async def check_login_theme(page):
+    html_class = await page.locator('html').get_attribute('class') or ''
+    body_class = await page.locator('body').get_attribute('class') or ''
+    is_dark = 'dark' in html_class or 'dark' in body_class
+    theme_toggle = await page.locator(
+        '[data-theme-toggle], [aria-label*="theme"], button:has-text("Dark"), button:has-text("Light")'
+    ).count()
+    return [
+        ('Login Dark Mode', is_dark, 'Expected light mode by default'),
+        ('Theme Toggle', theme_toggle > 0, 'No theme selector found'),
+    ]
+
+
+def check_protected(name, label):
+    async def check(page):
+        current_url = page.url
+        return [(name, '/auth/login' in current_url, f'{label} accessible without auth at {current_url}')]
+    return check
+
+
+async def check_dashboard_data(page):
+    empty_states = await page.locator('text=No hay datos, text=Sin datos, text=No data, text=Empty').count()
+    tables = await page.locator('table').count()
+    cards_with_data = await page.locator('.card, [data-card]').count()
+    has_data = tables > 0 or (cards_with_data > 0 and empty_states == 0)
+    return [('Dashboard Has Data', has_data, f'Tables: {tables}, Cards: {cards_with_data}, Empty: {empty_states}')]
+
+
+async def check_cursos_data(page):
+    # audit_dashboard.py's test 6 only screenshots the page; it adds no result row
+    return []
+
+
+def check_texts(*expected):
+    """Each (row name, text) must appear on the page"""
+    async def check(page):
+        results = []
+        for name, text in expected:
+            count = await page.locator(f'text={text}').count()
+            results.append((name, count > 0, f"'{text}' not found"))
+        return results
+    return check
+
+
+async def check_legacy_page(page):
+    title = (await page.title()).strip()
+    not_found = await page.locator('text=404 Not Found').count()
+    return [(f'{urlparse(page.url).path} Loads', bool(title) and not not_found, f'Title: {title!r}, 404: {not_found > 0}')]
+
+
+async def check_dashboard_home(page):
+    results = await check_texts(('Dashboard Title', 'Dashboard CEP Admin'))(page)
+    sidebar = await page.locator('[data-sidebar="sidebar"]').count()
+    kpi_cards = await page.locator('.rounded-xl').count()
+    results.append(('Sidebar Rendered', sidebar > 0, 'No [data-sidebar="sidebar"] element'))
+    results.append(('KPI Cards', kpi_cards >= 5, f'Only {kpi_cards} cards, expected ≥ 5'))
+    return results
+
+
+AUDIT_ROUTES = [
+    Route('login', '/auth/login', check_login_theme, '01_login_page.png'),
+    Route('dashboard-auth', '/', check_protected('Dashboard Protected', 'Dashboard'), '02_dashboard_no_auth.png'),
+    Route('cursos-auth', '/cursos', check_protected('/cursos Protected', 'Cursos'), '03_cursos_no_auth.png'),
+    Route('sedes-auth', '/sedes', check_protected('/sedes Protected', 'Sedes'), '04_sedes_no_auth.png'),
+    Route('dashboard-data', '/', check_dashboard_data, '05_dashboard_data.png', ready=DASHBOARD_READY, auth=True),
+    Route('cursos-data', '/cursos', check_cursos_data, '06_cursos_data.png', ready=SECTION_READY, auth=True),
+]
+
+CICLOS_ROUTES = [
+    Route('dashboard', '/', check_dashboard_home, 'test-dashboard-home.png', ready=DASHBOARD_READY, auth=True),
+    Route('ciclos', '/ciclos', check_texts(
+        ('Ciclos Title', 'Ciclos Formativos'),
+        ('New Ciclo Button', 'NUEVO CICLO'),
+        ('Ciclos Stats', 'Total Ciclos'),
+    ), 'test-ciclos-list.png', ready=SECTION_READY, auth=True),
+    Route('ciclo-1', '/ciclos/ciclo-1', check_texts(
+        ('Ciclo 1 Back Button', 'Volver'),
+        ('Ciclo 1 Title', 'TÉCNICO SUPERIOR EN PRODUCCIÓN DE AUDIOVISUALES'),
+        ('Ciclo 1 Badge', 'Grado Superior'),
+        ('Ciclo 1 Tab Información', 'Información'),
+        ('Ciclo 1 Tab Cursos', 'Cursos del Ciclo'),
+        ('Ciclo 1 Tab Convocatorias', 'Convocatorias'),
+        ('Ciclo 1 Tab Salidas', 'Salidas Profesionales'),
+    ), 'test-ciclo-audiovisuales.png', ready=SECTION_READY, auth=True),
+    Route('ciclo-2', '/ciclos/ciclo-2', check_texts(('Ciclo 2 Badge', 'Grado Medio')),
+          'test-ciclo-comercio.png', ready=SECTION_READY, auth=True),
+    Route('ciclo-3', '/ciclos/ciclo-3', check_texts(('Ciclo 3 Badge', 'Grado Superior')),
+          'test-ciclo-marketing.png', ready=SECTION_READY, auth=True),
+]
+
+# The static site served by nginx (legacy/); no client-side API calls
+LEGACY_READY = ("fonts-loaded", "load")
+LEGACY_ROUTES = [
+    Route(f'legacy-{name}', path, check_legacy_page, f'legacy-{name}.png', ready=LEGACY_READY)
+    for name, path in (
+        ('home', '/'), ('cursos', '/cursos'), ('ciclos', '/ciclos'), ('sedes', '/sedes'),
+        ('contacto', '/contacto'), ('blog', '/blog'), ('sobre-nosotros', '/sobre-nosotros'),
+    )
+]
+
+SUITES = {
+    'audit': AUDIT_ROUTES,
+    'ciclos': CICLOS_ROUTES,
+    'all': AUDIT_ROUTES + CICLOS_ROUTES,
+    'legacy': LEGACY_ROUTES,
+}
+# Suites served from another host than the dashboard
+SUITE_URLS = {'legacy': LEGACY_URL}
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+async def visit(page, route, base_url, outcome, screenshots_dir):
+    await readiness.install(page)
+    await page.goto(f"{base_url}{route.path}", wait_until='domcontentloaded')
+    outcome.waits = await readiness.wait_ready(page, route.ready)
+    outcome.url = page.url
+    outcome.results.extend(
+        (f'{route.path} ready: {wait.probe}', False, f'not satisfied after {wait.seconds:.1f}s')
+        for wait in outcome.waits if not wait.satisfied
+    )
+    if screenshots_dir and route.screenshot:
+        await page.screenshot(path=os.path.join(screenshots_dir, route.screenshot), full_page=True)
+    outcome.results.extend(await route.check(page))
+
+
+def route_context(route, context_options=None, storage_state=None):
+    """Context options for a route: the session is only added to auth routes"""
+    options = dict(context_options or DEFAULT_CONTEXT)
+    if route.auth and storage_state:
+        options["storage_state"] = storage_state
+    return options
+
+
+async def open_context(browser, route, context_options=None, storage_state=None):
+    """A fresh context for a route, with its timeout and HAR recording or replay applied"""
+    context = await browser.new_context(**route_context(route, context_options, storage_state))
+    try:
+        context.set_default_timeout(route.timeout * 1000)
+        if route.har:
+            await route.har.attach(context)
+        if route.stand_in:
+            await stand_in.route_api(context, route.stand_in)
+    except BaseException:
+        await context.close()
+        raise
+    return context
+
+
+async def audit_route(browser, route, base_url, context_options=None, screenshots_dir=None, storage_state=None):
+    """Run one route in a fresh context; failures and timeouts become a FAIL row.
+    browser may be a ContextPool handing out pre-warmed contexts."""
+    outcome = RouteResult(route)
+    started = time.perf_counter()
+    context = None
+    try:
+        # a context that cannot be set up (missing HAR, ...) fails only this route
+        context = await open_context(browser, route, context_options, storage_state)
+        page = await context.new_page()
+        page.on('console', lambda msg: outcome.console_errors.append(msg.text) if msg.type == 'error' else None)
+        await asyncio.wait_for(visit(page, route, base_url, outcome, screenshots_dir), route.timeout)
+    except asyncio.TimeoutError:
+        outcome.error = f"timed out after {route.timeout:g}s"
+    except (PlaywrightError, OSError) as e:
+        outcome.error = str(e).splitlines()[0]
+    finally:
+        if context:
+            await context.close()
+        outcome.elapsed = time.perf_counter() - started
+
+    if outcome.error:
+        outcome.results.append((f'{route.path} ({route.name})', False, outcome.error))
+    return outcome
+
+
+async def run_audit(browser, routes, base_url, concurrency=DEFAULT_CONCURRENCY,
+                    context_options=None, screenshots_dir=None, storage_state=None):
+    """Audit routes concurrently in one browser; returns RouteResults in route order"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(route):
+        async with semaphore:
+            return await audit_route(browser, route, base_url, context_options, screenshots_dir, storage_state)
+
+    return await asyncio.gather(*(bounded(route) for route in routes))
+
+
+def print_summary(outcomes, wall_time=None):
+    """The audit_dashboard.py summary table plus per-route timings; returns all result rows"""
+    results = [row for outcome in outcomes for row in outcome.results]
+
+    print("\n" + "="*60)
+    print("AUDIT SUMMARY")
+    print("="*60)
+
+    for name, passed, detail in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+        if not passed:
+            print(f"       {detail}")
+
+    print("\nRoute timings:")
+    for outcome in outcomes:
+        errors = f"  ({len(outcome.console_errors)} console errors)" if outcome.console_errors else ""
+        print(f"  {outcome.elapsed * 1000:7.0f} ms  {outcome.route.path}{errors}")
+        if outcome.waits:
+            print(f"              {readiness.describe(outcome.waits)}")
+    if wall_time is not None:
+        summed = sum(outcome.elapsed for outcome in outcomes)
+        print(f"  {wall_time * 1000:7.0f} ms  wall clock ({summed * 1000:.0f} ms summed)")
+    return results
+
+
+def add_arguments(parser):
+    """Options shared by every audit entry point"""
+    parser.add_argument("--base-url", help=f"site to audit (default: {BASE_URL}, legacy suite: {LEGACY_URL})")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="audit", help="routes to audit")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="routes in flight at once")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds per route")
+    parser.add_argument("--screenshots", default=SCREENSHOTS_DIR, help="screenshot directory ('' to skip)")
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    parser.add_argument("--auth", choices=auth_state.METHODS + ("none",),
+                        help="how protected routes log in (default: api on localhost, none elsewhere)")
+    parser.add_argument("--har", choices=har.MODES, help="record each route to a HAR, or replay from them offline")
+    parser.add_argument("--har-dir", default=har.HAR_DIR, help="HAR directory (default: %(default)s)")
+    parser.add_argument("--api-stand-in", metavar="URL", help="answer the dashboard's /api/* calls from a stand_in.py server")
+
+
+def site_url(args):
+    return (args.base_url or SUITE_URLS.get(args.suite, BASE_URL)).rstrip('/')
+
+
+def suite_routes(args):
+    routes = SUITES[args.suite]
+    if args.timeout != DEFAULT_TIMEOUT:
+        routes = [replace(route, timeout=args.timeout) for route in routes]
+    if args.har:
+        routes = har.with_har(routes, args.har_dir, site_url(args), args.har)
+    if args.api_stand_in:
+        routes = [replace(route, stand_in=args.api_stand_in) for route in routes]
+    return routes
+
+
+async def session_for(p, args, routes):
+    """storage_state path for the suite's auth routes, or None"""
+    # Remote sites are audited logged out, as scripts/audit_dashboard.py does, unless --auth
+    # asks otherwise; a replayed route gets the recorded responses whatever its cookies
+    method = args.auth or ("api" if auth_state.is_local(site_url(args)) else "none")
+    if method == "none" or args.har == "replay" or not any(route.auth for route in routes):
+        return None
+    try:
+        return await auth_state.ensure(p, site_url(args), method)
+    except auth_state.AuthError as e:
+        print(f"⚠️  {e}; protected routes run without a session")
+        return None
+
+
+async def main_async(args):
+    if args.screenshots:
+        os.makedirs(args.screenshots, exist_ok=True)
+    routes = suite_routes(args)
+
+    async with async_playwright() as p:
+        storage_state = await session_for(p, args, routes)
+        browser = await open_browser(p, headless=not args.headed)
+        option_sets = []
+        for route in routes:
+            options = route_context(route, None, storage_state)
+            if options not in option_sets:
+                option_sets.append(options)
+        pool = await ContextPool(browser, args.concurrency, *option_sets).start()
+        started = time.perf_counter()
+        outcomes = await run_audit(pool, routes, site_url(args), args.concurrency,
+                                   screenshots_dir=args.screenshots, storage_state=storage_state)
+        wall_time = time.perf_counter() - started
+        await pool.close()
+        await browser.close()
+
+    results = print_summary(outcomes, wall_time)
+    if args.screenshots:
+        print(f"\nScreenshots saved to: {args.screenshots}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit dashboard routes concurrently")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
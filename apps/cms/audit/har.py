@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+HAR record/replay for offline, deterministic audits
+
+Any audit entry point (engine, matrix, vitals, waterfall, budget) takes
+--har record or --har replay. Recording saves one HAR per route while the
+audit runs against the live site. Replay serves every request of the route
+from its HAR through context.route_from_har, with unrecorded requests
+aborted, so no server or network is involved and timings stay stable.
+
+Record with the engine, which opens one context per route; the matrix would
+have several contexts writing the same route's HAR. HARs live in --har-dir
+under the site's host, so recordings of production and localhost do not mix:
+
+    /tmp/cep_audit/har/localhost_3000/ciclo-1.har
+
+    python -m audit.engine --base-url http://localhost:3000 --suite all --har record
+    python -m audit.engine --base-url http://localhost:3000 --suite all --har replay
+    python -m audit.har                       # list recordings
+"""
+
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+
+HAR_DIR = "/tmp/cep_audit/har"
+MODES = ("record", "replay")
+
+
+@dataclass(frozen=True)
+class Har:
+    """Where a route's HAR lives and whether this run records or replays it"""
+    path: str
+    record: bool = False
+
+    async def attach(self, context):
+        if self.record:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Written when the context closes
+            await context.route_from_har(self.path, update=True, update_content="embed", update_mode="full")
+        else:
+            await context.route_from_har(self.path, not_found="abort")
+
+
+def host_dir(har_dir, base_url):
+    return os.path.join(har_dir, urlparse(base_url).netloc.replace(":", "_"))
+
+
+def with_har(routes, har_dir, base_url, mode):
+    """Copies of routes recording to, or replaying from, their HAR under har_dir"""
+    directory = host_dir(har_dir, base_url)
+    routes = [replace(route, har=Har(os.path.join(directory, f"{route.name}.har"), mode == "record"))
+              for route in routes]
+    if mode == "replay":
+        missing = [route.name for route in routes if not os.path.exists(route.har.path)]
+        if missing:
+            raise SystemExit(f"❌ No HAR recorded for {', '.join(missing)} in {directory}; run with --har record first")
+    return routes
+
+
+def recordings(har_dir=HAR_DIR):
+    """(host, route name, entries, bytes, mtime) for every recorded HAR"""
+    found = []
+    if not os.path.isdir(har_dir):
+        return found
+    for host in sorted(os.listdir(har_dir)):
+        directory = os.path.join(har_dir, host)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".har"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entries = len(json.load(f)["log"]["entries"])
+            except (OSError, ValueError, KeyError):
+                entries = None
+            found.append((host, name[:-4], entries, os.path.getsize(path), os.path.getmtime(path)))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the HARs recorded for offline audits")
+    parser.add_argument("--har-dir", default=HAR_DIR)
+    args = parser.parse_args()
+
+    found = recordings(args.har_dir)
+    if not found:
+        print(f"⚠️  No recordings in {args.har_dir}")
+        return
+    print(f"{'host':<24} {'route':<20} {'entries':>7} {'size':>9}  recorded")
+    for host, route, entries, size, mtime in found:
+        count = "invalid" if entries is None else entries
+        print(f"{host:<24} {route:<20} {count:>7} {size / 1024:8.0f}K  "
+              f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Parallel viewport matrix runner
+
+Runs an audit suite once per combination of viewport, device scale factor
+and color scheme, every (combination, route) pair in its own isolated
+context, all sharing one browser process and one concurrency limit.
+Replaces audit_dashboard.py's sequential set_viewport_size + reload loop.
+Results are collated into a single grid: one row per check, one column per
+combination.
+
+    python -m audit.matrix --base-url http://localhost:3000 --suite ciclos
+    python -m audit.matrix --viewport mobile --viewport tablet --scheme dark
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import async_playwright
+
+from audit import engine
+from audit.browser_server import open_browser
+
+# The matrix: every combination of these runs
+VIEWPORTS = {
+    "mobile": {"width": 375, "height": 812},
+    "tablet": {"width": 768, "height": 1024},
+    "desktop": {"width": 1920, "height": 1080},
+}
+DEVICE_SCALE_FACTORS = (1, 2)
+COLOR_SCHEMES = ("light", "dark")
+TOUCH_VIEWPORTS = {"mobile", "tablet"}
+
+
+@dataclass(frozen=True)
+class Combination:
+    viewport: str
+    scale: int
+    scheme: str
+
+    @property
+    def label(self):
+        return f"{self.viewport}-{self.scale}x-{self.scheme}"
+
+    def context_options(self):
+        touch = self.viewport in TOUCH_VIEWPORTS
+        return {
+            "viewport": VIEWPORTS[self.viewport],
+            "device_scale_factor": self.scale,
+            "color_scheme": self.scheme,
+            "is_mobile": touch,
+            "has_touch": touch,
+        }
+
+
+def combinations(viewports=None, scales=None, schemes=None):
+    return [
+        Combination(viewport, scale, scheme)
+        for viewport, scale, scheme in itertools.product(
+            viewports or VIEWPORTS, scales or DEVICE_SCALE_FACTORS, schemes or COLOR_SCHEMES
+        )
+    ]
+
+
+async def run_matrix(browser, combos, routes, base_url, concurrency=engine.DEFAULT_CONCURRENCY,
+                     screenshots_dir=None, storage_state=None):
+    """Audit every (combination, route) pair concurrently; returns {combination: [RouteResult]}"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(combo, route):
+        shots = os.path.join(screenshots_dir, combo.label) if screenshots_dir else None
+        if shots:
+            os.makedirs(shots, exist_ok=True)
+        async with semaphore:
+            return await engine.audit_route(browser, route, base_url, combo.context_options(), shots,
+                                            storage_state)
+
+    jobs = [(combo, route) for combo in combos for route in routes]
+    outcomes = await asyncio.gather(*(bounded(combo, route) for combo, route in jobs))
+
+    collated = {combo: [] for combo in combos}
+    for (combo, _), outcome in zip(jobs, outcomes):
+        collated[combo].append(outcome)
+    return collated
+
+
+def print_matrix(collated, wall_time=None):
+    """One row per check, one ✅/❌ column per combination; returns True when all passed"""
+    combos = list(collated)
+    rows = {}
+    for index, combo in enumerate(combos):
+        for outcome in collated[combo]:
+            for name, passed, detail in outcome.results:
+                rows.setdefault(name, [None] * len(combos))[index] = (passed, detail)
+
+    width = max([len(name) for name in rows] + [10])
+    print("\n" + "="*60)
+    print("VIEWPORT MATRIX SUMMARY")
+    print("="*60)
+    for index, combo in enumerate(combos, 1):
+        elapsed = sum(outcome.elapsed for outcome in collated[combo])
+        print(f"  [{index}] {combo.label}  ({elapsed * 1000:.0f} ms summed route time)")
+    print()
+    print(" " * width + "  " + " ".join(f"{index:>3}" for index in range(1, len(combos) + 1)))
+    for name, cells in rows.items():
+        marks = " ".join(" ✅" if cell and cell[0] else (" ❌" if cell else "  -") for cell in cells)
+        print(f"{name:<{width}}  {marks}")
+
+    failures = [
+        (combo, name, cell[1])
+        for name, cells in rows.items()
+        for combo, cell in zip(combos, cells)
+        if cell and not cell[0]
+    ]
+    if failures:
+        print("\nFailures:")
+        for combo, name, detail in failures:
+            print(f"❌ FAIL - [{combo.label}] {name}")
+            print(f"       {detail}")
+    if wall_time is not None:
+        runs = sum(len(outcomes) for outcomes in collated.values())
+        print(f"\n{runs} route runs across {len(combos)} combinations in {wall_time * 1000:.0f} ms")
+    return not failures
+
+
+async def main_async(args):
+    combos = combinations(args.viewport, args.scale, args.scheme)
+    routes = engine.suite_routes(args)
+
+    async with async_playwright() as p:
+        storage_state = await engine.session_for(p, args, routes)
+        browser = await open_browser(p, headless=not args.headed)
+        started = time.perf_counter()
+        collated = await run_matrix(browser, combos, routes, engine.site_url(args),
+                                    args.concurrency, args.screenshots, storage_state)
+        wall_time = time.perf_counter() - started
+        await browser.close()
+
+    passed = print_matrix(collated, wall_time)
+    if args.screenshots:
+        print(f"Screenshots saved to: {args.screenshots}/<combination>/")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an audit suite across a viewport matrix")
+    engine.add_arguments(parser)
+    parser.add_argument("--viewport", action="append", choices=sorted(VIEWPORTS), help="limit viewports (repeatable)")
+    parser.add_argument("--scale", action="append", type=int, help="limit device scale factors (repeatable)")
+    parser.add_argument("--scheme", action="append", choices=COLOR_SCHEMES, help="limit color schemes (repeatable)")
+    args = parser.parse_args()
+
+    if not asyncio.run(main_async(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Event-driven readiness probes, replacing fixed sleeps and slow_mo
+
+A probe is a named in-page condition polled by page.wait_for_function, so a
+route waits exactly as long as it needs to and the report can say what it
+was waiting for:
+
+    kpi-cards          dashboard KPI cards rendered
+    sidebar-hydrated   the sidebar exists and React has attached to it
+    api-idle           no /api/* fetch or XHR in flight for QUIET_MS
+    fonts-loaded       document.fonts finished loading
+    load               the load event fired
+
+api-idle relies on TRACKER_SCRIPT, which must be installed (install() or
+install_sync()) on the page or context before navigating.
+
+    install_sync(page)
+    page.goto(url)
+    print_waits(wait_ready_sync(page, ("sidebar-hydrated", "api-idle")))
+"""
+
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+QUIET_MS = 200
+PROBE_TIMEOUT = 10.0   # seconds per probe
+
+# Counts in-flight /api/* requests made through fetch() or XMLHttpRequest
+TRACKER_SCRIPT = """
+(() => {
+  if (window.__cepApi) return;
+  const state = window.__cepApi = { pending: 0, last: performance.now() };
+  const isApi = (url) => {
+    try { return new URL(url, location.href).pathname.startsWith('/api/'); } catch (e) { return false; }
+  };
+  const done = () => { state.pending--; state.last = performance.now(); };
+
+  const nativeFetch = window.fetch;
+  window.fetch = function (input, init) {
+    const url = input instanceof Request ? input.url : String(input);
+    if (!isApi(url)) return nativeFetch.apply(this, arguments);
+    state.pending++;
+    return nativeFetch.apply(this, arguments).finally(done);
+  };
+
+  const open = XMLHttpRequest.prototype.open;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__cepApi = isApi(url);
+    return open.apply(this, arguments);
+  };
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    if (this.__cepApi) {
+      state.pending++;
+      this.addEventListener('loadend', done, { once: true });
+    }
+    return send.apply(this, arguments);
+  };
+})();
+"""
+
+PROBES = {
+    "kpi-cards": "() => document.querySelectorAll('.rounded-xl.border.bg-card, [data-card]').length > 0",
+    "sidebar-hydrated": """() => {
+        const sidebar = document.querySelector('[data-sidebar="sidebar"], aside');
+        return !!sidebar && Object.keys(sidebar).some((key) => key.startsWith('__reactFiber'));
+    }""",
+    "api-idle": f"""() => !!window.__cepApi && window.__cepApi.pending === 0
+        && performance.now() - window.__cepApi.last >= {QUIET_MS}""",
+    "fonts-loaded": "() => document.fonts.status === 'loaded'",
+    "load": "() => document.readyState === 'complete'",
+}
+
+
+@dataclass
+class Wait:
+    probe: str
+    seconds: float
+    satisfied: bool
+
+
+def install_sync(target):
+    """Install the /api/* tracker on a sync page or context before navigating"""
+    target.add_init_script(TRACKER_SCRIPT)
+
+
+async def install(target):
+    await target.add_init_script(TRACKER_SCRIPT)
+
+
+def wait_ready_sync(page, probes, timeout=PROBE_TIMEOUT):
+    """Wait for each probe in turn; returns a Wait per probe (time spent on it, satisfied or timed out)"""
+    waits = []
+    for probe in probes:
+        started = time.perf_counter()
+        try:
+            page.wait_for_function(PROBES[probe], timeout=timeout * 1000)
+            satisfied = True
+        except PlaywrightTimeoutError:
+            satisfied = False
+        waits.append(Wait(probe, time.perf_counter() - started, satisfied))
+    return waits
+
+
+async def wait_ready(page, probes, timeout=PROBE_TIMEOUT):
+    waits = []
+    for probe in probes:
+        started = time.perf_counter()
+        try:
+            await page.wait_for_function(PROBES[probe], timeout=timeout * 1000)
+            satisfied = True
+        except PlaywrightTimeoutError:
+            satisfied = False
+        waits.append(Wait(probe, time.perf_counter() - started, satisfied))
+    return waits
+
+
+def describe(waits):
+    """'waited 820 ms: api-idle 620 ms, fonts-loaded 200 ms'"""
+    total = sum(wait.seconds for wait in waits) * 1000
+    parts = ", ".join(
+        f"{wait.probe} {wait.seconds * 1000:.0f} ms" + ("" if wait.satisfied else " (timed out)")
+        for wait in waits
+    )
+    return f"waited {total:.0f} ms: {parts}" if waits else "no readiness probes"
+
+
+def print_waits(waits):
+    print(f"   ⏱  {describe(waits)}")
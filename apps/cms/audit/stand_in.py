@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the dashboard's CMS API
+
+Serves the GET side of the Next.js API routes the dashboard reads, without
+Payload or Postgres:
+
+    /api/cursos             /api/convocatorias?courseId=&campusId=
+    /api/areas-formativas   /api/dashboard
+    /api/campus/stats       /api/campus/{cursos,alumnos,anuncios,sesiones,tareas}
+
+Responses have the shape of the routes in app/api/, built from seeded fixture
+documents with the collections' fields (src/collections). --scale multiplies
+every collection (10 or 100 for load and scale testing), --latency and
+--jitter delay each response, and the route caps (limit: 100 on /api/cursos,
+...) apply unless --uncapped. Plain asyncio streams, HTTP/1.1 keep-alive.
+
+    python -m audit.stand_in --scale 100 --latency 80 --jitter 40
+
+Audits reach it through --api-stand-in: the pages still come from the site,
+the context routes these /api/* paths to the stand-in instead.
+
+    python -m audit.engine --base-url http://localhost:3000 --suite all --api-stand-in http://127.0.0.1:3900
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PORT = 3900
+PATHS = ("/api/cursos", "/api/convocatorias", "/api/areas-formativas", "/api/dashboard", "/api/campus/stats",
+         "/api/campus/cursos", "/api/campus/alumnos", "/api/campus/anuncios", "/api/campus/sesiones",
+         "/api/campus/tareas")
+
+# Documents per collection at --scale 1, about the size of the real data
+BASE_COUNTS = {
+    "areas": 8,
+    "campuses": 5,
+    "courses": 40,
+    "course_runs": 80,
+    "campus_cursos": 15,
+    "alumnos": 248,
+    "anuncios": 10,
+    "sesiones": 4,
+    "tareas": 32,
+}
+# payload.find() limits of the real routes
+LIMITS = {"cursos": 100, "convocatorias": 100, "areas": 100, "dashboard_courses": 1000,
+          "dashboard_runs": 1000, "dashboard_campuses": 100}
+
+AREAS = ("Sanitaria", "Horeca", "Salud", "Tecnología", "Audiovisual", "Administración", "Marketing", "Educación")
+COLORS = ("#ef4444", "#f97316", "#22c55e", "#3b82f6", "#a855f7", "#64748b", "#ec4899", "#14b8a6")
+COURSE_TYPES = ("privado", "ocupados", "desempleados", "teleformacion", "ciclo_medio", "ciclo_superior")
+MODALITIES = ("presencial", "online", "hibrido")
+RUN_STATUSES = ("draft", "published", "enrollment_open", "enrollment_closed", "in_progress", "completed", "cancelled")
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+CITIES = ("Santa Cruz de Tenerife", "La Laguna", "Las Palmas", "Adeje", "La Orotava")
+TOPICS = ("Marketing Digital", "Contabilidad", "Inglés B2", "Atención Sociosanitaria", "Cocina Profesional",
+          "Desarrollo Web", "Producción Audiovisual", "Gestión Administrativa", "Community Manager",
+          "Auxiliar de Farmacia", "Educación Infantil", "Ciberseguridad")
+NAMES = ("María", "Juan", "Laura", "Carlos", "Ana", "David", "Lucía", "Pablo", "Elena", "Sergio")
+SURNAMES = ("García", "Pérez", "Martínez", "Rodríguez", "López", "Sánchez", "Ruiz", "Díaz", "Hernández", "Torres")
+PROFESSORS = ("Prof. Ana López", "Prof. John Smith", "Prof. Carlos Ruiz", "Prof. Marta Gil")
+
+
+def _iso(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class Fixtures:
+    """Payload-shaped documents for every collection the routes read"""
+
+    def __init__(self, scale=1, seed=1):
+        rng = random.Random(seed)
+        counts = {name: max(1, round(count * scale)) for name, count in BASE_COUNTS.items()}
+        now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        self.counts = counts
+
+        self.areas = []
+        for i in range(counts["areas"]):
+            name = AREAS[i % len(AREAS)]
+            round_ = i // len(AREAS)
+            code = name[:3].upper()
+            self.areas.append({
+                "id": i + 1,
+                "nombre": name if not round_ else f"{name} {round_ + 1}",
+                "codigo": code if not round_ else code + chr(ord("A") + (round_ - 1) % 26),
+                "color": COLORS[i % len(COLORS)],
+                "activo": True,
+            })
+
+        self.campuses = [{
+            "id": i + 1,
+            "slug": f"sede-{i + 1}",
+            "name": f"CEP {CITIES[i % len(CITIES)]}" + (f" {i // len(CITIES) + 1}" if i >= len(CITIES) else ""),
+            "city": CITIES[i % len(CITIES)],
+            "address": f"Calle Principal {rng.randint(1, 200)}",
+            "postal_code": f"38{rng.randint(0, 999):03d}",
+            "phone": f"+34 922 {rng.randint(100, 999)} {rng.randint(100, 999)}",
+            "email": f"sede{i + 1}@cepcomunicacion.com",
+        } for i in range(counts["campuses"])]
+
+        self.courses = []
+        for i in range(counts["courses"]):
+            area = self.areas[i % len(self.areas)]
+            course_type = rng.choice(COURSE_TYPES)
+            self.courses.append({
+                "id": i + 1,
+                "codigo": f"{area['codigo']}-{course_type[:4].upper()}-{i + 1:04d}",
+                "name": f"{TOPICS[i % len(TOPICS)]} {i // len(TOPICS) + 1}",
+                "course_type": course_type,
+                "short_description": f"Curso de {TOPICS[i % len(TOPICS)].lower()} con prácticas en empresa.",
+                "area_formativa": area,
+                "duration_hours": rng.choice((40, 60, 80, 120, 300, 2000)),
+                "base_price": rng.choice((0, 180, 350, 690, 1200)),
+                "subsidy_percentage": rng.choice((0, 50, 100)),
+                "modality": rng.choice(MODALITIES),
+                "active": rng.random() < 0.85,
+                "featured": rng.random() < 0.1,
+                "featured_image": None,
+                "createdAt": _iso(now - datetime.timedelta(days=rng.randint(0, 720))),
+            })
+
+        self.course_runs = []
+        for i in range(counts["course_runs"]):
+            course = self.courses[rng.randrange(len(self.courses))]
+            start = now + datetime.timedelta(days=rng.randint(-180, 180))
+            capacity = rng.choice((15, 20, 25, 30))
+            days = sorted(rng.sample(range(7), rng.randint(1, 3)))
+            self.course_runs.append({
+                "id": i + 1,
+                "codigo": f"{course['codigo']}-{start.year}-{i + 1:03d}",
+                "course": course,
+                "campus": self.campuses[rng.randrange(len(self.campuses))],
+                "start_date": _iso(start),
+                "end_date": _iso(start + datetime.timedelta(days=rng.randint(30, 270))),
+                "schedule_days": [WEEKDAYS[day] for day in days],
+                "schedule_time_start": rng.choice(("09:00:00", "16:00:00")),
+                "schedule_time_end": rng.choice(("14:00:00", "21:00:00")),
+                "max_students": capacity,
+                "min_students": 5,
+                "current_enrollments": rng.randint(0, capacity),
+                "status": rng.choice(RUN_STATUSES),
+                "price_override": None if rng.random() < 0.7 else rng.choice((150, 300, 450)),
+                "instructor_name": rng.choice(PROFESSORS + (None,)),
+                "modality": course["modality"],
+                "createdAt": _iso(start - datetime.timedelta(days=rng.randint(10, 90))),
+            })
+
+        # The campus routes are still mocks (phase A); same fields, more rows
+        self.campus_cursos = [{
+            "id": str(i + 1),
+            "titulo": TOPICS[i % len(TOPICS)],
+            "modulos": rng.randint(4, 12),
+            "lecciones": rng.randint(20, 60),
+            "duracion": f"{rng.choice((40, 60, 80))}h",
+            "estado": rng.choice(("publicado", "borrador")),
+            "alumnosMatriculados": rng.randint(0, 60),
+        } for i in range(counts["campus_cursos"])]
+        self.alumnos = []
+        for i in range(counts["alumnos"]):
+            first, last = rng.choice(NAMES), rng.choice(SURNAMES)
+            self.alumnos.append({
+                "id": str(i + 1),
+                "nombre": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}{i + 1}@example.com",
+                "cursos": rng.sample([c["titulo"] for c in self.campus_cursos], min(2, len(self.campus_cursos))),
+                "progreso": rng.randint(0, 100),
+                "ultimoAcceso": _iso(now - datetime.timedelta(hours=rng.randint(1, 720))),
+                "estado": "activo" if rng.random() < 0.85 else "inactivo",
+            })
+        self.anuncios = [{
+            "id": str(i + 1),
+            "titulo": f"Aviso {i + 1}: {rng.choice(('Horarios', 'Sesión de refuerzo', 'Cambio de aula'))}",
+            "contenido": "Consulta los detalles en tu panel de alumno.",
+            "curso": rng.choice([None] + [c["titulo"] for c in self.campus_cursos]),
+            "destacado": rng.random() < 0.3,
+            "fechaPublicacion": _iso(now - datetime.timedelta(days=i)),
+            "autor": rng.choice(PROFESSORS + ("Administracion",)),
+        } for i in range(counts["anuncios"])]
+        self.sesiones = [{
+            "id": str(i + 1),
+            "curso": rng.choice(self.campus_cursos)["titulo"],
+            "titulo": f"Sesión {i + 1}",
+            "fecha": now.date().isoformat(),
+            "hora": f"{rng.randint(9, 19)}:00",
+            "duracion": rng.choice((60, 90, 120)),
+            "instructor": rng.choice(PROFESSORS),
+            "plataforma": rng.choice(("zoom", "google_meet")),
+            "estado": rng.choice(("programada", "en_vivo")),
+            "inscritos": rng.randint(5, 40),
+        } for i in range(counts["sesiones"])]
+        self.tareas = []
+        for i in range(counts["tareas"]):
+            entregas = rng.randint(0, 45)
+            self.tareas.append({
+                "id": str(i + 1),
+                "titulo": f"Tarea {i + 1}",
+                "curso": rng.choice(self.campus_cursos)["titulo"],
+                "fechaLimite": _iso(now + datetime.timedelta(days=rng.randint(-30, 30))),
+                "entregas": entregas,
+                "pendientes": rng.randint(0, 40),
+                "calificadas": rng.randint(0, entregas),
+                "estado": rng.choice(("activa", "cerrada")),
+            })
+
+
+class StandInAPI:
+    """Maps GET paths to the JSON the Next.js routes would return"""
+
+    def __init__(self, fixtures, uncapped=False):
+        self.data = fixtures
+        self.uncapped = uncapped
+        self.handlers = {
+            "/api/cursos": self.cursos,
+            "/api/convocatorias": self.convocatorias,
+            "/api/areas-formativas": self.areas_formativas,
+            "/api/dashboard": self.dashboard,
+            "/api/campus/stats": self.campus_stats,
+            "/api/campus/cursos": lambda query: self._mock(self.data.campus_cursos),
+            "/api/campus/alumnos": lambda query: self._mock(self.data.alumnos),
+            "/api/campus/anuncios": lambda query: self._mock(self.data.anuncios),
+            "/api/campus/sesiones": lambda query: self._mock(self.data.sesiones),
+            "/api/campus/tareas": lambda query: self._mock(self.data.tareas),
+        }
+
+    def _cap(self, docs, limit):
+        return docs if self.uncapped else docs[:LIMITS[limit]]
+
+    @staticmethod
+    def _mock(docs):
+        return 200, {"success": True, "data": docs, "total": len(docs), "_mock": True, "_phase": "A"}
+
+    def respond(self, method, path, query):
+        """(status, JSON body)"""
+        handler = self.handlers.get(path.rstrip("/"))
+        if handler is None:
+            return 404, {"success": False, "error": f"{path} is not served by the stand-in"}
+        if method not in ("GET", "HEAD"):
+            return 405, {"success": False, "error": f"{method} not supported by the stand-in"}
+        return handler(query)
+
+    def cursos(self, query):
+        courses = sorted(self.data.courses, key=lambda course: course["createdAt"], reverse=True)
+        return 200, {
+            "success": True,
+            "data": [{
+                "id": course["id"],
+                "codigo": course["codigo"],
+                "nombre": course["name"],
+                "tipo": course["course_type"],
+                "descripcion": course["short_description"],
+                "area": course["area_formativa"]["nombre"],
+                "duracionReferencia": course["duration_hours"],
+                "precioReferencia": course["base_price"],
+                "porcentajeSubvencion": course["subsidy_percentage"] or 100,
+                "imagenPortada": "/placeholder-course.svg",
+                "totalConvocatorias": 0,
+            } for course in self._cap(courses, "cursos")],
+            "total": len(courses),
+        }
+
+    def convocatorias(self, query):
+        course_id, campus_id = query.get("courseId"), query.get("campusId")
+        if not course_id and not campus_id:
+            return 400, {"success": False, "error": "courseId o campusId requerido"}
+        try:
+            runs = [run for run in self.data.course_runs
+                    if (not course_id or run["course"]["id"] == int(course_id))
+                    and (not campus_id or run["campus"]["id"] == int(campus_id))]
+        except ValueError:
+            runs = []
+        runs.sort(key=lambda run: run["start_date"], reverse=True)
+        return 200, {
+            "success": True,
+            "data": [{
+                "id": run["id"],
+                "cursoId": run["course"]["id"],
+                "cursoNombre": run["course"]["name"],
+                "cursoTipo": run["course"]["course_type"],
+                "campusId": run["campus"]["id"],
+                "campusNombre": run["campus"]["name"],
+                "fechaInicio": run["start_date"],
+                "fechaFin": run["end_date"],
+                "horario": f"{', '.join(run['schedule_days'])} {run['schedule_time_start']}-{run['schedule_time_end']}",
+                "estado": run["status"],
+                "plazasTotales": run["max_students"],
+                "plazasOcupadas": run["current_enrollments"],
+                "precio": run["price_override"] or 0,
+                "profesor": run["instructor_name"],
+                "modalidad": run["modality"],
+            } for run in self._cap(runs, "convocatorias")],
+            "total": len(runs),
+        }
+
+    def areas_formativas(self, query):
+        areas = sorted((area for area in self.data.areas if area["activo"]), key=lambda area: area["nombre"])
+        return 200, {
+            "success": True,
+            "data": [{key: area[key] for key in ("id", "nombre", "codigo", "color")}
+                     for area in self._cap(areas, "areas")],
+        }
+
+    def dashboard(self, query):
+        courses = self._cap(self.data.courses, "dashboard_courses")
+        runs = self._cap(self.data.course_runs, "dashboard_runs")
+        campuses = self._cap(self.data.campuses, "dashboard_campuses")
+        now = _iso(datetime.datetime.now(datetime.timezone.utc))
+        open_runs = [run for run in runs if run["status"] in ("published", "enrollment_open")]
+        enrolled = sum(run["current_enrollments"] for run in runs)
+        capacity = sum(run["max_students"] for run in runs)
+        upcoming = sorted((run for run in runs if run["start_date"] > now), key=lambda run: run["start_date"])[:5]
+
+        alerts = []
+        without_instructor = [run for run in open_runs if not run["instructor_name"]]
+        if without_instructor:
+            alerts.append({"severity": "warning", "message": "Convocatorias sin profesor asignado",
+                           "count": len(without_instructor)})
+        empty = [run for run in runs if run["status"] == "enrollment_open" and not run["current_enrollments"]]
+        if empty:
+            alerts.append({"severity": "info", "message": "Convocatorias abiertas sin alumnos", "count": len(empty)})
+
+        distribution = [{
+            "campus_name": campus["name"],
+            "student_count": sum(run["current_enrollments"] for run in runs if run["campus"]["id"] == campus["id"]),
+        } for campus in campuses]
+        distribution.sort(key=lambda row: row["student_count"], reverse=True)
+
+        return 200, {
+            "success": True,
+            "data": {
+                "metrics": {
+                    "total_courses": len(self.data.courses),
+                    "active_courses": sum(course["active"] for course in courses),
+                    "active_students": enrolled,
+                    "total_students": enrolled,
+                    "leads_this_month": 0,
+                    "total_leads": 0,
+                    "conversion_rate": 0,
+                    "total_revenue": 0,
+                    "active_convocations": len(open_runs),
+                    "total_convocations": len(self.data.course_runs),
+                    "total_teachers": len(PROFESSORS),
+                    "total_staff": len(PROFESSORS) + 3,
+                    "total_campuses": len(self.data.campuses),
+                    "classroom_utilization": round(enrolled / capacity * 100) if capacity else 0,
+                },
+                "upcoming_convocations": [{
+                    "id": run["id"],
+                    "codigo": run["codigo"],
+                    "course_title": run["course"]["name"],
+                    "campus_name": run["campus"]["name"],
+                    "start_date": run["start_date"],
+                    "end_date": run["end_date"],
+                    "status": run["status"],
+                    "enrolled": run["current_enrollments"],
+                    "capacity_max": run["max_students"],
+                } for run in upcoming],
+                "campaigns": [],
+                "recent_activities": [{
+                    "type": "convocation",
+                    "title": "Nueva convocatoria publicada",
+                    "entity_name": run["course"]["name"],
+                    "timestamp": run["createdAt"],
+                } for run in sorted(runs[:3], key=lambda run: run["createdAt"], reverse=True)],
+                "weekly_metrics": {"leads": [12, 18, 15, 22], "enrollments": [5, 8, 6, 10], "courses_added": [1, 0, 2, 1]},
+                "alerts": alerts[:3],
+                "campus_distribution": distribution,
+            },
+        }
+
+    def campus_stats(self, query):
+        data = self.data
+        return 200, {
+            "success": True,
+            "data": {
+                "alumnosActivos": sum(alumno["estado"] == "activo" for alumno in data.alumnos),
+                "alumnosActivosChange": "+12%",
+                "cursosEnCurso": sum(curso["estado"] == "publicado" for curso in data.campus_cursos),
+                "cursosEnCursoChange": "+3",
+                "sesionesHoy": len(data.sesiones),
+                "tareasPendientes": sum(tarea["estado"] == "activa" for tarea in data.tareas),
+                "tareasPendientesChange": "-8",
+                "materialesSubidos": 156 * max(1, len(data.campus_cursos) // BASE_COUNTS["campus_cursos"]),
+                "certificadosEmitidos": 89 * max(1, len(data.alumnos) // BASE_COUNTS["alumnos"]),
+            },
+            "_mock": True,
+            "_phase": "A",
+        }
+
+
+class StandInServer:
+    """HTTP/1.1 over asyncio streams; encoded responses are cached per URL"""
+
+    def __init__(self, api, latency=0.0, jitter=0.0, seed=1):
+        self.api = api
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.rng = random.Random(seed)
+        self.cache = {}
+        self.served = 0
+
+    def delay(self):
+        return self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+
+    def render(self, method, target):
+        key = (method, target)
+        if key not in self.cache:
+            parsed = urlparse(target)
+            query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+            status, payload = self.api.respond(method, parsed.path, query)
+            self.cache[key] = status, json.dumps(payload, ensure_ascii=False).encode()
+        return self.cache[key]
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get("content-length"):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                status, body = self.render(method, target)
+                await asyncio.sleep(self.delay())
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = (f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        "Access-Control-Allow-Origin: *\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode("latin-1") + (b"" if method == "HEAD" else body))
+                await writer.drain()
+                self.served += 1
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass   # client went away or sent something that is not HTTP
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+async def route_api(context, stand_in_url):
+    """Send the page's requests for stand-in paths to stand_in_url; everything else goes to the site"""
+    async def forward(route):
+        parsed = urlparse(route.request.url)
+        target = stand_in_url.rstrip("/") + parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        await route.fulfill(response=await route.fetch(url=target))
+
+    await context.route(lambda url: urlparse(url).path.rstrip("/") in PATHS, forward)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the dashboard's API from generated fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--scale", type=float, default=1, help="collection size multiplier (e.g. 10, 100)")
+    parser.add_argument("--latency", type=float, default=50, help="ms added to every response")
+    parser.add_argument("--jitter", type=float, default=0, help="up to this many ms more, uniformly random")
+    parser.add_argument("--seed", type=int, default=1, help="fixture and jitter seed")
+    parser.add_argument("--uncapped", action="store_true", help="ignore the routes' payload.find() limits")
+    args = parser.parse_args()
+
+    fixtures = Fixtures(args.scale, args.seed)
+    server = StandInServer(StandInAPI(fixtures, args.uncapped), args.latency, args.jitter, args.seed)
+    print(f"✅ CMS API stand-in on http://{args.host}:{args.port} "
+          f"(scale {args.scale:g}, latency {args.latency:g}+{args.jitter:g} ms)")
+    for path in server.api.handlers:
+        query = "?courseId=1" if path == "/api/convocatorias" else ""
+        status, body = server.render("GET", path + query)
+        print(f"   {path + query:<30} {len(body) / 1024:8.1f} KB")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n{server.served} responses served")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Core Web Vitals and navigation-timing collector per route
+
+A PerformanceObserver script is installed before navigation, so buffered
+paint, LCP, layout-shift, long-task and event entries are all seen. After
+the route's readiness probes settle, one sample is read per run:
+
+    ttfb   responseStart of the navigation entry
+    fcp    first-contentful-paint
+    lcp    last largest-contentful-paint candidate
+    cls    largest layout-shift session window (1 s gap, 5 s cap)
+    tbt    sum of long-task time over 50 ms (lab proxy for responsiveness)
+    inp    slowest interaction, only when the run interacted (else empty)
+    dcl    domContentLoadedEventEnd
+    load   loadEventEnd
+
+and, from Playwright's network events, what the budget gate (budget.py)
+limits (Resource Timing reports 0 bytes for cross-origin scripts such as
+the Tailwind CDN):
+
+    js_bytes   transferred bytes of scripts (headers + encoded body)
+    requests   requests made, including the document and failed ones
+    api_ms     slowest /api/* request
+
+Each route runs --runs times in a fresh context (cold cache); samples and
+p50/p75/p95 per metric are written as JSON and CSV.
+
+    python -m audit.vitals --base-url http://localhost:3000 --suite ciclos --runs 5
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from audit import engine, readiness
+from audit.browser_server import open_browser
+
+METRICS = ("ttfb", "fcp", "lcp", "cls", "tbt", "inp", "dcl", "load", "js_bytes", "requests", "api_ms")
+PERCENTILES = (50, 75, 95)
+DEFAULT_RUNS = 5
+
+OBSERVER_SCRIPT = """
+(() => {
+  if (window.__cepVitals) return;
+  const vitals = window.__cepVitals = { fcp: null, lcp: null, cls: 0, tbt: 0, inp: null };
+  const observe = (type, callback, options) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe(Object.assign({ type, buffered: true }, options));
+    } catch (e) { /* entry type not supported */ }
+  };
+
+  observe('paint', (entry) => {
+    if (entry.name === 'first-contentful-paint') vitals.fcp = entry.startTime;
+  });
+  observe('largest-contentful-paint', (entry) => { vitals.lcp = entry.startTime; });
+
+  let session = 0, sessionStart = 0, previous = 0;
+  observe('layout-shift', (entry) => {
+    if (entry.hadRecentInput) return;
+    if (session && entry.startTime - previous < 1000 && entry.startTime - sessionStart < 5000) {
+      session += entry.value;
+    } else {
+      session = entry.value;
+      sessionStart = entry.startTime;
+    }
+    previous = entry.startTime;
+    vitals.cls = Math.max(vitals.cls, session);
+  });
+
+  observe('longtask', (entry) => { vitals.tbt += Math.max(0, entry.duration - 50); });
+  observe('event', (entry) => {
+    if (entry.interactionId) vitals.inp = Math.max(vitals.inp || 0, entry.duration);
+  }, { durationThreshold: 16 });
+})();
+"""
+
+COLLECT_SCRIPT = """() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const vitals = window.__cepVitals || {};
+  return {
+    ttfb: nav ? nav.responseStart : null,
+    fcp: vitals.fcp,
+    lcp: vitals.lcp,
+    cls: vitals.cls,
+    tbt: vitals.tbt,
+    inp: vitals.inp,
+    dcl: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+  };
+}"""
+
+
+class NetworkTally:
+    """Request count, script bytes and slowest /api/* call of one page load"""
+
+    def __init__(self, page):
+        self.requests = 0
+        self.js_bytes = 0
+        self.api_ms = None
+        self.pending = set()
+        page.on("requestfinished", self._finished)
+        page.on("requestfailed", self._failed)
+
+    def _failed(self, request):
+        self.requests += 1
+
+    def _finished(self, request):
+        self.requests += 1
+        task = asyncio.ensure_future(self._measure(request))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _measure(self, request):
+        if request.resource_type == "script":
+            sizes = await request.sizes()
+            self.js_bytes += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        if urlparse(request.url).path.startswith("/api/"):
+            duration = request.timing["responseEnd"]
+            self.api_ms = duration if self.api_ms is None else max(self.api_ms, duration)
+
+    async def totals(self):
+        await asyncio.gather(*self.pending)
+        return {"js_bytes": self.js_bytes, "requests": self.requests, "api_ms": self.api_ms}
+
+
+async def install(target):
+    await target.add_init_script(OBSERVER_SCRIPT)
+
+
+async def collect(page):
+    return await page.evaluate(COLLECT_SCRIPT)
+
+
+def percentile(values, q):
+    """Linear-interpolated q-th percentile of the non-empty values, or None"""
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None
+    rank = (len(values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def summarize(samples, metrics=METRICS):
+    """{metric: {p50, p75, p95, n}} over a route's samples"""
+    summary = {}
+    for metric in metrics:
+        values = [sample.get(metric) for sample in samples]
+        summary[metric] = {f"p{q}": percentile(values, q) for q in PERCENTILES}
+        summary[metric]["n"] = sum(value is not None for value in values)
+    return summary
+
+
+async def measure(browser, route, base_url, context_options=None, storage_state=None):
+    """One cold-cache sample for a route: {metric: value}, or {"error": ...}"""
+    context = None
+    try:
+        context = await engine.open_context(browser, route, context_options, storage_state)
+        page = await context.new_page()
+        await readiness.install(page)
+        await install(page)
+        network = NetworkTally(page)
+        await page.goto(f"{base_url}{route.path}", wait_until='domcontentloaded')
+        await readiness.wait_ready(page, tuple(route.ready) + ("load",))
+        sample = await collect(page)
+        sample.update(await network.totals())
+        return sample
+    except (PlaywrightError, OSError) as e:
+        return {"error": str(e).splitlines()[0]}
+    finally:
+        if context:
+            await context.close()
+
+
+def unique_routes(routes):
+    """One route per (path, auth): the checks differ, the page load does not"""
+    seen, result = set(), []
+    for route in routes:
+        if (route.path, route.auth) not in seen:
+            seen.add((route.path, route.auth))
+            result.append(route)
+    return result
+
+
+async def run_vitals(browser, routes, base_url, runs=DEFAULT_RUNS, concurrency=1,
+                     context_options=None, storage_state=None):
+    """{route name: [sample, ...]} over `runs` runs of every route"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(route):
+        async with semaphore:
+            return await measure(browser, route, base_url, context_options, storage_state)
+
+    jobs = [route for _ in range(runs) for route in routes]
+    samples = await asyncio.gather(*(bounded(route) for route in jobs))
+
+    results = {route.name: [] for route in routes}
+    for route, sample in zip(jobs, samples):
+        results[route.name].append(sample)
+    return results
+
+
+def build_report(base_url, suite, runs, routes, results, metrics=METRICS):
+    """The JSON report: samples and percentiles per route"""
+    return {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_url": base_url,
+        "suite": suite,
+        "runs": runs,
+        "routes": {
+            route.name: {
+                "path": route.path,
+                "samples": results[route.name],
+                "summary": summarize(results[route.name], metrics),
+            }
+            for route in routes
+        },
+    }
+
+
+def write_json(path, report):
+    with open(path, "w", encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(path, routes, results, metrics=METRICS):
+    with open(path, "w", newline="", encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["route", "path", "metric"] + [f"p{q}" for q in PERCENTILES] + ["n"])
+        for route in routes:
+            summary = summarize(results[route.name], metrics)
+            for metric in metrics:
+                row = summary[metric]
+                writer.writerow([route.name, route.path, metric]
+                                + [_round(row[f"p{q}"]) for q in PERCENTILES] + [row["n"]])
+
+
+def _round(value):
+    return "" if value is None else round(value, 4 if value < 1 else 1)
+
+
+def print_table(routes, results, metrics=METRICS):
+    """p75 per metric per route (ms; CLS unitless)"""
+    print("\n" + "="*60)
+    print("WEB VITALS (p75)")
+    print("="*60)
+    width = max(len(route.name) for route in routes)
+    print(" " * width + "  " + " ".join(f"{metric:>8}" for metric in metrics))
+    for route in routes:
+        samples = results[route.name]
+        summary = summarize(samples, metrics)
+        cells = []
+        for metric in metrics:
+            value = summary[metric]["p75"]
+            cells.append(f"{'-':>8}" if value is None else f"{value:8.3f}" if metric == "cls" else f"{value:8.0f}")
+        errors = sum("error" in sample for sample in samples)
+        print(f"{route.name:<{width}}  " + " ".join(cells) + (f"  ❌ {errors} failed runs" if errors else ""))
+
+
+def add_arguments(parser):
+    engine.add_arguments(parser)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="samples per route")
+    parser.add_argument("--json", default=os.path.join(engine.SCREENSHOTS_DIR, "vitals.json"), help="JSON report path")
+    parser.add_argument("--csv", default=os.path.join(engine.SCREENSHOTS_DIR, "vitals.csv"), help="CSV summary path")
+    # Parallel runs compete for CPU and skew the timings; measure one at a time by default
+    parser.set_defaults(concurrency=1)
+
+
+async def collect_suite(args):
+    """Measure the suite; returns (routes, results)"""
+    routes = unique_routes(engine.suite_routes(args))
+    async with async_playwright() as p:
+        storage_state = await engine.session_for(p, args, routes)
+        browser = await open_browser(p, headless=not args.headed)
+        results = await run_vitals(browser, routes, engine.site_url(args), args.runs,
+                                   args.concurrency, storage_state=storage_state)
+        await browser.close()
+    return routes, results
+
+
+def write_reports(args, routes, results, metrics=METRICS):
+    for path in (args.json, args.csv):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_json(args.json, build_report(engine.site_url(args), args.suite, args.runs, routes, results, metrics))
+    write_csv(args.csv, routes, results, metrics)
+    print(f"\nReports: {args.json}, {args.csv}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect Web Vitals and navigation timings per route")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    routes, results = asyncio.run(collect_suite(args))
+    print_table(routes, results)
+    write_reports(args, routes, results)
+    if any("error" in sample for samples in results.values() for sample in samples):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Network waterfall recorder and N+1 API call detector
+
+WaterfallRecorder hooks a page's request, response, requestfinished and
+requestfailed events and keeps one Entry per request: start and end time
+(the browser's own Resource Timing, in epoch ms), time to first byte, HTTP
+status, transferred size and initiator. On Chromium the initiator comes from
+the DevTools protocol (the script frame or parser line that issued the
+request); elsewhere only navigations and redirects are attributed.
+
+Each route is loaded once in a fresh context and its waterfall printed.
+/api/* calls are then grouped by endpoint (method + path, numeric and
+uuid segments folded into :id). An endpoint called more than
+--allow-repeats times per page load is a FAIL row:
+
+    identical    the same URL fetched again
+    sequential   a call that only started after the previous one finished
+                 (a chain that should run in parallel or be batched)
+
+    python -m audit.waterfall --base-url http://localhost:3000 --suite ciclos
+    python -m audit.waterfall --suite all --api-only
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlparse
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from audit import engine, readiness
+from audit.browser_server import open_browser
+from audit.vitals import unique_routes
+
+API_PREFIX = "/api/"
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{24}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+BAR_WIDTH = 40
+URL_WIDTH = 48
+
+
+@dataclass
+class Entry:
+    url: str
+    method: str
+    resource_type: str
+    started: float              # epoch ms
+    finished: float = None      # epoch ms; None while still in flight
+    ttfb: float = None          # ms from start to the first response byte
+    status: int = None
+    size: int = None            # transferred bytes, headers + body
+    initiator: str = ""
+    failure: str = None
+
+    @property
+    def path(self):
+        return urlparse(self.url).path
+
+    @property
+    def is_api(self):
+        return self.path.startswith(API_PREFIX)
+
+    @property
+    def duration(self):
+        return None if self.finished is None else self.finished - self.started
+
+    @property
+    def endpoint(self):
+        segments = [":id" if ID_SEGMENT.match(segment) else segment for segment in self.path.split("/")]
+        return f"{self.method} {'/'.join(segments)}"
+
+
+def short_url(url, origin=None):
+    """Same-origin URLs as path + query, others as they are"""
+    parsed = urlparse(url)
+    if origin and f"{parsed.scheme}://{parsed.netloc}" == origin:
+        return parsed.path + (f"?{parsed.query}" if parsed.query else "")
+    return url
+
+
+def describe_initiator(initiator):
+    """A DevTools Network.Initiator as 'script /_next/static/chunks/x.js:12 loadCursos', 'parser /:3', ..."""
+    kind = initiator.get("type", "other")
+    stack = initiator.get("stack")
+    while stack:
+        for frame in stack.get("callFrames", []):
+            if frame.get("url"):
+                name = frame.get("functionName") or "(anonymous)"
+                return f"{kind} {urlparse(frame['url']).path}:{frame['lineNumber'] + 1} {name}"
+        stack = stack.get("parent")
+    if initiator.get("url"):
+        line = initiator.get("lineNumber")
+        return f"{kind} {urlparse(initiator['url']).path}" + ("" if line is None else f":{int(line) + 1}")
+    return kind
+
+
+class WaterfallRecorder:
+    """Every request of one page, in the order the page made them"""
+
+    def __init__(self, page):
+        self.entries = {}                       # Request -> Entry
+        self.initiators = defaultdict(deque)    # url -> DevTools initiators, in request order
+        self.pending = set()
+        page.on("request", self._request)
+        page.on("response", self._response)
+        page.on("requestfinished", self._finished)
+        page.on("requestfailed", self._failed)
+
+    async def trace_initiators(self, page):
+        """Record initiators through a DevTools session; False when the browser has none (not Chromium)"""
+        try:
+            session = await page.context.new_cdp_session(page)
+            await session.send("Network.enable")
+        except PlaywrightError:
+            return False
+        session.on("Network.requestWillBeSent",
+                   lambda event: self.initiators[event["request"]["url"]].append(describe_initiator(event["initiator"])))
+        return True
+
+    def _request(self, request):
+        if request.redirected_from:
+            initiator = f"redirect {request.redirected_from.url}"
+        else:
+            initiator = "navigation" if request.is_navigation_request() else ""
+        self.entries[request] = Entry(request.url, request.method, request.resource_type,
+                                      time.time() * 1000, initiator=initiator)
+
+    def _response(self, response):
+        entry = self.entries.get(response.request)
+        if entry:
+            entry.status = response.status
+
+    def _finished(self, request):
+        self._track(self._complete(request, time.time() * 1000))
+
+    def _failed(self, request):
+        entry = self.entries.get(request)
+        if entry:
+            entry.failure = request.failure
+            entry.finished = time.time() * 1000
+
+    def _track(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _complete(self, request, observed):
+        entry = self.entries.get(request)
+        if entry is None:
+            return
+        entry.finished = observed
+        timing = request.timing
+        if timing["startTime"] > 0:
+            entry.started = timing["startTime"]
+            if timing["responseStart"] >= 0:
+                entry.ttfb = timing["responseStart"]
+            if timing["responseEnd"] >= 0:
+                entry.finished = timing["startTime"] + timing["responseEnd"]
+        try:
+            sizes = await request.sizes()
+            entry.size = sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        except PlaywrightError:
+            pass   # page closed before the sizes came back
+
+    async def settle(self):
+        """Wait for outstanding size lookups; returns the entries sorted by start time"""
+        await asyncio.gather(*self.pending)
+        entries = list(self.entries.values())
+        for entry in entries:
+            queue = self.initiators.get(entry.url)
+            initiator = queue.popleft() if queue else None
+            if initiator and not entry.initiator.startswith("redirect"):
+                entry.initiator = initiator
+        return sorted(entries, key=lambda entry: entry.started)
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Finding:
+    """An API endpoint called more than once in one page load"""
+    endpoint: str
+    calls: list = field(default_factory=list)
+
+    @property
+    def identical(self):
+        """Calls repeating a URL already fetched"""
+        return len(self.calls) - len({call.url for call in self.calls})
+
+    @property
+    def sequential(self):
+        """Calls that started only after every earlier call had finished"""
+        count, done = 0, None
+        for call in self.calls:
+            if done is not None and call.started >= done:
+                count += 1
+            if call.finished is not None:
+                done = call.finished if done is None else max(done, call.finished)
+        return count
+
+    @property
+    def span(self):
+        """ms from the first call's start to the last call's end"""
+        ends = [call.finished for call in self.calls if call.finished is not None]
+        return max(ends) - self.calls[0].started if ends else None
+
+    def describe(self):
+        parts = [f"{len(self.calls)} calls"]
+        if self.identical:
+            parts.append(f"{self.identical} identical")
+        if self.sequential:
+            parts.append(f"{self.sequential} waited for the previous one")
+        longest = max((call.duration for call in self.calls if call.duration is not None), default=None)
+        if self.span is not None and longest is not None:
+            parts.append(f"{self.span:.0f} ms span vs {longest:.0f} ms longest")
+        advice = "run in parallel or batch" if self.sequential else "batch into one request"
+        return f"{', '.join(parts)}: {advice}"
+
+
+def find_repeats(entries, allowed=1):
+    """Findings for /api/* endpoints called more than `allowed` times"""
+    groups = defaultdict(list)
+    for entry in entries:
+        if entry.is_api and entry.resource_type != "preflight":
+            groups[entry.endpoint].append(entry)
+    return [Finding(endpoint, calls) for endpoint, calls in groups.items() if len(calls) > allowed]
+
+
+@dataclass
+class RouteWaterfall:
+    route: engine.Route
+    entries: list = field(default_factory=list)
+    error: str = None
+
+    def findings(self, allowed=1):
+        return find_repeats(self.entries, allowed)
+
+    def results(self, allowed=1):
+        """Result rows (name, passed, detail) for the summary"""
+        route = self.route
+        if self.error:
+            return [(f"{route.path} ({route.name})", False, self.error)]
+        findings = self.findings(allowed)
+        if not findings:
+            calls = sum(entry.is_api for entry in self.entries)
+            return [(f"{route.path} API calls ({route.name})", True, f"{calls} calls, no repeated endpoint")]
+        return [(f"{route.path} {finding.endpoint} ×{len(finding.calls)} ({route.name})", False, finding.describe())
+                for finding in findings]
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+async def record(browser, route, base_url, context_options=None, storage_state=None):
+    """One cold-cache load of a route, as a RouteWaterfall"""
+    outcome = RouteWaterfall(route)
+    context = recorder = None
+    try:
+        context = await engine.open_context(browser, route, context_options, storage_state)
+        page = await context.new_page()
+        await readiness.install(page)
+        recorder = WaterfallRecorder(page)
+        await recorder.trace_initiators(page)
+        await page.goto(f"{base_url}{route.path}", wait_until='domcontentloaded')
+        await readiness.wait_ready(page, tuple(route.ready) + ("load",))
+    except (PlaywrightError, OSError) as e:
+        outcome.error = str(e).splitlines()[0]
+    finally:
+        if recorder:
+            outcome.entries = await recorder.settle()
+        if context:
+            await context.close()
+    return outcome
+
+
+async def run_waterfalls(browser, routes, base_url, concurrency=1, context_options=None, storage_state=None):
+    """RouteWaterfalls in route order"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(route):
+        async with semaphore:
+            return await record(browser, route, base_url, context_options, storage_state)
+
+    return await asyncio.gather(*(bounded(route) for route in routes))
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def format_size(size):
+    if size is None:
+        return "-"
+    return f"{size / 1024:.1f}K" if size < 1024 * 1024 else f"{size / 1024 / 1024:.1f}M"
+
+
+def print_waterfall(outcome, allowed=1, api_only=False):
+    """One line per request: offset, duration, status, size, bar; repeated API calls marked ↻"""
+    entries = outcome.entries
+    route = outcome.route
+    print("\n" + "="*60)
+    print(f"WATERFALL {route.path} ({route.name})")
+    print("="*60)
+    if not entries:
+        print("  no requests recorded")
+        return
+
+    origin = "{0.scheme}://{0.netloc}".format(urlparse(entries[0].url))
+    start = entries[0].started
+    end = max(entry.finished or entry.started for entry in entries)
+    total = max(end - start, 1)
+    repeated = {id(call) for finding in outcome.findings(allowed) for call in finding.calls}
+    transferred = sum(entry.size or 0 for entry in entries)
+    print(f"{len(entries)} requests, {format_size(transferred)} transferred, {total:.0f} ms")
+    print(f"{'start':>6} {'ms':>6} {'code':>4} {'size':>7} {'type':<10} {'url':<{URL_WIDTH}}")
+
+    for entry in entries:
+        if api_only and not (entry.is_api or entry.resource_type == "document"):
+            continue
+        offset = entry.started - start
+        first = int(offset / total * BAR_WIDTH)
+        if entry.duration is None:
+            bar = " " * first + "…"
+        else:
+            length = max(1, round(entry.duration / total * BAR_WIDTH))
+            wait = min(length, round((entry.ttfb or 0) / total * BAR_WIDTH))
+            bar = " " * first + "░" * wait + "█" * (length - wait)
+        duration = "-" if entry.duration is None else f"{entry.duration:.0f}"
+        status = "ERR" if entry.failure else (entry.status or "-")
+        mark = "↻" if id(entry) in repeated else " "
+        label = short_url(entry.url, origin)
+        if len(label) > URL_WIDTH:
+            label = label[:URL_WIDTH - 1] + "…"
+        print(f"{offset:6.0f} {duration:>6} {status:>4} {format_size(entry.size):>7} "
+              f"{entry.resource_type:<10}{mark}{label:<{URL_WIDTH}} |{bar:<{BAR_WIDTH}}|")
+        if entry.is_api and entry.initiator:
+            print(f"{'':>37}  ↳ {entry.initiator}")
+
+
+def print_results(results):
+    print("\n" + "="*60)
+    print("API CALL PATTERNS")
+    print("="*60)
+
+    for name, passed, detail in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+        if not passed:
+            print(f"       {detail}")
+
+
+def write_json(path, base_url, suite, outcomes, allowed=1):
+    report = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_url": base_url,
+        "suite": suite,
+        "routes": {
+            outcome.route.name: {
+                "path": outcome.route.path,
+                "error": outcome.error,
+                "entries": [dict(asdict(entry), endpoint=entry.endpoint) for entry in outcome.entries],
+                "findings": [
+                    {"endpoint": finding.endpoint, "urls": [call.url for call in finding.calls],
+                     "identical": finding.identical, "sequential": finding.sequential, "span_ms": finding.span}
+                    for finding in outcome.findings(allowed)
+                ],
+            }
+            for outcome in outcomes
+        },
+    }
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+async def main_async(args):
+    routes = unique_routes(engine.suite_routes(args))
+    async with async_playwright() as p:
+        storage_state = await engine.session_for(p, args, routes)
+        browser = await open_browser(p, headless=not args.headed)
+        outcomes = await run_waterfalls(browser, routes, engine.site_url(args), args.concurrency,
+                                        storage_state=storage_state)
+        await browser.close()
+    return outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record per-route network waterfalls and flag repeated API calls")
+    engine.add_arguments(parser)
+    parser.add_argument("--json", default=os.path.join(engine.SCREENSHOTS_DIR, "waterfall.json"), help="JSON report path")
+    parser.add_argument("--api-only", action="store_true", help="only show the document and /api/* calls")
+    parser.add_argument("--allow-repeats", type=int, default=1, help="calls per endpoint before it is flagged")
+    # Parallel loads compete for bandwidth and blur the ordering; one route at a time by default
+    parser.set_defaults(concurrency=1)
+    args = parser.parse_args()
+
+    outcomes = asyncio.run(main_async(args))
+    for outcome in outcomes:
+        print_waterfall(outcome, args.allow_repeats, args.api_only)
+    results = [row for outcome in outcomes for row in outcome.results(args.allow_repeats)]
+    print_results(results)
+    write_json(args.json, engine.site_url(args), args.suite, outcomes, args.allow_repeats)
+    print(f"\nReport: {args.json}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """Auditoría completa del Dashboard CEP Admin con screenshots."""
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
-import time
+
+from audit.browser_server import open_browser_sync
+from audit.readiness import install_sync, print_waits, wait_ready_sync
+
+# Condiciones de carga en lugar de esperas fijas (ver audit/readiness.py)
+DASHBOARD_READY = ("sidebar-hydrated", "kpi-cards", "api-idle")
+PAGE_READY = ("sidebar-hydrated", "api-idle")
 
 def audit_dashboard():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
+        browser = open_browser_sync(p, headless=False)
         context = browser.new_context(viewport={'width': 1920, 'height': 1080})
+        install_sync(context)
         page = context.new_page()
 
         print("🔍 AUDITORÍA DASHBOARD CEP ADMIN")
@@ -15,8 +23,8 @@ def audit_dashboard():
 
         # TEST 1: Dashboard Principal
         print("\n📍 1. Dashboard Principal (http://localhost:3000)")
-        page.goto('http://localhost:3000', wait_until='networkidle')
-        page.wait_for_timeout(2000)
+        page.goto('http://localhost:3000', wait_until='domcontentloaded')
+        print_waits(wait_ready_sync(page, DASHBOARD_READY))
         page.screenshot(path='/tmp/audit-01-dashboard.png', full_page=True)
         print("   ✅ Screenshot: /tmp/audit-01-dashboard.png")
 
@@ -36,24 +44,28 @@ def audit_dashboard():
             if ciclos_button.is_visible():
                 print("   🔘 Expandiendo menú Ciclos...")
                 ciclos_button.click()
-                page.wait_for_timeout(500)
 
                 # Buscar subitem "Todos los Ciclos" o similar
                 all_ciclos = page.locator('a[href*="ciclos"]').first
+                try:
+                    all_ciclos.wait_for(state='visible', timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass
                 if all_ciclos.is_visible():
                     all_ciclos.click()
-                    page.wait_for_timeout(2000)
+                    page.wait_for_url('**/ciclos**')
+                    print_waits(wait_ready_sync(page, PAGE_READY))
                     page.screenshot(path='/tmp/audit-02-ciclos-list.png', full_page=True)
                     print("   ✅ Screenshot: /tmp/audit-02-ciclos-list.png")
                 else:
                     # Navegar directamente
-                    page.goto('http://localhost:3000/ciclos', wait_until='networkidle')
-                    page.wait_for_timeout(2000)
+                    page.goto('http://localhost:3000/ciclos', wait_until='domcontentloaded')
+                    print_waits(wait_ready_sync(page, PAGE_READY))
                     page.screenshot(path='/tmp/audit-02-ciclos-list.png', full_page=True)
                     print("   ✅ Screenshot: /tmp/audit-02-ciclos-list.png")
             else:
-                page.goto('http://localhost:3000/ciclos', wait_until='networkidle')
-                page.wait_for_timeout(2000)
+                page.goto('http://localhost:3000/ciclos', wait_until='domcontentloaded')
+                print_waits(wait_ready_sync(page, PAGE_READY))
                 page.screenshot(path='/tmp/audit-02-ciclos-list.png', full_page=True)
                 print("   ✅ Screenshot: /tmp/audit-02-ciclos-list.png")
 
@@ -63,13 +75,13 @@ def audit_dashboard():
 
         except Exception as e:
             print(f"   ⚠️  Error navegando a ciclos: {e}")
-            page.goto('http://localhost:3000/ciclos', wait_until='networkidle')
+            page.goto('http://localhost:3000/ciclos', wait_until='domcontentloaded')
             page.screenshot(path='/tmp/audit-02-ciclos-list.png', full_page=True)
 
         # TEST 3: Detalle de Ciclo
         print("\n📍 3. Navegando a Detalle de Ciclo")
-        page.goto('http://localhost:3000/ciclos/ciclo-1', wait_until='networkidle')
-        page.wait_for_timeout(2000)
+        page.goto('http://localhost:3000/ciclos/ciclo-1', wait_until='domcontentloaded')
+        print_waits(wait_ready_sync(page, PAGE_READY))
         page.screenshot(path='/tmp/audit-03-ciclo-detail.png', full_page=True)
         print("   ✅ Screenshot: /tmp/audit-03-ciclo-detail.png")
 
@@ -80,24 +92,24 @@ def audit_dashboard():
         # TEST 4: Responsive Mobile
         print("\n📍 4. Testing Responsive (Mobile 375x812)")
         page.set_viewport_size({'width': 375, 'height': 812})
-        page.goto('http://localhost:3000', wait_until='networkidle')
-        page.wait_for_timeout(2000)
+        page.goto('http://localhost:3000', wait_until='domcontentloaded')
+        print_waits(wait_ready_sync(page, DASHBOARD_READY))
         page.screenshot(path='/tmp/audit-04-mobile-dashboard.png', full_page=True)
         print("   ✅ Screenshot: /tmp/audit-04-mobile-dashboard.png")
 
         # TEST 5: Tablet
         print("\n📍 5. Testing Responsive (Tablet 768x1024)")
         page.set_viewport_size({'width': 768, 'height': 1024})
-        page.goto('http://localhost:3000', wait_until='networkidle')
-        page.wait_for_timeout(2000)
+        page.goto('http://localhost:3000', wait_until='domcontentloaded')
+        print_waits(wait_ready_sync(page, DASHBOARD_READY))
         page.screenshot(path='/tmp/audit-05-tablet-dashboard.png', full_page=True)
         print("   ✅ Screenshot: /tmp/audit-05-tablet-dashboard.png")
 
         # TEST 6: Desktop Large
         print("\n📍 6. Testing Responsive (Desktop 1920x1080)")
         page.set_viewport_size({'width': 1920, 'height': 1080})
-        page.goto('http://localhost:3000/ciclos', wait_until='networkidle')
-        page.wait_for_timeout(2000)
+        page.goto('http://localhost:3000/ciclos', wait_until='domcontentloaded')
+        print_waits(wait_ready_sync(page, PAGE_READY))
         page.screenshot(path='/tmp/audit-06-desktop-ciclos.png', full_page=True)
         print("   ✅ Screenshot: /tmp/audit-06-desktop-ciclos.png")
 
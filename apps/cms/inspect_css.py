@@ -4,8 +4,10 @@
 from playwright.sync_api import sync_playwright
 import json
 
+from audit.browser_server import open_browser_sync
+
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
+    browser = open_browser_sync(p, headless=True)
     page = browser.new_page()
 
     print("📍 Navegando a http://localhost:3000...")
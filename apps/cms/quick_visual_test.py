@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
-import time
+
+from audit.browser_server import open_browser_sync
+from audit.readiness import install_sync, print_waits, wait_ready_sync
 
 def quick_test():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
+        browser = open_browser_sync(p, headless=False)
         context = browser.new_context(viewport={'width': 1920, 'height': 1080})
+        install_sync(context)
         page = context.new_page()
 
         print("🔍 PRUEBA VISUAL RÁPIDA")
@@ -15,7 +19,7 @@ def quick_test():
             # TEST 1: Dashboard
             print("\n📍 1. Cargando Dashboard...")
             page.goto('http://localhost:3000', timeout=60000, wait_until='domcontentloaded')
-            time.sleep(3)
+            print_waits(wait_ready_sync(page, ("sidebar-hydrated", "kpi-cards", "api-idle")))
 
             # Tomar screenshot
             page.screenshot(path='/tmp/quick-test-dashboard.png', full_page=True)
@@ -32,22 +36,37 @@ def quick_test():
 
             # TEST 2: Hacer clic en botón de tema
             print("\n📍 2. Probando Theme Toggle...")
-            time.sleep(2)
-            page.screenshot(path='/tmp/quick-test-theme-change.png', full_page=True)
-            print("   ✅ Screenshot: /tmp/quick-test-theme-change.png")
+            toggle = page.locator('button:has-text("Cambiar tema")').first
+            if toggle.count() > 0:
+                was_dark = page.evaluate("document.documentElement.classList.contains('dark')")
+                toggle.click()
+                # ThemeToggle flips the "dark" class on <html>
+                page.wait_for_function(
+                    "wasDark => document.documentElement.classList.contains('dark') !== wasDark",
+                    arg=was_dark,
+                )
+                print(f"   ✅ Tema cambiado a {'claro' if was_dark else 'oscuro'}")
+                page.screenshot(path='/tmp/quick-test-theme-change.png', full_page=True)
+                print("   ✅ Screenshot: /tmp/quick-test-theme-change.png")
+            else:
+                print("   ⚠️  No se encontró el botón de tema")
 
             # TEST 3: Navegar a Ciclos
             print("\n📍 3. Navegando a Ciclos...")
             ciclos_button = page.locator('button:has-text("Ciclos")').first
             if ciclos_button.count() > 0:
                 ciclos_button.click()
-                time.sleep(2)
 
                 # Buscar submenu
                 medio_link = page.locator('a:has-text("Ciclo Medio")').first
+                try:
+                    medio_link.wait_for(state='visible', timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass
                 if medio_link.count() > 0:
                     medio_link.click()
-                    time.sleep(3)
+                    page.wait_for_url('**/ciclos-medio')
+                    print_waits(wait_ready_sync(page, ("sidebar-hydrated", "api-idle")))
                     page.screenshot(path='/tmp/quick-test-ciclos.png', full_page=True)
                     print("   ✅ Screenshot: /tmp/quick-test-ciclos.png")
                 else:
@@ -63,9 +82,6 @@ def quick_test():
             print("   2. /tmp/quick-test-theme-change.png")
             print("   3. /tmp/quick-test-ciclos.png")
 
-            # Mantener navegador abierto 5 segundos
-            time.sleep(5)
-
         except Exception as e:
             print(f"\n❌ ERROR: {e}")
             page.screenshot(path='/tmp/quick-test-error.png')
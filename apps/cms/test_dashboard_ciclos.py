@@ -4,9 +4,11 @@
 from playwright.sync_api import sync_playwright, expect
 import sys
 
+from audit.browser_server import open_browser_sync
+
 def test_dashboard_ciclos():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)  # visible para testing
+        browser = open_browser_sync(p, headless=False)  # visible para testing
         page = browser.new_page()
 
         print("🧪 TESTING DASHBOARD CEP ADMIN")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Image attributes: intrinsic size, lazy-loading and async decoding
+1. Read intrinsic width/height from the local asset files (PNG, JPEG, GIF,
+   WebP, SVG headers - no image library needed), cached in
+   .build-cache/image-dimensions.json by path, size and mtime
+2. Add width/height to every <img> that lacks them (no layout shift)
+3. Add loading="lazy" + decoding="async" to images below the fold; the header
+   (logo from replace_header_logo()) and the hero stay eager
+
+The footer logo from add_footer_logo_with_circle() is the typical lazy case.
+"""
+
+import re
+import struct
+from pathlib import Path
+from urllib.parse import urlparse
+
+from site_pipeline import find_pages, load_cache, save_cache, write_if_changed
+
+IMG_PATTERN = re.compile(r'<img\b([^>]*?)\s*(/?)>')
+SECTION_PATTERN = re.compile(r'<section\b.*?</section>', re.DOTALL)
+
+
+def png_size(data):
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    return None
+
+
+def gif_size(data):
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    return None
+
+
+def webp_size(data):
+    if data[:4] != b'RIFF' or data[8:12] != b'WEBP':
+        return None
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', data[26:30])
+        return width & 0x3fff, height & 0x3fff
+    if chunk == b'VP8L':
+        bits = int.from_bytes(data[21:25], 'little')
+        return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+    if chunk == b'VP8X':
+        return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    return None
+
+
+def jpeg_size(data):
+    if data[:2] != b'\xff\xd8':
+        return None
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xff:
+            offset += 1
+            continue
+        marker = data[offset + 1]
+        if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+            offset += 2
+            continue
+        length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+            height, width = struct.unpack('>HH', data[offset + 5:offset + 9])
+            return width, height
+        offset += 2 + length
+    return None
+
+
+def svg_size(data):
+    text = data[:4096].decode('utf-8', errors='ignore')
+    tag = re.search(r'<svg\b[^>]*>', text)
+    if not tag:
+        return None
+    width = re.search(r'\bwidth="([\d.]+)(?:px)?"', tag.group(0))
+    height = re.search(r'\bheight="([\d.]+)(?:px)?"', tag.group(0))
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+    view_box = re.search(r'\bviewBox="[\d.\-]+[\s,]+[\d.\-]+[\s,]+([\d.]+)[\s,]+([\d.]+)"', tag.group(0))
+    if view_box:
+        return round(float(view_box.group(1))), round(float(view_box.group(2)))
+    return None
+
+
+def read_image_size(path):
+    """Intrinsic (width, height) of a local image file, or None if unknown"""
+    with open(path, 'rb') as f:
+        data = f.read(64 * 1024)
+    for reader in (png_size, gif_size, webp_size, jpeg_size, svg_size):
+        size = reader(data)
+        if size:
+            return size
+    return None
+
+
+def image_size(path, index):
+    """Cached intrinsic size lookup; index maps path → {size, mtime, width, height}"""
+    stat = path.stat()
+    key = path.as_posix()
+    cached = index.get(key)
+    if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime_ns:
+        return cached["width"], cached["height"]
+
+    size = read_image_size(path)
+    if size:
+        index[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "width": size[0], "height": size[1]}
+    return size
+
+
+def local_asset(src, page):
+    """Resolve an img src to a local file path, or None for remote/data URLs"""
+    parsed = urlparse(src)
+    if parsed.scheme or src.startswith(("//", "data:")):
+        return None
+    if parsed.path.startswith("/"):
+        path = Path(parsed.path.lstrip("/"))
+    else:
+        path = page.parent / parsed.path
+    path = Path(*[p for p in path.parts if p != "."])
+    return path if path.is_file() else None
+
+
+def first_viewport_end(content):
+    """Offset where the first viewport ends: after the hero (or header if none)"""
+    header_end = content.find('</header>')
+    hero = SECTION_PATTERN.search(content, max(header_end, 0))
+    if hero:
+        return hero.end()
+    return max(header_end, 0)
+
+
+def add_image_attributes(content, page, index):
+    """Add width/height, lazy-loading and async decoding; returns (content, changed count)"""
+    fold = first_viewport_end(content)
+    changed = 0
+
+    def replace_img(match):
+        nonlocal changed
+        attrs = match.group(1)
+        additions = []
+
+        src = re.search(r'\bsrc="([^"]+)"', attrs)
+        if src and not re.search(r'\b(?:width|height)=', attrs):
+            path = local_asset(src.group(1), page)
+            size = image_size(path, index) if path else None
+            if size:
+                additions.append(f'width="{size[0]}" height="{size[1]}"')
+
+        below_fold = match.start() >= fold and 'fetchpriority="high"' not in attrs
+        if below_fold and 'loading=' not in attrs:
+            additions.append('loading="lazy"')
+        if below_fold and 'decoding=' not in attrs:
+            additions.append('decoding="async"')
+
+        if not additions:
+            return match.group(0)
+        changed += 1
+        closing = " /" if match.group(2) else ""
+        return f'<img{attrs} {" ".join(additions)}{closing}>'
+
+    content = IMG_PATTERN.sub(replace_img, content)
+    return content, changed
+
+
+def main():
+    print("=" * 70)
+    print("IMAGE ATTRIBUTES: SIZE + LAZY LOADING + ASYNC DECODING")
+    print("=" * 70)
+    print()
+
+    index = load_cache("image-dimensions")
+    cached_before = len(index)
+
+    updated = 0
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        new_content, changed = add_image_attributes(content, page, index)
+        if write_if_changed(page, new_content):
+            print(f"  ✓ {page}: {changed} images")
+            updated += 1
+
+    save_cache("image-dimensions", index)
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {updated} pages updated")
+    print(f"Dimension index: {len(index)} images ({len(index) - cached_before} newly read)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
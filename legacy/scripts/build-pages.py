@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Partial-based page build with dependency-tracked incremental rebuilds
+
+Instead of copying the header/footer into every page by regex
+(standardize_page(), fix_footer_all_pages()), pages are compiled from:
+
+    src/pages/**/*.html   page sources
+    src/partials/*.html   shared partials (header, footer, hero, cta, ...)
+
+A page (or partial) pulls in a partial with an include comment; attributes
+become {{ name }} substitutions inside the partial:
+
+    <!-- @include header -->
+    <!-- @include hero title="CURSOS PRIVADOS" image="/img/privados.jpg" -->
+
+The page → partial dependency graph and content hashes are kept in
+.build-cache/pages.json, so only pages whose source or included partials
+changed are recompiled, and unchanged output is never rewritten.
+
+Run with --init once to bootstrap src/ from the current pages: header,
+footer and CTA are extracted from index.html and cursos hero sections are
+turned into hero includes. Pages whose header or footer differ from
+index.html are listed and --init stops; add --normalize to replace them.
+
+A page whose output no longer matches the build is rebuilt, unless it
+matches the hash run-rules.py recorded for it: the rules' rewrites are part
+of the output, not manual edits to undo.
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+from site_pipeline import content_hash, find_pages, load_cache, save_cache, write_if_changed
+
+SRC_DIR = Path("src")
+PAGES_DIR = SRC_DIR / "pages"
+PARTIALS_DIR = SRC_DIR / "partials"
+
+INCLUDE_PATTERN = re.compile(r'<!--\s*@include\s+([\w-]+)((?:\s+\w+="[^"]*")*)\s*-->')
+PARAM_PATTERN = re.compile(r'(\w+)="([^"]*)"')
+VARIABLE_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Regions extracted into partials by --init (same anchors the fix scripts use)
+INIT_REGIONS = {
+    "header": r'<!-- Header Navigation -->.*?</header>',
+    "footer": r'<!-- Footer -->.*?</footer>',
+    "cta": r'<!-- CTA Section -->.*?</section>',
+}
+
+# Regions every page must share; a differing copy is replaced by the partial
+# (other regions only become includes where they match index.html exactly)
+NORMALIZED_REGIONS = ("header", "footer")
+
+# Hero partial: the markup add_hero_to_cursos_page() generates, parameterized
+HERO_PARTIAL = '''<!-- Page Hero -->
+    <section class="py-16 md:py-20 text-white" style="background: linear-gradient(rgba(242, 1, 75, 0.5), rgba(208, 16, 64, 0.5)), url('{{ image }}') center/cover no-repeat">
+      <div class="container mx-auto px-4 text-center">
+        <h1 class="text-4xl md:text-5xl font-bold mb-4">{{ title }}</h1>
+        <p class="text-xl opacity-90 max-w-3xl mx-auto">
+          {{ subtitle }}
+        </p>
+      </div>
+    </section>
+'''
+
+
+class BuildError(Exception):
+    pass
+
+
+class PartialSet:
+    """Loads partials once per build and resolves their transitive includes"""
+
+    def __init__(self, partials_dir=PARTIALS_DIR):
+        self.dir = Path(partials_dir)
+        self.sources = {}
+        self.hashes = {}
+        for path in sorted(self.dir.glob("*.html")):
+            text = path.read_text(encoding='utf-8')
+            self.sources[path.stem] = text
+            self.hashes[path.stem] = content_hash(text)
+
+    def includes(self, text):
+        return [m.group(1) for m in INCLUDE_PATTERN.finditer(text)]
+
+    def dependencies(self, text, stack=()):
+        """Every partial a piece of markup depends on, transitively"""
+        deps = set()
+        for name in self.includes(text):
+            if name in stack:
+                raise BuildError(f"include cycle: {' → '.join(stack + (name,))}")
+            if name not in self.sources:
+                raise BuildError(f"unknown partial '{name}'")
+            deps.add(name)
+            deps |= self.dependencies(self.sources[name], stack + (name,))
+        return deps
+
+    def render(self, text, params=None, stack=()):
+        """Expand includes (recursively) and substitute {{ variables }} in partials;
+        a variable the include does not pass is an error, never left in the page"""
+        if stack:
+            def substitute(match):
+                if match.group(1) not in (params or {}):
+                    raise BuildError(f"partial '{stack[-1]}' needs {match.group(1)}=\"...\" in its include")
+                return params[match.group(1)]
+            text = VARIABLE_PATTERN.sub(substitute, text)
+
+        def expand(match):
+            name = match.group(1)
+            if name in stack:
+                raise BuildError(f"include cycle: {' → '.join(stack + (name,))}")
+            if name not in self.sources:
+                raise BuildError(f"unknown partial '{name}'")
+            return self.render(self.sources[name].rstrip("\n"), dict(PARAM_PATTERN.findall(match.group(2))), stack + (name,))
+
+        return INCLUDE_PATTERN.sub(expand, text)
+
+
+def page_sources():
+    """Map output path → source path for every page under src/pages"""
+    return {
+        path.relative_to(PAGES_DIR).as_posix(): path
+        for path in sorted(PAGES_DIR.rglob("*.html"))
+    }
+
+
+def dependents(state, partial):
+    """Pages whose last build included the given partial"""
+    return sorted(page for page, entry in state.items() if partial in entry.get("deps", {}))
+
+
+def stale_reason(entry, source_hash, deps, partials, output, rules_output=None):
+    """Why a page needs rebuilding, or None if it is up to date
+
+    rules_output is the hash run-rules.py recorded after rewriting the built
+    page; that output is the build's own plus the rules, not a manual edit.
+    """
+    if not entry:
+        return "new page"
+    if entry["source"] != source_hash:
+        return "page source changed"
+    if set(entry["deps"]) != deps:
+        return "includes changed"
+    changed = sorted(name for name in deps if entry["deps"][name] != partials.hashes[name])
+    if changed:
+        return f"partial changed: {', '.join(changed)}"
+    if not output.exists() or content_hash(output.read_bytes()) not in (entry["output"], rules_output):
+        return "output missing or edited"
+    return None
+
+
+def build(pages=None, force=False, out_dir="."):
+    """Compile stale pages (or only `pages`); returns {page: reason} for rebuilt pages"""
+    state = load_cache("pages")
+    rules_state = load_cache("rules")
+    partials = PartialSet()
+    sources = page_sources()
+    rebuilt = {}
+
+    for page, source in sources.items():
+        if pages is not None and page not in pages:
+            continue
+
+        text = source.read_text(encoding='utf-8')
+        source_hash = content_hash(text)
+        deps = partials.dependencies(text)
+        output = Path(out_dir) / page
+
+        rules_output = rules_state.get(page, {}).get("output")
+        reason = "forced" if force else stale_reason(state.get(page), source_hash, deps, partials, output, rules_output)
+        if not reason:
+            continue
+
+        rendered = partials.render(text)
+        write_if_changed(output, rendered)
+        state[page] = {
+            "source": source_hash,
+            "deps": {name: partials.hashes[name] for name in sorted(deps)},
+            "output": content_hash(rendered),
+        }
+        rebuilt[page] = reason
+
+    for page in set(state) - set(sources):
+        del state[page]
+
+    save_cache("pages", state)
+    return rebuilt
+
+
+def hero_include(match):
+    """Turn an add_hero_to_cursos_page() hero into a parameterized include"""
+    image, title, subtitle = match.group(1), match.group(2).strip(), match.group(3).strip()
+    return f'<!-- @include hero title="{title}" subtitle="{subtitle}" image="{image}" -->'
+
+
+def differing_pages(regions):
+    """(page, region) pairs whose normalized region differs from index.html's copy"""
+    differing = []
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        for name in NORMALIZED_REGIONS:
+            if name not in regions:
+                continue
+            match = re.search(regions[name][0], content, re.DOTALL)
+            if match and match.group(0) != regions[name][1]:
+                differing.append((page, name))
+    return differing
+
+
+def init_sources(normalize=False):
+    """Bootstrap src/ from the current published pages
+
+    Pages whose header/footer differ from index.html would lose their copy to
+    the shared partial; unless normalize is set they are listed and nothing
+    is written.
+    """
+    index = Path("index.html").read_text(encoding='utf-8')
+    regions = {}
+    for name, pattern in INIT_REGIONS.items():
+        match = re.search(pattern, index, re.DOTALL)
+        if match:
+            regions[name] = (pattern, match.group(0))
+
+    differing = differing_pages(regions)
+    if differing and not normalize:
+        for page, name in differing:
+            print(f"  ⚠ {page}: {name} differs from index.html")
+        raise BuildError(
+            f"{len(differing)} header/footer copies differ from index.html; "
+            "review them and re-run with --normalize to replace them with the partial"
+        )
+
+    for name, (_, region) in regions.items():
+        write_if_changed(PARTIALS_DIR / f"{name}.html", region + "\n")
+        print(f"  ✓ partials/{name}.html (from index.html)")
+
+    write_if_changed(PARTIALS_DIR / "hero.html", HERO_PARTIAL)
+    print("  ✓ partials/hero.html (add_hero_to_cursos_page() markup)")
+
+    hero_pattern = re.compile(
+        r'<!-- Page Hero -->\s*<section[^>]*url\(\'([^\']+)\'\)[^>]*>\s*'
+        r'<div class="container mx-auto px-4 text-center">\s*'
+        r'<h1[^>]*>(.*?)</h1>\s*<p[^>]*>(.*?)</p>\s*</div>\s*</section>',
+        re.DOTALL
+    )
+
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        for name, (pattern, region) in regions.items():
+            match = re.search(pattern, content, re.DOTALL)
+            if not match:
+                continue
+            if match.group(0) != region:
+                if name not in NORMALIZED_REGIONS:
+                    print(f"  - {page}: {name} is page-specific, kept inline")
+                    continue
+                print(f"  ⚠ {page}: {name} differed from index.html, normalized")
+            content = content[:match.start()] + f"<!-- @include {name} -->" + content[match.end():]
+        content = hero_pattern.sub(hero_include, content)
+        write_if_changed(PAGES_DIR / page, content)
+        print(f"  ✓ pages/{page}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile pages from src/ partials incrementally")
+    parser.add_argument("--init", action="store_true", help="bootstrap src/ from the current pages")
+    parser.add_argument("--normalize", action="store_true",
+                        help="with --init, replace headers/footers that differ from index.html")
+    parser.add_argument("--force", action="store_true", help="rebuild every page")
+    parser.add_argument("pages", nargs="*", help="only build these pages (paths under src/pages)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PARTIAL-BASED PAGE BUILD")
+    print("=" * 70)
+    print()
+
+    try:
+        if args.init:
+            print("Bootstrapping src/ from current pages")
+            print("-" * 70)
+            init_sources(args.normalize)
+            print()
+
+        rebuilt = build(set(args.pages) or None, force=args.force)
+    except BuildError as e:
+        print(f"❌ Build failed: {e}")
+        raise SystemExit(1)
+
+    for page, reason in rebuilt.items():
+        print(f"  ✓ {page} ({reason})")
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {len(rebuilt)} pages rebuilt, {len(page_sources()) - len(rebuilt)} up to date")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
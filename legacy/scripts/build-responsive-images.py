@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Offline responsive image pipeline for hero and sedes photos:
+1. Map every hero/sede image (HERO_IMAGES, SEDES_IMAGES, the campus and
+   course type photos in site-data.json and any background url() in the
+   pages) to a local source file: remote Pexels URLs come from a mirror
+   directory, local paths from the html root
+2. Generate WebP/AVIF variants at several widths in parallel worker
+   processes, cached by source content hash (unchanged photos are skipped)
+3. Rewrite CSS background heroes and sede cards to a positioned
+   <picture>/<img srcset sizes> so mobile only downloads what it needs
+
+Requires Pillow; AVIF needs Pillow >= 11.3 or the pillow-avif-plugin package.
+"""
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+from site_pipeline import find_pages, file_hash, load_script, load_site_data, write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+except ImportError:
+    pass
+
+MIRROR_DIR = "image-mirror"
+OUTPUT_DIR = "img"
+INDEX_PATH = "img/variants.json"
+WIDTHS = (480, 768, 1280, 1920)
+QUALITY = {"webp": 78, "avif": 55}
+
+# sizes attribute per kind of background being replaced
+SIZES = {
+    "hero": "100vw",
+    "card": "(min-width: 1152px) 576px, (min-width: 768px) 50vw, 100vw",
+}
+
+# Scripts whose image dicts feed the pipeline (script → dict names)
+SOURCE_DICTS = {
+    "complete-sedes-and-heroes.py": ("HERO_IMAGES", "SEDES_IMAGES"),
+}
+
+# Opening tag whose inline style is a (gradient +) url() background,
+# optionally followed by more declarations
+BACKGROUND_PATTERN = re.compile(
+    r'<(section|div)\b([^>]*?)\s+style="background(?:-image)?:\s*'
+    r'(?:(linear-gradient\((?:[^()]|\([^()]*\))*\)),\s*)?'
+    r'url\([\'"]?([^\'")]+)[\'"]?\)([^"]*)"([^>]*)>'
+)
+
+
+def source_key(url):
+    """Stable key for an image URL: the file name, ignoring resize query strings"""
+    return Path(urlparse(url).path).name
+
+
+def source_path(url, mirror_dir):
+    """Local file for an image URL: remote images come from the mirror directory"""
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https"):
+        return Path(mirror_dir) / source_key(url)
+    return Path(parsed.path.lstrip("/"))
+
+
+def collect_image_urls(pages):
+    """All hero/sede image URLs from the source dicts, site data and page backgrounds"""
+    data = load_site_data()
+    urls = {campus["photo"] for campus in data["campuses"]}
+    urls |= {course["image"] for course in data["course_types"].values()}
+
+    for script, names in SOURCE_DICTS.items():
+        module = load_script(script)
+        for name in names:
+            for value in getattr(module, name, {}).values():
+                urls.add(value["image"] if isinstance(value, dict) else value)
+
+    for page in pages:
+        for match in BACKGROUND_PATTERN.finditer(page.read_text(encoding='utf-8')):
+            urls.add(match.group(4))
+
+    return urls
+
+
+def available_formats():
+    """Output formats Pillow can encode here (WebP always, AVIF when supported)"""
+    Image.init()
+    return [fmt for fmt in ("avif", "webp") if fmt.upper() in Image.SAVE]
+
+
+def generate_variants(path, digest, output_dir, widths, formats):
+    """Worker: write every missing variant for one source image, return its index entry"""
+    with Image.open(path) as image:
+        image = image.convert("RGB")
+        src_width, src_height = image.size
+        variants = {fmt: [] for fmt in formats}
+        targets = [w for w in widths if w < src_width] + [min(max(widths), src_width)]
+
+        for width in sorted(set(targets)):
+            height = round(src_height * width / src_width)
+            resized = None
+            for fmt in formats:
+                out = Path(output_dir) / f"{Path(path).stem}-{digest}-{width}w.{fmt}"
+                if not out.exists():
+                    resized = resized or image.resize((width, height), Image.LANCZOS)
+                    resized.save(out, fmt.upper(), quality=QUALITY[fmt])
+                variants[fmt].append([width, "/" + out.as_posix()])
+
+    return {"hash": digest, "width": src_width, "height": src_height, "variants": variants}
+
+
+def build_variants(urls, mirror_dir, jobs):
+    """Generate variants for every URL with a local source; returns the variants index"""
+    previous = {}
+    if Path(INDEX_PATH).exists():
+        previous = json.loads(Path(INDEX_PATH).read_text(encoding='utf-8'))
+
+    Path(OUTPUT_DIR).mkdir(exist_ok=True)
+    formats = available_formats()
+    index = {}
+    pending = {}
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for url in sorted(urls):
+            key = source_key(url)
+            path = source_path(url, mirror_dir)
+            if key in index or key in pending:
+                continue
+            if not path.exists():
+                print(f"  ⚠ No local source for {key} (expected {path})")
+                continue
+
+            digest = file_hash(path, 10)
+            cached = previous.get(key)
+            # a format the cached entry lacks (e.g. AVIF support added since) makes it stale
+            if cached and cached["hash"] == digest and all(
+                cached["variants"].get(fmt) and all(Path(p.lstrip("/")).exists() for _, p in cached["variants"][fmt])
+                for fmt in formats
+            ):
+                index[key] = cached
+                print(f"  - {key}: cached")
+                continue
+
+            pending[key] = pool.submit(generate_variants, path, digest, OUTPUT_DIR, WIDTHS, formats)
+
+        for key, future in pending.items():
+            index[key] = future.result()
+            print(f"  ✓ {key}: {', '.join(formats)} × {len(index[key]['variants'][formats[-1]])} widths")
+
+    write_if_changed(INDEX_PATH, json.dumps(index, indent=2, sort_keys=True) + "\n")
+    return index
+
+
+def srcset(entries):
+    """srcset value for a list of [width, path] pairs"""
+    return ", ".join(f"{path} {width}w" for width, path in entries)
+
+
+def picture_markup(entry, sizes, img_attrs):
+    """<picture> (or bare <img>) markup for a variants index entry"""
+    variants = entry["variants"]
+    webp = variants.get("webp") or next(iter(variants.values()))
+    fallback = min(webp, key=lambda item: abs(item[0] - 1280))[1]
+
+    img = (
+        f'<img src="{fallback}" srcset="{srcset(webp)}" sizes="{sizes}" alt="" '
+        f'width="{entry["width"]}" height="{entry["height"]}" {img_attrs}'
+        'style="position:absolute;inset:0;width:100%;height:100%;object-fit:cover;z-index:-1">'
+    )
+    if "avif" not in variants:
+        return img
+    return (
+        f'<picture><source type="image/avif" srcset="{srcset(variants["avif"])}" sizes="{sizes}">'
+        f'{img}</picture>'
+    )
+
+
+def background_to_img(match, image_markup):
+    """Rewrite a background-image opening tag into a positioned image + gradient overlay
+
+    image_markup(tag, url) returns the <img>/<picture> markup or None to keep the
+    background as it is.
+    """
+    tag, before, gradient, url, declarations, after = match.groups()
+    image = image_markup(tag, url)
+    if image is None:
+        return match.group(0)
+
+    attrs = re.sub(r'\b(?:bg-cover|bg-center)\b\s?', '', before + after).rstrip()
+    # keep the declarations after the background; up to the first ";" is the
+    # rest of the shorthand being replaced (center/cover no-repeat), and
+    # background-size/position/... only applied to that background
+    style = "position:relative;isolation:isolate;overflow:hidden"
+    for declaration in declarations.split(";")[1:]:
+        declaration = declaration.strip()
+        if declaration and not declaration.startswith("background"):
+            style += f";{declaration}"
+
+    overlay = ""
+    if gradient:
+        overlay = f'<div aria-hidden="true" style="position:absolute;inset:0;z-index:-1;background:{gradient}"></div>'
+
+    return (
+        f'<{tag}{attrs} style="{style}">'
+        f'{image}{overlay}'
+    )
+
+
+def rewrite_backgrounds(content, index):
+    """Rewrite hero sections and sede cards that have generated variants"""
+    def image_markup(tag, url):
+        entry = index.get(source_key(url))
+        if not entry:
+            return None
+        if tag == "section":
+            return picture_markup(entry, SIZES["hero"], "")
+        return picture_markup(entry, SIZES["card"], 'loading="lazy" decoding="async" ')
+
+    return BACKGROUND_PATTERN.sub(lambda m: background_to_img(m, image_markup), content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate responsive hero/sede images")
+    parser.add_argument("--mirror", default=MIRROR_DIR, help="directory with the mirrored Pexels photos")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RESPONSIVE IMAGE PIPELINE: HEROES + SEDES")
+    print("=" * 70)
+    print()
+
+    if Image is None:
+        print("❌ Pillow is not installed (pip install Pillow)")
+        raise SystemExit(1)
+
+    pages = find_pages()
+    urls = collect_image_urls(pages)
+    print(f"STEP 1: Generating variants for {len(urls)} images")
+    print("-" * 70)
+    index = build_variants(urls, args.mirror, args.jobs)
+    print()
+
+    print("STEP 2: Rewriting hero and sede backgrounds")
+    print("-" * 70)
+    updated = 0
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        if write_if_changed(page, rewrite_backgrounds(content, index)):
+            print(f"  ✓ {page}")
+            updated += 1
+    print()
+
+    print("=" * 70)
+    print(f"✅ COMPLETED: {len(index)} images, {updated} pages rewritten")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
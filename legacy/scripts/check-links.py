@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Site-wide link graph + broken link checker
+1. Parse every page in parallel worker processes (html.parser, no regex) and
+   record its internal links, asset references and anchor ids
+2. Cache the per-page results in .build-cache/link-graph.json by content
+   hash, so later runs only re-parse the pages that changed
+3. Resolve every reference against the filesystem the way nginx does
+   (try_files $uri $uri.html $uri/) and report:
+   - dangling targets: links or assets pointing at files that do not exist
+   - dangling anchors: #fragments with no matching id/name on the target page
+   - orphan pages: pages no other page links to
+
+Catches what standardize_subpage()'s href="/ → href="../ rebasing and the
+EMPLEO menu rules can break. Exits with status 1 when anything dangles.
+"""
+
+import argparse
+import os
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from site_pipeline import content_hash, find_pages, load_cache, save_cache
+
+GRAPH_CACHE = "link-graph"
+PARSER_VERSION = "1"
+
+# (tag, attribute) pairs that reference another page or an asset
+PAGE_REFS = {("a", "href"), ("area", "href"), ("form", "action"), ("iframe", "src")}
+ASSET_REFS = {
+    ("link", "href"), ("script", "src"), ("img", "src"), ("source", "src"),
+    ("video", "src"), ("video", "poster"), ("audio", "src"), ("use", "href"),
+}
+SRCSET_ATTRS = ("srcset", "imagesrcset")
+
+EXTERNAL_SCHEMES = ("http", "https", "mailto", "tel", "javascript", "data", "whatsapp")
+
+# Fragments browsers resolve without a matching element (scroll to top)
+BUILTIN_FRAGMENTS = ("top",)
+
+# Pages that are entry points, never orphans
+ENTRY_PAGES = ("index.html", "404.html", "50x.html")
+
+
+class LinkParser(HTMLParser):
+    """Collects references and anchor targets from one page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        line = self.getpos()[0]
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name == "id" or (tag == "a" and name == "name"):
+                self.ids.add(value)
+            elif (tag, name) in PAGE_REFS:
+                self.links.append(("page", value.strip(), line))
+            elif (tag, name) in ASSET_REFS:
+                self.links.append(("asset", value.strip(), line))
+            elif name in SRCSET_ATTRS:
+                for candidate in value.split(","):
+                    fields = candidate.split()
+                    if fields:
+                        self.links.append(("asset", fields[0], line))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_page(page):
+    """Worker: parse one page; returns (page, graph entry)"""
+    text = Path(page).read_text(encoding='utf-8')
+    parser = LinkParser()
+    parser.feed(text)
+    parser.close()
+    return page, {
+        "hash": content_hash(text + PARSER_VERSION),
+        "links": parser.links,
+        "ids": sorted(parser.ids),
+    }
+
+
+def update_graph(pages, jobs=None):
+    """Load the cached graph and re-parse only new or changed pages; returns (graph, parsed count)"""
+    cached = load_cache(GRAPH_CACHE)
+    graph = {}
+    stale = []
+    for page in pages:
+        key = page.as_posix()
+        entry = cached.get(key)
+        if entry and entry["hash"] == content_hash(page.read_text(encoding='utf-8') + PARSER_VERSION):
+            graph[key] = entry
+        else:
+            stale.append(key)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for key, entry in pool.map(parse_page, stale, chunksize=8):
+                graph[key] = entry
+
+    save_cache(GRAPH_CACHE, graph)
+    return graph, len(stale)
+
+
+def resolve(url, page):
+    """Local file and fragment an internal reference points at: (path or None, fragment).
+    External and placeholder references return (None, None)."""
+    parts = urlsplit(url)
+    if parts.scheme in EXTERNAL_SCHEMES or url.startswith("//") or not url or url == "#":
+        return None, None
+
+    fragment = unquote(parts.fragment) or None
+    if not parts.path:
+        return page, fragment
+
+    if parts.path.startswith("/"):
+        path = posixpath.normpath(unquote(parts.path)).lstrip("/")
+    else:
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(page), unquote(parts.path)))
+
+    if path.startswith(".."):
+        return "", fragment
+
+    # nginx: try_files $uri $uri.html $uri/ =404
+    for candidate in (path, f"{path}.html", posixpath.join(path, "index.html")):
+        if candidate and os.path.isfile(candidate):
+            return candidate, fragment
+    return "", fragment
+
+
+def page_edges(graph):
+    """page → internal pages it links to, in document order (duplicates removed)"""
+    edges = {}
+    for page, entry in graph.items():
+        targets = []
+        for kind, url, _ in entry["links"]:
+            target, _ = resolve(url, page)
+            if kind == "page" and target and target in graph and target != page and target not in targets:
+                targets.append(target)
+        edges[page] = targets
+    return edges
+
+
+def check(graph):
+    """Returns (dangling targets, dangling anchors, orphan pages)"""
+    dangling, anchors = [], []
+    inbound = {page: 0 for page in graph}
+
+    for page, entry in graph.items():
+        for kind, url, line in entry["links"]:
+            target, fragment = resolve(url, page)
+            if target is None:
+                continue
+            if target == "":
+                dangling.append((page, line, kind, url))
+                continue
+            if target in graph:
+                if target != page:
+                    inbound[target] += 1
+                if fragment and fragment not in graph[target]["ids"] and fragment not in BUILTIN_FRAGMENTS:
+                    anchors.append((page, line, url))
+
+    orphans = sorted(
+        page for page, count in inbound.items()
+        if count == 0 and Path(page).name not in ENTRY_PAGES
+    )
+    return dangling, anchors, orphans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the site link graph and report broken links")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LINK GRAPH + BROKEN LINK CHECK")
+    print("=" * 70)
+    print()
+
+    pages = find_pages()
+    graph, parsed = update_graph(pages, args.jobs)
+    dangling, anchors, orphans = check(graph)
+    total_links = sum(len(entry["links"]) for entry in graph.values())
+
+    if dangling:
+        print("Dangling targets")
+        print("-" * 70)
+        for page, line, kind, url in dangling:
+            print(f"  ❌ {page}:{line}: {kind} {url}")
+        print()
+
+    if anchors:
+        print("Dangling anchors")
+        print("-" * 70)
+        for page, line, url in anchors:
+            print(f"  ❌ {page}:{line}: {url}")
+        print()
+
+    if orphans:
+        print("Orphan pages (no inbound links)")
+        print("-" * 70)
+        for page in orphans:
+            print(f"  ⚠ {page}")
+        print()
+
+    print("=" * 70)
+    print(f"{len(graph)} pages ({parsed} parsed, {len(graph) - parsed} cached), {total_links} references")
+    print(f"{len(dangling)} dangling targets, {len(anchors)} dangling anchors, {len(orphans)} orphan pages")
+    print("=" * 70)
+
+    if dangling or anchors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
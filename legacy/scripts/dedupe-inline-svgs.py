@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Inline SVG deduplication:
+1. Hash every inline <svg> icon across the corpus (viewBox + normalized paths)
+2. Move icons repeated at least MIN_OCCURRENCES times into one cacheable
+   <symbol> sprite (icons/svg-sprite.svg)
+3. Replace each occurrence with <svg ...><use href="..."></use></svg>,
+   keeping the per-occurrence class/style/fill/stroke attributes, wherever
+   that is shorter than the inline markup
+4. Report bytes saved per page
+
+Symbols already in the sprite are kept, since pages rewritten by earlier
+runs reference them, and icons already in it are moved even from a single
+occurrence.
+
+The location/phone/clock/email icons from create_sedes_grid() and the sedes
+markup in apply-final-fixes.py are the main offenders.
+"""
+
+import argparse
+import hashlib
+import re
+from collections import Counter
+from pathlib import Path
+
+from site_pipeline import find_pages, write_if_changed
+
+SPRITE_PATH = "icons/svg-sprite.svg"
+SPRITE_URL = "/" + SPRITE_PATH
+MIN_OCCURRENCES = 2
+
+SVG_PATTERN = re.compile(r'<svg\b([^>]*)>(.*?)</svg>', re.DOTALL)
+SYMBOL_PATTERN = re.compile(r'<symbol id="([^"]+)" viewBox="([^"]+)">(.*?)</symbol>', re.DOTALL)
+
+# Inner markup that does not survive being referenced from an external sprite
+NON_PORTABLE = re.compile(
+    r'<(?:svg|use|defs|style|script|foreignObject|linearGradient|radialGradient|mask|clipPath)\b|url\(#',
+    re.IGNORECASE
+)
+
+
+def normalize_markup(markup):
+    """Collapse whitespace so indentation differences do not split identical icons"""
+    markup = re.sub(r'\s+', ' ', markup).strip()
+    return re.sub(r'>\s+<', '><', markup)
+
+
+def parse_svg(match):
+    """Return (symbol id, viewBox, normalized inner markup) or None if not dedupable"""
+    attrs, inner = match.group(1), match.group(2)
+    if NON_PORTABLE.search(inner):
+        return None
+
+    view_box = re.search(r'\bviewBox="([^"]+)"', attrs)
+    if not view_box:
+        return None
+
+    body = normalize_markup(inner)
+    digest = hashlib.sha1(f"{view_box.group(1)}|{body}".encode()).hexdigest()[:10]
+    return f"svg-{digest}", view_box.group(1), body
+
+
+def use_markup(match, sid):
+    """The <svg><use></svg> replacement for an inline SVG"""
+    attrs = re.sub(r'\s*\b(?:viewBox|xmlns)="[^"]*"', '', match.group(1)).strip()
+    if not re.search(r'\b(?:aria-|role=)', attrs):
+        attrs = (attrs + ' aria-hidden="true"').strip()
+    return f'<svg {attrs}><use href="{SPRITE_URL}#{sid}"></use></svg>'
+
+
+def read_sprite(path=SPRITE_PATH):
+    """Symbols of the existing sprite: {id: (viewBox, body)}"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return {sid: (view_box, body) for sid, view_box, body in SYMBOL_PATTERN.findall(path.read_text(encoding='utf-8'))}
+
+
+def scan_svgs(pages):
+    """Count identical inline SVGs across the corpus.
+
+    Returns (Counter of occurrences, Counter of occurrences that a <use>
+    reference would shrink, {id: (viewBox, body)}).
+    """
+    counts = Counter()
+    shrinkable = Counter()
+    symbols = {}
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        for match in SVG_PATTERN.finditer(content):
+            parsed = parse_svg(match)
+            if parsed:
+                sid, view_box, body = parsed
+                counts[sid] += 1
+                if len(use_markup(match, sid)) < len(match.group(0)):
+                    shrinkable[sid] += 1
+                symbols[sid] = (view_box, body)
+    return counts, shrinkable, symbols
+
+
+def build_sprite(sprite_ids, symbols):
+    """Build the <symbol> sprite document"""
+    lines = [
+        f'<symbol id="{sid}" viewBox="{symbols[sid][0]}">{symbols[sid][1]}</symbol>'
+        for sid in sorted(sprite_ids)
+    ]
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">\n'
+        + "\n".join(lines)
+        + '\n</svg>\n'
+    )
+
+
+def replace_svgs(content, sprite_ids):
+    """Replace sprite-backed inline SVGs with <use> references where that is shorter;
+    returns (content, replaced count)"""
+    replaced = 0
+
+    def replace_svg(match):
+        nonlocal replaced
+        parsed = parse_svg(match)
+        if not parsed or parsed[0] not in sprite_ids:
+            return match.group(0)
+
+        replacement = use_markup(match, parsed[0])
+        if len(replacement) >= len(match.group(0)):
+            return match.group(0)
+        replaced += 1
+        return replacement
+
+    content = SVG_PATTERN.sub(replace_svg, content)
+    return content, replaced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move repeated inline SVGs into a shared sprite")
+    parser.add_argument("--min", type=int, default=MIN_OCCURRENCES,
+                        help="minimum occurrences across the corpus before an icon is moved")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("INLINE SVG SPRITE DEDUPLICATION")
+    print("=" * 70)
+    print()
+
+    pages = find_pages()
+    counts, shrinkable, symbols = scan_svgs(pages)
+    existing = read_sprite()
+    new_ids = {sid for sid, count in counts.items()
+               if sid not in existing and count >= args.min and shrinkable[sid]}
+    sprite_ids = set(existing) | new_ids
+    symbols.update(existing)
+
+    print(f"Inline SVGs: {sum(counts.values())} occurrences, {len(counts)} unique")
+    print(f"Repeated (≥{args.min}): {len(new_ids)} new icons, {len(existing)} already in {SPRITE_PATH}")
+    print()
+
+    if not sprite_ids:
+        print("✅ No repeated inline SVGs, nothing to do")
+        return
+
+    sprite = build_sprite(sprite_ids, symbols)
+    write_if_changed(SPRITE_PATH, sprite)
+
+    total_saved = 0
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        new_content, replaced = replace_svgs(content, sprite_ids)
+        if write_if_changed(page, new_content):
+            saved = len(content.encode()) - len(new_content.encode())
+            total_saved += saved
+            print(f"  ✓ {page}: {replaced} icons, {-saved:+,} bytes")
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {-total_saved:+,} bytes across pages "
+          f"(sprite: {len(sprite.encode()):,} bytes, cached once)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
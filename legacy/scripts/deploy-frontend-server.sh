@@ -1834,6 +1834,30 @@ echo "🔒 Setting permissions..."
 chmod 644 *.html
 chown www-data:www-data *.html
 
+# Install nginx snippets generated by the build stages:
+#   immutable-assets  cache rules for fingerprinted assets (fingerprint-assets.py)
+#   service-worker    always revalidate /sw.js (generate-service-worker.py)
+SNIPPETS_INSTALLED=0
+for snippet in immutable-assets service-worker; do
+    if [ -f "nginx-$snippet.conf" ]; then
+        echo "📦 Installing nginx snippet cep-$snippet.conf..."
+        mkdir -p /etc/nginx/snippets
+        mv "nginx-$snippet.conf" "/etc/nginx/snippets/cep-$snippet.conf"
+        if ! grep -rq "cep-$snippet.conf" /etc/nginx/sites-enabled/ /etc/nginx/conf.d/ 2>/dev/null; then
+            echo "⚠️  Add 'include snippets/cep-$snippet.conf;' to the site's server block"
+        fi
+        SNIPPETS_INSTALLED=1
+    fi
+done
+if [ -f sw.js ]; then
+    chmod 644 sw.js
+    chown www-data:www-data sw.js
+fi
+if [ "$SNIPPETS_INSTALLED" = 1 ] && ! nginx -t; then
+    echo "❌ nginx config test failed - not restarting"
+    exit 1
+fi
+
 # Restart nginx to apply changes
 echo "🔄 Restarting nginx..."
 systemctl restart nginx
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Asset fingerprinting + immutable cache manifest:
+1. Hash every local asset referenced from the pages (src, href, srcset,
+   imagesrcset and url() in inline styles or stylesheets)
+2. Copy it to a fingerprinted name next to the original
+   (/cep-logo.png → /cep-logo.1a2b3c4d.png); stylesheets are fingerprinted
+   after their own url() references have been rewritten
+3. Rewrite every reference across the corpus in one pass
+4. Write asset-manifest.json and nginx-immutable-assets.conf, which
+   deploy-frontend-server.sh installs as an nginx snippet
+
+Originals are left in place and re-runs map fingerprinted references back
+through the manifest, so running it again after an asset changes just
+moves the references to the new hash; copies the new manifest no longer
+names are deleted.
+
+<a href> targets (PDF downloads, linked images) are never fingerprinted:
+other sites link to them, so their URL must not change with their content.
+"""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from site_pipeline import content_hash, find_pages, write_if_changed
+
+MANIFEST_PATH = "asset-manifest.json"
+NGINX_CONF_PATH = "nginx-immutable-assets.conf"
+HASH_LENGTH = 8
+
+ASSET_SUFFIXES = (
+    ".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico",
+    ".woff", ".woff2", ".ttf", ".mp4", ".webm", ".pdf",
+)
+
+TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)\b[^>]*>')
+ATTR_PATTERN = re.compile(r'\b(src|href|poster|srcset|imagesrcset)="([^"]*)"')
+URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+NGINX_CONF = '''# Generated by fingerprint-assets.py: fingerprinted assets never change,
+# so browsers and proxies may cache them for a year without revalidating.
+# Include from the site's server block:  include snippets/cep-immutable-assets.conf;
+location ~* "\\.[0-9a-f]{%d}\\.(?:%s)$" {
+    add_header Cache-Control "public, max-age=31536000, immutable";
+    access_log off;
+    try_files $uri =404;
+}
+'''
+
+
+class Fingerprinter:
+    """Fingerprints assets on demand and rewrites references to them"""
+
+    def __init__(self, manifest):
+        self.manifest = manifest
+        # fingerprinted path → original path, to re-resolve on later runs
+        self.originals = {v: k for k, v in manifest.items()}
+        self.done = {}
+
+    def resolve(self, path, base_dir):
+        """Root-relative original path ("/x/y.png") for a reference path, or None"""
+        if path.startswith("/"):
+            site_path = os.path.normpath(path)
+        else:
+            site_path = os.path.normpath("/" + (base_dir / path).as_posix())
+        site_path = self.originals.get(site_path, site_path)
+        local = Path(site_path.lstrip("/"))
+        if local.suffix.lower() in ASSET_SUFFIXES and local.is_file():
+            return site_path
+        return None
+
+    def fingerprint(self, site_path):
+        """Fingerprinted root-relative path for an original asset (memoized per run)"""
+        if site_path in self.done:
+            return self.done[site_path]
+
+        local = Path(site_path.lstrip("/"))
+        if local.suffix.lower() == ".css":
+            data = self.rewrite(local.read_text(encoding='utf-8'), local.parent, css=True).encode('utf-8')
+        else:
+            data = local.read_bytes()
+
+        target = local.with_name(f"{local.stem}.{content_hash(data, HASH_LENGTH)}{local.suffix}")
+        if not target.exists():
+            if local.suffix.lower() == ".css":
+                target.write_bytes(data)
+            else:
+                shutil.copy2(local, target)
+
+        fingerprinted = "/" + target.as_posix()
+        self.manifest[site_path] = fingerprinted
+        self.done[site_path] = fingerprinted
+        return fingerprinted
+
+    def rewrite_ref(self, ref, base_dir, fingerprint=True):
+        """Rewrite a single URL reference, keeping its relative form, query and fragment.
+        With fingerprint=False the reference is pointed back at the original file."""
+        parts = urlsplit(ref)
+        if parts.scheme or parts.netloc or not parts.path or ref.startswith("data:"):
+            return ref
+
+        site_path = self.resolve(parts.path, base_dir)
+        if not site_path:
+            return ref
+
+        new_name = Path(self.fingerprint(site_path) if fingerprint else site_path).name
+        directory = parts.path.rsplit("/", 1)[0] + "/" if "/" in parts.path else ""
+        suffix = (f"?{parts.query}" if parts.query else "") + (f"#{parts.fragment}" if parts.fragment else "")
+        return f"{directory}{new_name}{suffix}"
+
+    def rewrite_srcset(self, value, base_dir):
+        candidates = []
+        for candidate in value.split(","):
+            fields = candidate.strip().split(None, 1)
+            if fields:
+                fields[0] = self.rewrite_ref(fields[0], base_dir)
+                candidates.append(" ".join(fields))
+        return ", ".join(candidates)
+
+    def rewrite(self, content, base_dir, css=False):
+        """Rewrite every asset reference in a page (or stylesheet when css=True)"""
+        def replace_url(match):
+            return f"url({match.group(1)}{self.rewrite_ref(match.group(2), base_dir)}{match.group(1)})"
+
+        def replace_tag(tag):
+            link = tag.group(1).lower() == "a"
+
+            def replace_attr(match):
+                name, value = match.groups()
+                if name in ("srcset", "imagesrcset"):
+                    value = self.rewrite_srcset(value, base_dir)
+                else:
+                    # links keep a stable URL (and lose a hash an earlier run gave them)
+                    value = self.rewrite_ref(value, base_dir, fingerprint=not (link and name == "href"))
+                return f'{name}="{value}"'
+            return ATTR_PATTERN.sub(replace_attr, tag.group(0))
+
+        content = URL_PATTERN.sub(replace_url, content)
+        if not css:
+            content = TAG_PATTERN.sub(replace_tag, content)
+        return content
+
+
+def main():
+    print("=" * 70)
+    print("ASSET FINGERPRINTING + IMMUTABLE CACHE MANIFEST")
+    print("=" * 70)
+    print()
+
+    manifest = {}
+    if Path(MANIFEST_PATH).exists():
+        manifest = json.loads(Path(MANIFEST_PATH).read_text(encoding='utf-8'))
+
+    previous = set(manifest.values())
+    fingerprinter = Fingerprinter(manifest)
+
+    updated = 0
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        if write_if_changed(page, fingerprinter.rewrite(content, page.parent)):
+            print(f"  ✓ {page}")
+            updated += 1
+
+    # Keep only assets still referenced somewhere
+    manifest = {k: v for k, v in sorted(manifest.items()) if k in fingerprinter.done}
+    write_if_changed(MANIFEST_PATH, json.dumps(manifest, indent=2) + "\n")
+
+    # Copies from earlier runs that nothing references any more
+    pruned = 0
+    for stale in sorted(previous - set(manifest.values())):
+        path = Path(stale.lstrip("/"))
+        if path.is_file():
+            path.unlink()
+            print(f"  - {stale} (stale copy removed)")
+            pruned += 1
+
+    suffixes = "|".join(sorted(s.lstrip(".") for s in ASSET_SUFFIXES))
+    write_if_changed(NGINX_CONF_PATH, NGINX_CONF % (HASH_LENGTH, suffixes))
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {len(manifest)} assets fingerprinted, {updated} pages rewritten, "
+          f"{pruned} stale copies removed")
+    print(f"Manifest:     {MANIFEST_PATH}")
+    print(f"Nginx rules:  {NGINX_CONF_PATH} (installed by deploy-frontend-server.sh)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Service worker + precache manifest for repeat visits and offline use
+1. Read asset-manifest.json from fingerprint-assets.py: every fingerprinted
+   asset is precached and served cache-first (it can never change)
+2. Precache every page under its clean URL (/contacto, /cursos/ocupados)
+   and serve pages stale-while-revalidate
+3. Version the worker by the content hash of everything it precaches, so a
+   changed page or asset installs a new worker and evicts what went stale;
+   fingerprinted assets still in the manifest stay cached across versions,
+   including large ones that were cached on first use instead of precached
+4. Inject a one-line registration snippet into every page and write
+   nginx-service-worker.conf so /sw.js itself is always revalidated
+
+Run after fingerprint-assets.py and before minify-and-compress.py.
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from string import Template
+
+from site_pipeline import SCRIPTS_DIR, content_hash, file_hash, find_pages, write_if_changed
+
+MANIFEST_PATH = "asset-manifest.json"
+WORKER_PATH = "sw.js"
+NGINX_CONF_PATH = "nginx-service-worker.conf"
+TEMPLATE_PATH = SCRIPTS_DIR / "templates" / "sw.js"
+HASH_LENGTH = 8   # matches fingerprint-assets.py
+
+# Large media is fetched on demand (still cache-first), not precached
+PRECACHE_MAX_BYTES = 512 * 1024
+
+REGISTER_SNIPPET = (
+    "<script data-sw-register>if ('serviceWorker' in navigator) { window.addEventListener('load', "
+    "function () { navigator.serviceWorker.register('/sw.js'); }); }</script>"
+)
+REGISTER_PATTERN = re.compile(r'[ \t]*<script data-sw-register>.*?</script>\n?', re.DOTALL)
+
+NGINX_CONF = '''# Generated by generate-service-worker.py: the worker script must always be
+# revalidated, or browsers keep running a stale precache list.
+# Include from the site's server block:  include snippets/cep-service-worker.conf;
+location = /sw.js {
+    add_header Cache-Control "no-cache";
+    try_files $uri =404;
+}
+'''
+
+
+def page_url(page):
+    """Clean URL nginx serves a page under (try_files $uri.html, no trailing slash)"""
+    path = "/" + page.as_posix()
+    path = re.sub(r'/index\.html$|\.html$', '', path)
+    return path or "/"
+
+
+def precache_assets(manifest, max_bytes):
+    """Fingerprinted asset paths split into (precached, cached on first use)"""
+    assets, runtime = [], []
+    for fingerprinted in sorted(set(manifest.values())):
+        local = Path(fingerprinted.lstrip("/"))
+        if not local.is_file():
+            continue
+        if local.stat().st_size > max_bytes:
+            runtime.append(fingerprinted)
+            continue
+        assets.append(fingerprinted)
+    return assets, runtime
+
+
+def render_worker(assets, runtime, pages):
+    """(version, sw.js source); the version hashes every asset URL and page content"""
+    fingerprint = "\n".join(assets + runtime) + "\n" + "\n".join(f"{url} {digest}" for url, digest in pages)
+    version = content_hash(fingerprint, 12)
+    return version, Template(TEMPLATE_PATH.read_text(encoding='utf-8')).substitute(
+        version=version,
+        assets=json.dumps(assets, indent=2),
+        runtime_assets=json.dumps(runtime, indent=2),
+        pages=json.dumps([url for url, _ in pages], indent=2),
+        hash_length=HASH_LENGTH,
+    )
+
+
+def inject_registration(content):
+    content = REGISTER_PATTERN.sub('', content)
+    return content.replace('</body>', f'    {REGISTER_SNIPPET}\n</body>', 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the service worker and precache manifest")
+    parser.add_argument("--max-bytes", type=int, default=PRECACHE_MAX_BYTES,
+                        help="largest asset to precache (bigger ones are cached on first use)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("SERVICE WORKER + PRECACHE MANIFEST")
+    print("=" * 70)
+    print()
+
+    manifest = {}
+    if Path(MANIFEST_PATH).exists():
+        manifest = json.loads(Path(MANIFEST_PATH).read_text(encoding='utf-8'))
+    else:
+        print(f"⚠ {MANIFEST_PATH} not found: run fingerprint-assets.py first (no assets precached)")
+        print()
+
+    assets, runtime = precache_assets(manifest, args.max_bytes)
+
+    updated = 0
+    pages = []
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        if '</body>' in content and write_if_changed(page, inject_registration(content)):
+            updated += 1
+        pages.append((page_url(page), file_hash(page, 12)))
+
+    version, worker = render_worker(assets, runtime, pages)
+    write_if_changed(WORKER_PATH, worker)
+    write_if_changed(NGINX_CONF_PATH, NGINX_CONF)
+
+    print(f"  ✓ {WORKER_PATH}: {len(assets)} immutable assets, {len(pages)} pages"
+          + (f" ({len(runtime)} large assets cached on first use)" if runtime else ""))
+    print(f"  ✓ registration snippet added to {updated} pages")
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: worker version {version}")
+    print(f"Nginx rules:  {NGINX_CONF_PATH} (installed by deploy-frontend-server.sh)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Prefetch + preload hints from the site link graph
+1. Rank each page's likely next pages from the link graph built by
+   check-links.py: links in the page body first (most linked, then first
+   seen), then the header navigation in menu order
+2. <link rel="prefetch"> the top candidates until the per-page byte budget
+   (gzip size of the target pages) is spent
+3. <link rel="preload"> the page's critical late-discovered assets: the
+   header logo and the woff2 fonts its local stylesheets pull in
+4. Hints live between <!-- resource-hints:start/end --> markers before
+   </head>, so re-runs replace them instead of piling up
+
+The hero image preload from preload-hero-images.py is left alone.
+"""
+
+import argparse
+import gzip
+import posixpath
+import re
+from pathlib import Path
+
+from site_pipeline import find_pages, load_script, write_if_changed
+
+links = load_script("check-links.py")
+
+PREFETCH_BUDGET = 60 * 1024   # gzip bytes of prefetched pages per page
+MAX_PREFETCH = 4
+
+HINTS_PATTERN = re.compile(r'[ \t]*<!-- resource-hints:start -->.*?<!-- resource-hints:end -->\n?', re.DOTALL)
+HEADER_PATTERN = re.compile(r'<header\b.*?</header>', re.DOTALL)
+FOOTER_START = re.compile(r'<footer\b')
+LOGO_PATTERN = re.compile(r'<img\b[^>]*\bsrc="([^"]+)"')
+PRELOAD_HREF_PATTERN = re.compile(r'<link\b[^>]*\brel="preload"[^>]*\bhref="([^"]+)"|<link\b[^>]*\bhref="([^"]+)"[^>]*\brel="preload"')
+STYLESHEET_PATTERN = re.compile(r'<link\b[^>]*\brel="stylesheet"[^>]*\bhref="([^"]+)"')
+FONT_URL_PATTERN = re.compile(r'url\(\s*[\'"]?([^\'")]+\.woff2)(?:\?[^\'")]*)?[\'"]?\s*\)')
+
+
+def line_of(content, offset):
+    return content.count("\n", 0, offset) + 1
+
+
+def ranked_targets(page, entry, content):
+    """Internal pages a visitor is likely to open next, best first: [(target, href)]"""
+    header = HEADER_PATTERN.search(content)
+    header_lines = (line_of(content, header.start()), line_of(content, header.end())) if header else (0, 0)
+    footer = FOOTER_START.search(content)
+    footer_line = line_of(content, footer.start()) if footer else float("inf")
+
+    body, nav, hrefs = {}, [], {}
+    for position, (kind, url, line) in enumerate(entry["links"]):
+        target, _ = links.resolve(url, page)
+        if kind != "page" or not target or target == page:
+            continue
+        hrefs.setdefault(target, url.split("#")[0])
+        if header_lines[0] <= line <= header_lines[1]:
+            if target not in nav:
+                nav.append(target)
+        elif line < footer_line:
+            count, first = body.get(target, (0, position))
+            body[target] = (count + 1, first)
+
+    ranked = sorted(body, key=lambda t: (-body[t][0], body[t][1]))
+    ranked += [t for t in nav if t not in body]
+    return [(target, hrefs[target]) for target in ranked]
+
+
+def compressed_size(path, sizes):
+    if path not in sizes:
+        sizes[path] = len(gzip.compress(Path(path).read_bytes(), compresslevel=6))
+    return sizes[path]
+
+
+def select_prefetch(candidates, budget, limit, sizes):
+    """Take candidates in rank order while they fit in the byte budget"""
+    chosen, spent = [], 0
+    for target, href in candidates:
+        if len(chosen) >= limit:
+            break
+        size = compressed_size(target, sizes)
+        if spent + size > budget:
+            continue
+        chosen.append(href)
+        spent += size
+    return chosen, spent
+
+
+def critical_assets(page, content):
+    """(href, as, type) preloads: header logo and fonts from local stylesheets,
+    minus anything another stage already preloads"""
+    assets = []
+    header = HEADER_PATTERN.search(content)
+    logo = LOGO_PATTERN.search(header.group(0)) if header else None
+    if logo and not logo.group(1).startswith("data:"):
+        assets.append((logo.group(1), "image", None))
+
+    for href in STYLESHEET_PATTERN.findall(content):
+        target, _ = links.resolve(href, page)
+        if not target:
+            continue
+        css = Path(target).read_text(encoding='utf-8', errors='ignore')
+        for font in FONT_URL_PATTERN.findall(css):
+            if not font.startswith(("/", "http:", "https:", "//")):
+                font = posixpath.normpath(posixpath.join("/" + posixpath.dirname(target), font))
+            if (font, "font", "font/woff2") not in assets:
+                assets.append((font, "font", "font/woff2"))
+
+    preloaded = {a or b for a, b in PRELOAD_HREF_PATTERN.findall(content)}
+    return [asset for asset in assets if asset[0] not in preloaded]
+
+
+def hints_block(prefetch, preload):
+    lines = ["<!-- resource-hints:start -->"]
+    for href, kind, mime in preload:
+        extra = f' type="{mime}" crossorigin' if kind == "font" else ""
+        lines.append(f'<link rel="preload" href="{href}" as="{kind}"{extra}>')
+    for href in prefetch:
+        lines.append(f'<link rel="prefetch" href="{href}">')
+    lines.append("<!-- resource-hints:end -->")
+    return "\n    ".join(lines)
+
+
+def inject_hints(content, block):
+    content = HINTS_PATTERN.sub('', content)
+    return content.replace('</head>', f'    {block}\n</head>', 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inject prefetch/preload hints from the link graph")
+    parser.add_argument("--budget", type=int, default=PREFETCH_BUDGET, help="prefetch bytes (gzip) per page")
+    parser.add_argument("--max", type=int, default=MAX_PREFETCH, help="prefetched pages per page")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RESOURCE HINTS: PREFETCH + PRELOAD")
+    print("=" * 70)
+    print()
+
+    graph, parsed = links.update_graph(find_pages())
+    print(f"Link graph: {len(graph)} pages ({parsed} re-parsed)")
+    print()
+
+    sizes = {}
+    updated = 0
+    for page, entry in graph.items():
+        path = Path(page)
+        content = path.read_text(encoding='utf-8')
+        if '</head>' not in content:
+            continue
+        prefetch, spent = select_prefetch(ranked_targets(page, entry, content), args.budget, args.max, sizes)
+        preload = critical_assets(page, HINTS_PATTERN.sub('', content))
+        if write_if_changed(path, inject_hints(content, hints_block(prefetch, preload))):
+            print(f"  ✓ {page}: prefetch {', '.join(prefetch) or '-'} ({spent:,} bytes), {len(preload)} preloads")
+            updated += 1
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {updated} pages updated")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
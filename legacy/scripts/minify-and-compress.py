@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Final output stage: minified pages + precompressed artifacts
+1. Minify every page into the output directory (default dist/), never in place:
+   - dev:  collapse indentation, keep the comment anchors the fix scripts
+           match on (<!-- Footer -->, <!-- Header Navigation -->, ...)
+   - prod: also drop every comment
+2. Copy the other published files (CSS, JS, sprites, images) alongside
+3. Write .gz and .br siblings for text files so nginx can serve them with
+   `gzip_static on;` / `brotli_static on;`
+4. Run across all cores, skipping files whose content hash (and mode) has
+   not changed since the last run
+5. Remove outputs whose source was deleted, and .gz/.br siblings that were
+   not rewritten (file now too small, brotli not installed)
+
+Brotli output needs the `brotli` package; without it only .gz is written.
+"""
+
+import argparse
+import gzip
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from site_pipeline import (
+    EXCLUDED_DIRS, content_hash, find_pages, load_cache, save_cache,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+OUTPUT_DIR = "dist"
+MINIFIER_VERSION = "1"
+COMPRESSIBLE = (".html", ".css", ".js", ".svg", ".json", ".xml", ".txt")
+MIN_COMPRESS_BYTES = 256
+
+# Never published: tooling, generated nginx snippets and the raw image mirror
+UNPUBLISHED_SUFFIXES = (".py", ".pyc", ".sh", ".md", ".conf")
+UNPUBLISHED_DIRS = ("image-mirror", "__pycache__")
+
+# Comments the fix-*.py rules use as anchors; kept in dev output
+ANCHOR_COMMENTS = (
+    "Header Navigation", "Navigation", "Footer", "Hero Section", "Blog Hero Section",
+    "Page Hero", "Breadcrumb", "Sedes Grid", "Sedes Section", "CTA Section",
+    "Newsletter Section",
+)
+
+RAW_BLOCK_PATTERN = re.compile(r'(<(pre|textarea|script|style)\b.*?</\2>)', re.DOTALL | re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r'<!--(?!\[if)(.*?)-->', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[a-zA-Z][^>]*>')
+BLOCK_TAGS = (
+    "html|head|body|meta|link|title|script|style|noscript|div|section|header|footer|nav|main|"
+    "article|aside|ul|ol|li|p|h[1-6]|table|thead|tbody|tr|td|th|form|picture|source|br|hr"
+)
+BLOCK_EDGE_PATTERN = re.compile(rf'\s*(</?(?:{BLOCK_TAGS})\b[^>]*>)\s*', re.IGNORECASE)
+
+
+def minify_tag(tag):
+    """Collapse whitespace between attributes, leaving quoted values untouched"""
+    tag = re.sub(r'("[^"]*"|\'[^\']*\')|\s+', lambda m: m.group(1) or ' ', tag)
+    return re.sub(r'\s+(/?>)$', r'\1', tag)
+
+
+def minify_style(block):
+    """Drop comments and indentation from an inline <style> block"""
+    block = re.sub(r'/\*.*?\*/', '', block, flags=re.DOTALL)
+    block = re.sub(r'\s+', ' ', block)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', block)
+
+
+def minify_html(content, mode):
+    """Minify a page; raw blocks (<pre>, <script>, <style>, <textarea>) are kept verbatim"""
+    def strip_comment(match):
+        if mode == "dev" and match.group(1).strip() in ANCHOR_COMMENTS:
+            return match.group(0)
+        return ""
+
+    parts = RAW_BLOCK_PATTERN.split(content)
+    output = []
+    # split() with two groups yields: text, raw block, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        text = COMMENT_PATTERN.sub(strip_comment, parts[i])
+        text = TAG_PATTERN.sub(lambda m: minify_tag(m.group(0)), text)
+        text = re.sub(r'\s+', ' ', text)
+        text = BLOCK_EDGE_PATTERN.sub(r'\1', text)
+        if i > 0 and parts[i - 1].lower() in ("script", "style"):
+            text = text.lstrip()
+        if i + 2 < len(parts) and parts[i + 2].lower() in ("script", "style"):
+            text = text.rstrip()
+        output.append(text)
+        if i + 1 < len(parts):
+            block = parts[i + 1]
+            output.append(minify_style(block) if parts[i + 2].lower() == "style" else block)
+
+    return "".join(output).strip() + "\n"
+
+
+def compress_siblings(dest, data):
+    """Write dest.gz / dest.br next to dest; returns (gz bytes, br bytes).
+    A sibling that is not rewritten (file too small, brotli missing) is
+    deleted so nginx never serves a stale copy."""
+    gz_size = br_size = 0
+    gz_path, br_path = Path(f"{dest}.gz"), Path(f"{dest}.br")
+
+    if len(data) >= MIN_COMPRESS_BYTES:
+        gz = gzip.compress(data, compresslevel=9, mtime=0)
+        gz_path.write_bytes(gz)
+        gz_size = len(gz)
+    else:
+        gz_path.unlink(missing_ok=True)
+
+    if len(data) >= MIN_COMPRESS_BYTES and brotli is not None:
+        br = brotli.compress(data, quality=11)
+        br_path.write_bytes(br)
+        br_size = len(br)
+    else:
+        br_path.unlink(missing_ok=True)
+
+    return gz_size, br_size
+
+
+def build_output(src, dest, mode):
+    """Worker: minify (pages), copy and precompress one file; returns size stats"""
+    src, dest = Path(src), Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    if src.suffix == ".html":
+        data = minify_html(src.read_text(encoding='utf-8'), mode).encode('utf-8')
+        dest.write_bytes(data)
+    else:
+        shutil.copy2(src, dest)
+        data = dest.read_bytes() if src.suffix in COMPRESSIBLE else b""
+
+    gz_size, br_size = compress_siblings(dest, data)
+    return str(src), src.stat().st_size, len(data), gz_size, br_size
+
+
+def find_published_files(root="."):
+    """Pages plus every other published asset under root"""
+    files = set(find_pages(root))
+    for path in Path(root).rglob("*"):
+        parts = path.relative_to(root).parts
+        if not path.is_file() or any(p.startswith(EXCLUDED_DIRS + UNPUBLISHED_DIRS) for p in parts[:-1]):
+            continue
+        if parts[0].startswith(".") or path.suffix in UNPUBLISHED_SUFFIXES or path.suffix in (".gz", ".br"):
+            continue
+        files.add(path)
+    return sorted(files)
+
+
+def remove_orphans(out, files):
+    """Delete outputs (and their .gz/.br) whose source no longer exists, and any
+    .br left from a run with brotli installed; returns the count of outputs removed"""
+    expected = {Path(out) / src for src in files}
+    removed = 0
+    for path in sorted(Path(out).rglob("*")):
+        if not path.is_file():
+            continue
+        output = path.with_suffix("") if path.suffix in (".gz", ".br") else path
+        if output not in expected or (path.suffix == ".br" and brotli is None):
+            path.unlink()
+            removed += path == output
+    for directory in sorted(Path(out).rglob("*"), reverse=True):
+        if directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minify pages and write gzip/brotli siblings")
+    parser.add_argument("--mode", choices=("dev", "prod"), default="prod")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="output directory")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"MINIFY + PRECOMPRESS ({args.mode.upper()})")
+    print("=" * 70)
+    print()
+
+    if brotli is None:
+        print("⚠ brotli package not installed: writing .gz only")
+        print()
+
+    cache = load_cache(f"compressed-{args.mode}")
+    files = find_published_files()
+    compressors = "gz" if brotli is None else "gz+br"
+    pending = {}
+
+    for src in files:
+        dest = Path(args.out) / src
+        key = content_hash(src.read_bytes() + f"|{args.mode}|{MINIFIER_VERSION}|{compressors}".encode())
+        if cache.get(str(src)) == key and dest.exists():
+            continue
+        pending[str(src)] = (dest, key)
+
+    total_in = total_out = total_gz = total_br = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(build_output, src, dest, args.mode) for src, (dest, _) in pending.items()]
+        for future in futures:
+            src, size_in, size_out, gz_size, br_size = future.result()
+            cache[src] = pending[src][1]
+            if src.endswith(".html"):
+                total_in += size_in
+                total_out += size_out
+                total_gz += gz_size
+                total_br += br_size
+                print(f"  ✓ {src}: {size_in:,} → {size_out:,} bytes (gz {gz_size:,}, br {br_size:,})")
+
+    removed = remove_orphans(args.out, files)
+    published = {str(src) for src in files}
+    cache = {src: key for src, key in cache.items() if src in published}
+    save_cache(f"compressed-{args.mode}", cache)
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {len(pending)} files rebuilt, {len(files) - len(pending)} unchanged, "
+          f"{removed} removed")
+    if total_in:
+        print(f"Pages: {total_in:,} → {total_out:,} bytes minified, "
+              f"{total_gz:,} gzip, {total_br:,} brotli")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
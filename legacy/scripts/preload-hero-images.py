@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Preloadable hero markup:
+1. Find each page's hero (first <section> after the header)
+2. Rewrite an inline `background: linear-gradient(...), url(...)` hero into a
+   positioned <img fetchpriority="high"> plus the same gradient as an overlay
+   (uses the responsive variants from build-responsive-images.py when they exist)
+3. Inject a matching <link rel="preload" as="image"> into the <head>
+
+Heroes built by fix_hero_section(), add_hero_image_to_page() and
+add_hero_to_cursos_page() keep their look: cover/center become
+object-fit: cover on the image. With --preload-only the hero markup is left
+alone and only the preload link is added.
+"""
+
+import argparse
+import html
+import json
+import re
+from pathlib import Path
+
+from site_pipeline import find_pages, load_script, write_if_changed
+
+images = load_script("build-responsive-images.py")
+
+SECTION_PATTERN = re.compile(r'<section\b.*?</section>', re.DOTALL)
+PRELOAD_PATTERN = re.compile(r'\s*<link\b[^>]*\bdata-hero-preload\b[^>]*>')
+IMG_PATTERN = re.compile(r'(?:<picture>(?P<source><source\b[^>]*>))?<img\b(?P<attrs>[^>]*)>')
+
+# Inline style of the cover image background_to_img() puts in a hero
+HERO_IMG_STYLE = "position:absolute;inset:0;"
+
+
+def load_variants():
+    """Variants index written by build-responsive-images.py (empty if not generated)"""
+    path = Path(images.INDEX_PATH)
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {}
+
+
+def find_hero(content):
+    """Return the hero <section> match: the first section after the header"""
+    header_end = content.find('</header>')
+    return SECTION_PATTERN.search(content, max(header_end, 0))
+
+
+def attr(attrs, name):
+    """Value of an attribute in a raw attribute string, or None"""
+    match = re.search(rf'\b{name}="([^"]*)"', attrs)
+    return html.unescape(match.group(1)) if match else None
+
+
+def hero_image_markup(variants):
+    """image_markup callback for background_to_img(): eager, high-priority hero image"""
+    def image_markup(tag, url):
+        entry = variants.get(images.source_key(url))
+        if entry:
+            return images.picture_markup(entry, images.SIZES["hero"], 'fetchpriority="high" ')
+        return (
+            f'<img src="{url}" alt="" fetchpriority="high" '
+            'style="position:absolute;inset:0;width:100%;height:100%;object-fit:cover;z-index:-1">'
+        )
+    return image_markup
+
+
+def hero_image(hero):
+    """IMG_PATTERN match for the hero's cover image, or None.
+
+    Only the positioned image that replaced a background counts; a logo or
+    card thumbnail that happens to be the section's first <img> is not the hero.
+    """
+    match = IMG_PATTERN.search(hero)
+    if match and (attr(match.group('attrs'), 'style') or "").startswith(HERO_IMG_STYLE):
+        return match
+    return None
+
+
+def prioritize_first_image(hero):
+    """Mark the hero's cover image as high priority and never lazy"""
+    match = hero_image(hero)
+    if not match:
+        return hero
+
+    attrs = re.sub(r'\s*\bloading="lazy"', '', match.group('attrs'))
+    if 'fetchpriority=' not in attrs:
+        attrs = ' fetchpriority="high"' + attrs
+    start, end = match.span('attrs')
+    return hero[:start] + attrs + hero[end:]
+
+
+def preload_link(hero):
+    """<link rel=preload> matching the hero image (or CSS background), or None"""
+    match = hero_image(hero)
+    if match:
+        source, attrs = match.group('source'), match.group('attrs')
+        if source:
+            srcset, sizes, type_ = attr(source, 'srcset'), attr(source, 'sizes'), attr(source, 'type')
+        else:
+            srcset, sizes, type_ = attr(attrs, 'srcset'), attr(attrs, 'sizes'), None
+        href = attr(attrs, 'src')
+    else:
+        background = images.BACKGROUND_PATTERN.match(hero)
+        if not background:
+            return None
+        href, srcset, sizes, type_ = background.group(4), None, None, None
+
+    parts = ['<link rel="preload" as="image"', f'href="{html.escape(href)}"']
+    if srcset:
+        parts.append(f'imagesrcset="{html.escape(srcset)}"')
+        parts.append(f'imagesizes="{html.escape(sizes or "100vw")}"')
+    if type_:
+        parts.append(f'type="{type_}"')
+    parts.append('fetchpriority="high" data-hero-preload>')
+    return " ".join(parts)
+
+
+def preload_hero(content, variants, rewrite=True):
+    """Rewrite the hero (unless preload-only) and inject its preload link"""
+    match = find_hero(content)
+    if not match:
+        return content
+
+    hero = match.group(0)
+    if rewrite:
+        opening = images.BACKGROUND_PATTERN.match(hero)
+        if opening:
+            hero = images.background_to_img(opening, hero_image_markup(variants)) + hero[opening.end():]
+        link = preload_link(hero)
+        if link:
+            hero = prioritize_first_image(hero)
+        content = content[:match.start()] + hero + content[match.end():]
+
+    link = preload_link(hero)
+    content = PRELOAD_PATTERN.sub('', content)
+    if link:
+        content = content.replace('</head>', f'    {link}\n</head>', 1)
+    return content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Make hero images discoverable by the preload scanner")
+    parser.add_argument("--preload-only", action="store_true",
+                        help="keep CSS background heroes, only inject <link rel=preload>")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PRELOADABLE HERO IMAGES")
+    print("=" * 70)
+    print()
+
+    variants = load_variants()
+    print(f"Responsive variants available: {len(variants)}")
+    print()
+
+    updated = 0
+    for page in find_pages():
+        content = page.read_text(encoding='utf-8')
+        if write_if_changed(page, preload_hero(content, variants, rewrite=not args.preload_only)):
+            print(f"  ✓ {page}")
+            updated += 1
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {updated} pages updated")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Data-driven sedes and cursos sections
+1. Campuses, course types, photos and icons live in one data file
+   (site-data.json) instead of f-strings in create_sedes_grid(),
+   fix_sedes_page(), SEDES_PHOTOS and CURSOS_HEROES
+2. Sections are rendered through the templates/ directory; each template is
+   parsed once and cached by file version, so a render is a few dict lookups
+3. With a src/ tree (build-pages.py) the sections are written as partials
+   and the pages include them; without one the published pages are patched
+   in place on the same anchors the fix scripts use
+
+Adding a campus is a data change: append it to "campuses" and re-run.
+Data values are inserted as HTML (addresses use <br/> line breaks).
+"""
+
+import argparse
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+from site_pipeline import SCRIPTS_DIR, SITE_DATA_PATH, load_script, load_site_data, write_if_changed
+
+TEMPLATES_DIR = SCRIPTS_DIR / "templates"
+PAGES_DIR = Path("src/pages")
+PARTIALS_DIR = Path("src/partials")
+
+SEDES_PAGE = "sedes.html"
+# Sedes Grid: this script and complete-sedes-and-heroes.py; Sedes Section:
+# fix-sedes-direct.py; Locations: the original page fix-sedes-direct.py replaces
+SEDES_PATTERN = re.compile(
+    r'<!-- (?:Sedes Grid|Sedes Section|Locations) -->\s*<section\b.*?</section>|<!-- @include sedes-grid -->',
+    re.DOTALL
+)
+HERO_PATTERN = re.compile(r'<!-- Page Hero -->.*?</section>|<!-- @include (?:hero|cursos-hero-[\w-]+)\b.*?-->', re.DOTALL)
+
+ICON_INDENT = "\n" + " " * 20
+
+
+class RenderError(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def compile_template(path, mtime_ns):
+    """Parse a template once per file version (the mtime is part of the cache key)"""
+    return Template(Path(path).read_text(encoding='utf-8').rstrip("\n"))
+
+
+def render(template, **values):
+    path = TEMPLATES_DIR / f"{template}.html"
+    return compile_template(path, path.stat().st_mtime_ns).substitute(values)
+
+
+def render_campus(campus, data):
+    """One sede card: photo header, optional badge/notice and its detail rows"""
+    try:
+        details = "\n".join(
+            render("sede-detail",
+                   color=data["brand"]["pink"],
+                   icon=ICON_INDENT.join(data["icons"][detail["icon"]]),
+                   label=detail["label"],
+                   value=detail["value"])
+            for detail in campus["details"]
+        )
+        badge = render("sede-badge", text=campus["badge"]) + "\n" if campus.get("badge") else ""
+        notice = render("sede-notice", **campus["notice"]) + "\n" if campus.get("notice") else ""
+        return render("sede-card",
+                      name=campus["name"],
+                      location=campus["location"],
+                      photo=campus["photo"],
+                      card_class=" opacity-75" if campus.get("badge") else "",
+                      badge=badge,
+                      notice=notice,
+                      details=details)
+    except KeyError as e:
+        raise RenderError(f"campus '{campus.get('name', '?')}': missing {e}")
+
+
+def render_sections(data):
+    """Render every data-driven section; returns {partial name: markup}"""
+    cards = "\n\n".join(render_campus(campus, data) for campus in data["campuses"])
+    sections = {"sedes-grid": render("sedes-grid", cards=cards)}
+
+    for key, hero in data["course_types"].items():
+        try:
+            sections[f"cursos-hero-{key}"] = render("cursos-hero", **hero)
+        except KeyError as e:
+            raise RenderError(f"course type '{key}': missing {e}")
+
+    return sections
+
+
+def section_targets(data):
+    """Page → (anchor pattern, section name) for every placed section"""
+    targets = {SEDES_PAGE: (SEDES_PATTERN, "sedes-grid")}
+    for key in data["course_types"]:
+        targets[f"cursos/{key}.html"] = (HERO_PATTERN, f"cursos-hero-{key}")
+    return targets
+
+
+def place_sections(sections, targets, root, as_includes):
+    """Replace each anchored region with the section (or its include); returns pages changed"""
+    changed = []
+    for page, (pattern, name) in targets.items():
+        path = Path(root) / page
+        if not path.exists():
+            continue
+        content = path.read_text(encoding='utf-8')
+        if not pattern.search(content):
+            print(f"  ⚠ {path}: no anchor for {name}, skipped")
+            continue
+        replacement = f"<!-- @include {name} -->" if as_includes else sections[name]
+        if write_if_changed(path, pattern.sub(lambda m: replacement, content, count=1)):
+            changed.append(path)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render sedes and cursos sections from site data")
+    parser.add_argument("--data", default=SITE_DATA_PATH, help="site data file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("DATA-DRIVEN SECTIONS: SEDES + CURSOS")
+    print("=" * 70)
+    print()
+
+    data = load_site_data(args.data)
+    started = time.perf_counter()
+    try:
+        sections = render_sections(data)
+    except RenderError as e:
+        print(f"❌ Render failed: {e}")
+        raise SystemExit(1)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(f"Rendered {len(data['campuses'])} campuses, {len(data['course_types'])} course types "
+          f"in {elapsed:.1f} ms")
+    print()
+
+    targets = section_targets(data)
+    if PAGES_DIR.is_dir():
+        for name, markup in sections.items():
+            if write_if_changed(PARTIALS_DIR / f"{name}.html", markup + "\n"):
+                print(f"  ✓ partials/{name}.html")
+        for path in place_sections(sections, targets, PAGES_DIR, as_includes=True):
+            print(f"  ✓ {path}: now includes its section")
+
+        rebuilt = load_script("build-pages.py").build()
+        for page, reason in rebuilt.items():
+            print(f"  ✓ {page} ({reason})")
+        updated = len(rebuilt)
+    else:
+        changed = place_sections(sections, targets, ".", as_includes=False)
+        for path in changed:
+            print(f"  ✓ {path}")
+        updated = len(changed)
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {updated} pages updated")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Rule runner: apply the legacy content rules incrementally, optionally watching
+1. RULES registers the content → content functions of the fix-*.py scripts
+   with the pages each script targets, in the order they were run by hand
+2. A page is reprocessed only when its content or one of the scripts whose
+   rules apply to it changed since the last run (.build-cache/rules.json);
+   pages the runner wrote itself match their recorded hash and are skipped
+3. --watch keeps running and reacts to filesystem events (inotify via ctypes
+   on Linux, mtime polling elsewhere), debouncing bursts of saves:
+   - a published page        → that page
+   - src/pages/<page>        → build-pages.py rebuilds it, then its rules
+   - src/partials/<partial>  → every page that includes the partial
+   - a rule script           → the script is reloaded, its pages reprocessed
+4. Every rewritten page is re-tokenized (validate-html.py); output that
+   gains unbalanced tags, duplicate attributes or unclosed quotes is not
+   written and fails the batch
+"""
+
+import argparse
+import contextlib
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from site_pipeline import (
+    SCRIPTS_DIR, content_hash, file_hash, find_pages, load_cache, load_script, save_cache,
+    write_if_changed,
+)
+
+validator = load_script("validate-html.py")
+
+# rule name → (script, functions applied in order, pages)
+# pages: name of the script's page list, an explicit tuple, or None for every page
+#
+# Left out until they merge into an existing style="" instead of adding a
+# second one (the validator rejects the page): fix_bg_classes
+# (fix-tailwind-custom-colors.py) and fix_blue_to_pink_colors
+# (standardize-blog-ciclos.py)
+RULES = {
+    "empleo-links-and-logos": ("fix-all-issues.py", (
+        "fix_duplicated_empleo_links", "add_agencia_empleo_link", "replace_header_logo",
+        "add_footer_logo_with_circle", "remove_agencia_colocacion",
+    ), "HTML_FILES"),
+    "menu-empleo": ("fix-menu-empleo.py", (
+        "remove_agencia_empleo_from_menu", "add_empleo_to_footer",
+    ), "HTML_FILES"),
+    "tailwind-custom-colors": ("fix-tailwind-custom-colors.py", (
+        "fix_gradient_classes", "fix_hover_classes",
+    ), "HTML_FILES"),
+    "hero-footer-colors": ("fix-hero-footer-colors.py", (
+        "fix_duplicate_styles", "fix_footer_background",
+    ), None),
+    "cta-section": ("fix-cta-section.py", ("fix_cta_section",), "HTML_FILES"),
+    "blog-ciclos-colors": ("standardize-blog-ciclos.py", (
+        "fix_filter_buttons", "fix_badges_to_consistent_colors",
+    ), ("blog.html", "ciclos.html")),
+    "overlay-opacity": ("fix-all-heroes-and-sedes.py", ("reduce_overlay_opacity",), (
+        "blog.html", "ciclos.html", "cursos.html", "sobre-nosotros.html", "sedes.html",
+    )),
+}
+
+SRC_PAGES_DIR = Path("src/pages")
+SRC_PARTIALS_DIR = Path("src/partials")
+
+DEBOUNCE = 0.1        # seconds of quiet that end a burst of events
+POLL_INTERVAL = 0.2   # mtime polling fallback
+IGNORED_DIRS = (".", "backup_", "node_modules", "dist", "image-mirror", "__pycache__")
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class RuleRunner:
+    """Applies the registered rules to pages, tracking what each page last saw"""
+
+    def __init__(self, rules=RULES):
+        self.rules = rules
+        self.modules = {}
+        self.script_hashes = {}
+        for script in {script for script, _, _ in rules.values()}:
+            self.load(script)
+        self.state = load_cache("rules")
+        self.failed = {}
+
+    def load(self, script):
+        self.modules[script] = load_script(script)
+        self.script_hashes[script] = file_hash(SCRIPTS_DIR / script, 12)
+
+    def pages_for(self, name):
+        """Pages a rule applies to (None: every page)"""
+        script, _, pages = self.rules[name]
+        if isinstance(pages, str):
+            return set(getattr(self.modules[script], pages))
+        return set(pages) if pages is not None else None
+
+    def rules_for(self, page):
+        names = []
+        for name in self.rules:
+            pages = self.pages_for(name)
+            if pages is None or page in pages:
+                names.append(name)
+        return names
+
+    def affected_pages(self, script):
+        """Published pages touched by any rule from a script"""
+        pages = set()
+        for name, (rule_script, _, _) in self.rules.items():
+            if rule_script == script:
+                targets = self.pages_for(name)
+                pages |= {p.as_posix() for p in find_pages()} if targets is None else targets
+        return pages
+
+    def apply(self, names, content):
+        """Run the rules over content; returns (content, names of rules that changed it)"""
+        changed = []
+        for name in names:
+            script, functions, _ = self.rules[name]
+            before = content
+            # the rule functions print their own progress lines; keep the runner output readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                for function in functions:
+                    content = getattr(self.modules[script], function)(content)
+            if content != before:
+                changed.append(name)
+        return content, changed
+
+    def process(self, page, force=False):
+        """Bring one page up to date; returns the rules that changed it, or None if skipped"""
+        path = Path(page)
+        if not path.is_file():
+            return None
+
+        names = self.rules_for(page)
+        if not names:
+            return None
+
+        content = path.read_text(encoding='utf-8')
+        signature = {self.rules[name][0]: self.script_hashes[self.rules[name][0]] for name in names}
+        entry = self.state.get(page)
+        if not force and entry and entry["output"] == content_hash(content) and entry["rules"] == signature:
+            return None
+
+        try:
+            new_content, changed = self.apply(names, content)
+        except Exception as e:
+            self.failed[page] = [str(e)]
+            return None
+
+        issues = validator.new_issues(content, new_content) if new_content != content else []
+        if issues:
+            # leave the page and its state alone so it is retried after the rule is fixed
+            self.failed[page] = [f"line {line}: {kind}: {detail}" for kind, detail, line in issues]
+            return None
+
+        write_if_changed(path, new_content)
+        self.state[page] = {"output": content_hash(new_content), "rules": signature}
+        # rules can undo each other (add_agencia_empleo_link / remove_agencia_empleo_from_menu)
+        return changed if new_content != content else []
+
+    def run(self, pages, force=False):
+        """Process pages; returns {page: changed rules} for pages that were (re)processed.
+        Pages whose rules failed or broke the markup are left in self.failed"""
+        results = {}
+        self.failed = {}
+        for page in sorted(pages):
+            changed = self.process(page, force)
+            if changed is not None:
+                results[page] = changed
+        save_cache("rules", self.state)
+        return results
+
+
+class InotifyWatcher:
+    """Recursive directory watch on top of the raw Linux inotify syscalls"""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, directories):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        for directory in directories:
+            self.add_tree(directory)
+
+    def add_tree(self, directory):
+        for path in watched_dirs(directory):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+            if wd >= 0:
+                self.watches[wd] = path
+
+    def poll(self, timeout):
+        """Changed paths within timeout seconds (None blocks); a None entry means rescan"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = os.read(self.fd, 64 * 1024)
+        paths = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b"\0")
+            offset += INOTIFY_EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                paths.add(None)
+                continue
+            if wd not in self.watches or not name:
+                continue
+            path = self.watches[wd] / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if not path.name.startswith(IGNORED_DIRS):
+                    self.add_tree(path)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                paths.add(path)
+        return paths
+
+
+class PollingWatcher:
+    """mtime-polling fallback where inotify is not available"""
+
+    def __init__(self, directories):
+        self.directories = directories
+        self.mtimes = self.scan()
+
+    def scan(self):
+        mtimes = {}
+        for directory in self.directories:
+            for path in watched_dirs(directory):
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            mtimes[Path(entry.path)] = entry.stat().st_mtime_ns
+        return mtimes
+
+    def poll(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(POLL_INTERVAL if timeout is None else min(POLL_INTERVAL, timeout))
+            mtimes = self.scan()
+            paths = {path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime}
+            self.mtimes = mtimes
+            if paths or (deadline is not None and time.monotonic() >= deadline):
+                return paths
+
+
+def watched_dirs(root):
+    """root and every directory below it that can hold pages, sources or rules"""
+    root = Path(root)
+    dirs = [root]
+    for current, subdirs, _ in os.walk(root):
+        subdirs[:] = [d for d in subdirs if not d.startswith(IGNORED_DIRS)]
+        dirs.extend(Path(current) / d for d in subdirs)
+    return dirs
+
+
+def wait_for_changes(watcher):
+    """Block until something changes, then collect events until DEBOUNCE of quiet"""
+    paths = watcher.poll(None)
+    while True:
+        more = watcher.poll(DEBOUNCE)
+        if not more:
+            return paths
+        paths |= more
+
+
+def classify(paths, runner):
+    """Split changed paths into (published pages, src pages, partials, rule scripts)"""
+    root = Path.cwd()
+    rule_scripts = {script for script, _, _ in runner.rules.values()}
+    pages, sources, partials, scripts = set(), set(), set(), set()
+
+    for path in paths:
+        path = path.resolve()
+        if path.parent == SCRIPTS_DIR:
+            if path.name in rule_scripts:
+                scripts.add(path.name)
+            continue
+        if path.suffix != ".html":
+            continue
+        try:
+            relative = path.relative_to(root)
+        except ValueError:
+            continue
+        if relative.parent == SRC_PARTIALS_DIR:
+            partials.add(relative.stem)
+        elif SRC_PAGES_DIR in relative.parents:
+            sources.add(relative.relative_to(SRC_PAGES_DIR).as_posix())
+        elif not any(part.startswith(IGNORED_DIRS + ("src",)) for part in relative.parts[:-1]):
+            pages.add(relative.as_posix())
+
+    return pages, sources, partials, scripts
+
+
+def handle_changes(runner, paths):
+    """Reprocess everything a batch of changed paths affects"""
+    if None in paths:
+        print("  ⚠ event queue overflowed, rescanning every page")
+        return runner.run({page.as_posix() for page in find_pages()})
+
+    pages, sources, partials, scripts = classify(paths, runner)
+
+    for script in scripts:
+        runner.load(script)
+        print(f"  ↻ {script} reloaded")
+        pages |= runner.affected_pages(script)
+
+    if sources or partials:
+        build_pages = load_script("build-pages.py")
+        targets = set(sources)
+        for partial in partials:
+            targets.update(build_pages.dependents(load_cache("pages"), partial))
+        try:
+            pages |= set(build_pages.build(targets))
+        except build_pages.BuildError as e:
+            print(f"  ❌ Build failed: {e}")
+
+    return runner.run(pages)
+
+
+def report(results, failed):
+    for page, changed in results.items():
+        print(f"  ✓ {page}: {', '.join(changed) if changed else 'no rule changes'}")
+    for page, problems in failed.items():
+        print(f"  ❌ {page}: not written")
+        for problem in problems:
+            print(f"       {problem}")
+
+
+def watch(runner, use_inotify=True):
+    directories = [Path.cwd()]
+    if Path.cwd() not in SCRIPTS_DIR.parents and SCRIPTS_DIR != Path.cwd():
+        directories.append(SCRIPTS_DIR)
+
+    watcher = None
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"⚠ inotify unavailable ({e}), polling every {POLL_INTERVAL}s")
+    if watcher is None:
+        watcher = PollingWatcher(directories)
+
+    print(f"Watching {', '.join(str(d) for d in directories)} (Ctrl+C to stop)")
+    print("-" * 70)
+    while True:
+        paths = wait_for_changes(watcher)
+        started = time.perf_counter()
+        results = handle_changes(runner, paths)
+        if results or runner.failed:
+            report(results, runner.failed)
+            print(f"  ⏱ {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the legacy content rules incrementally")
+    parser.add_argument("--watch", action="store_true", help="keep running and reprocess on changes")
+    parser.add_argument("--poll", action="store_true", help="watch by polling mtimes instead of inotify")
+    parser.add_argument("--force", action="store_true", help="reprocess pages even if unchanged")
+    parser.add_argument("pages", nargs="*", help="only process these pages")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LEGACY RULE RUNNER" + (" (WATCH MODE)" if args.watch else ""))
+    print("=" * 70)
+    print()
+
+    runner = RuleRunner()
+    pages = set(args.pages) or {page.as_posix() for page in find_pages()}
+    results = runner.run(pages, force=args.force)
+    report(results, runner.failed)
+    print()
+    print(f"✅ {len(results)} pages processed, {len(pages) - len(results) - len(runner.failed)} up to date")
+    if runner.failed:
+        print(f"❌ {len(runner.failed)} pages failed")
+    print()
+
+    if args.watch:
+        try:
+            watch(runner, use_inotify=not args.poll)
+        except KeyboardInterrupt:
+            save_cache("rules", runner.state)
+            print()
+            print("Stopped watching")
+    elif runner.failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
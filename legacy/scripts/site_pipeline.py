@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the legacy site build stages.
+
+The stage scripts in this directory run from the nginx html root (the same
+working directory the fix-*.py scripts expect) and import this module for
+page discovery, content hashing and loading the hyphenated fix scripts.
+"""
+
+import hashlib
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Structured campus / course type / image data the sections are rendered from
+SITE_DATA_PATH = SCRIPTS_DIR / "site-data.json"
+
+# Per-site cache of indexes (image dimensions, page hashes, link graph...)
+CACHE_DIR = Path(".build-cache")
+
+# Directories in the html root that are never part of the published corpus
+# (deploy-frontend-server.sh leaves backup_YYYYMMDD_HHMMSS copies behind)
+EXCLUDED_DIRS = ("backup_", ".build-cache", "node_modules", "dist", "src")
+
+
+def find_pages(root="."):
+    """Return every published HTML page under root, sorted by path"""
+    root = Path(root)
+    pages = []
+    for path in sorted(root.rglob("*.html")):
+        parts = path.relative_to(root).parts[:-1]
+        if any(part.startswith(EXCLUDED_DIRS) for part in parts):
+            continue
+        pages.append(path)
+    return pages
+
+
+def write_if_changed(path, content):
+    """Write content to path only if it differs, so mtimes stay meaningful"""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def content_hash(data, length=None):
+    """sha256 hex digest of str/bytes content, optionally truncated"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    return digest[:length] if length else digest
+
+
+def file_hash(path, length=None):
+    """sha256 hex digest of a file's bytes, optionally truncated"""
+    return content_hash(Path(path).read_bytes(), length)
+
+
+def load_script(filename):
+    """Import one of the hyphenated scripts in this directory as a module"""
+    path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    # registered so worker processes can unpickle functions defined in it
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_site_data(path=SITE_DATA_PATH):
+    """Load the structured site data (campuses, course types, icons)"""
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def load_cache(name):
+    """Load a JSON index from the build cache (empty dict if missing or corrupt)"""
+    path = CACHE_DIR / f"{name}.json"
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(name, data):
+    """Persist a JSON index to the build cache"""
+    write_if_changed(CACHE_DIR / f"{name}.json", json.dumps(data, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Golden-corpus snapshot tests for the legacy content rules
+1. Run every rule registered in run-rules.py (and the full chain, as the
+   runner applies it) over the fixed pages in golden/corpus/, in parallel
+   worker processes
+2. Compare each output's hash with golden/hashes.json; only a mismatch
+   pays for a diff: the change the rule makes now is diffed against the
+   change recorded in golden/patches/<rule>/<page>.diff
+3. --update accepts the current behaviour as the new golden state
+
+The corpus is the pages deploy-frontend-server.sh writes plus the blog and
+ciclos pages from legacy/backups, so fix_blue_to_pink_colors(),
+fix_cta_section() and the other rules all see the markup they target.
+"""
+
+import argparse
+import difflib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from site_pipeline import SCRIPTS_DIR, content_hash, load_script, write_if_changed
+
+rules = load_script("run-rules.py")
+
+GOLDEN_DIR = SCRIPTS_DIR / "golden"
+CORPUS_DIR = GOLDEN_DIR / "corpus"
+PATCHES_DIR = GOLDEN_DIR / "patches"
+HASHES_PATH = GOLDEN_DIR / "hashes.json"
+
+# Snapshot of every applicable rule in registry order, as run-rules.py runs them
+CHAIN = "all-rules"
+
+runner = None
+
+
+def init_worker():
+    global runner
+    runner = rules.RuleRunner()
+
+
+def change_patch(source, output, rule, page):
+    """The change a rule made to a corpus page, as a unified diff"""
+    return "".join(difflib.unified_diff(
+        source.splitlines(keepends=True), output.splitlines(keepends=True),
+        f"corpus/{page}", f"{rule}/{page}", n=2,
+    ))
+
+
+def snapshot(rule, page, expected_hash):
+    """Worker: run a rule (or the chain) over a corpus page.
+    Returns (rule, page, output hash, patch); the patch is only built when the hash differs"""
+    source = (CORPUS_DIR / page).read_text(encoding='utf-8')
+    names = runner.rules_for(page) if rule == CHAIN else [rule]
+    output, _ = runner.apply(names, source)
+    digest = content_hash(output)
+    if digest == expected_hash:
+        return rule, page, digest, None
+    return rule, page, digest, change_patch(source, output, rule, page)
+
+
+def snapshot_jobs(selected):
+    """(rule, page) pairs: each rule over the corpus pages it targets"""
+    targeting = rules.RuleRunner()
+    pages = sorted(path.name for path in CORPUS_DIR.glob("*.html"))
+    jobs = []
+    for page in pages:
+        applicable = targeting.rules_for(page)
+        for rule in applicable + ([CHAIN] if applicable else []):
+            if not selected or rule in selected:
+                jobs.append((rule, page))
+    return jobs
+
+
+def patch_path(rule, page):
+    return PATCHES_DIR / rule / f"{page}.diff"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the legacy rules against the golden corpus")
+    parser.add_argument("--update", action="store_true", help="record current outputs as the golden state")
+    parser.add_argument("--rule", action="append", choices=sorted(rules.RULES) + [CHAIN],
+                        help="only check this rule (repeatable)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("GOLDEN-CORPUS RULE SNAPSHOTS" + (" (UPDATING)" if args.update else ""))
+    print("=" * 70)
+    print()
+
+    hashes = json.loads(HASHES_PATH.read_text(encoding='utf-8')) if HASHES_PATH.exists() else {}
+    jobs = snapshot_jobs(set(args.rule or ()))
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker) as pool:
+        futures = [
+            pool.submit(snapshot, rule, page, None if args.update else hashes.get(f"{rule}/{page}"))
+            for rule, page in jobs
+        ]
+        results = []
+        for (rule, page), future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append((rule, page, None, f"{type(e).__name__}: {e}"))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    failed = 0
+    for rule, page, digest, patch in results:
+        key = f"{rule}/{page}"
+        if digest is None:
+            failed += 1
+            print(f"  ❌ {key}: rule raised {patch}")
+            continue
+
+        if args.update:
+            if hashes.get(key) != digest:
+                print(f"  ✓ {key}: recorded")
+            hashes[key] = digest
+            path = patch_path(rule, page)
+            if patch:
+                write_if_changed(path, patch)
+            elif path.exists():
+                path.unlink()
+            continue
+
+        if patch is None:
+            continue
+
+        failed += 1
+        if key not in hashes:
+            print(f"  ❌ {key}: no snapshot recorded (run with --update)")
+            continue
+
+        path = patch_path(rule, page)
+        expected = path.read_text(encoding='utf-8') if path.exists() else ""
+        print(f"  ❌ {key}: output changed")
+        for line in difflib.unified_diff(expected.splitlines(), patch.splitlines(),
+                                         "recorded change", "current change", lineterm=""):
+            print(f"       {line}")
+
+    if args.update:
+        current = {f"{rule}/{page}" for rule, page in jobs}
+        for key in sorted(set(hashes) - current):
+            if args.rule and key.split("/", 1)[0] not in args.rule:
+                continue
+            del hashes[key]
+            rule, page = key.split("/", 1)
+            if patch_path(rule, page).exists():
+                patch_path(rule, page).unlink()
+            print(f"  - {key}: removed (rule or page no longer exists)")
+        write_if_changed(HASHES_PATH, json.dumps(dict(sorted(hashes.items())), indent=2) + "\n")
+
+    print()
+    print("=" * 70)
+    if args.update:
+        print(f"✅ {len(results)} snapshots recorded")
+    elif failed:
+        print(f"❌ {failed} of {len(results)} snapshots differ")
+    else:
+        print(f"✅ {len(results)} snapshots match")
+    print(f"{elapsed:.0f} ms")
+    print("=" * 70)
+
+    if failed and not args.update:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
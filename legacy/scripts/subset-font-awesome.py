@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Font Awesome subsetting:
+1. Scan every page for the fa-* icon classes actually in use
+2. Build a local SVG sprite with only those glyphs
+3. Rewrite <i class="fas fa-..."> icons to <svg><use href="..."></svg>
+4. Drop the third-party Font Awesome stylesheet/kit from the <head>
+
+Glyphs that pages already reference through <use> (rewritten by an earlier
+run, possibly pointing at the fingerprinted sprite from asset-manifest.json)
+and symbols already in the sprite are kept, so re-running after adding a
+page or after fingerprint-assets.py never drops them.
+
+Glyph sources come from the free SVG set shipped in the npm package
+(node_modules/@fortawesome/fontawesome-free/svgs), or any directory with
+the same solid/regular/brands layout passed with --svgs.
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from site_pipeline import find_pages, write_if_changed
+
+FA_SVGS_DIR = "node_modules/@fortawesome/fontawesome-free/svgs"
+SPRITE_PATH = "icons/fa-sprite.svg"
+SPRITE_URL = "/" + SPRITE_PATH
+MANIFEST_PATH = "asset-manifest.json"
+
+# Style prefixes (FA4/FA5 short form and FA6 long form) → svgs subdirectory
+STYLE_PREFIXES = {
+    "fa": "solid",
+    "fas": "solid",
+    "far": "regular",
+    "fab": "brands",
+    "fa-solid": "solid",
+    "fa-regular": "regular",
+    "fa-brands": "brands",
+}
+
+# fa-* classes that modify an icon instead of naming a glyph
+MODIFIER_PATTERN = re.compile(
+    r'^fa-(?:\d*x|[0-9]?xs|sm|lg|[0-9]?xl|fw|spin|pulse|beat|fade|bounce|shake|flip|'
+    r'border|inverse|li|ul|stack(?:-\dx)?|pull-(?:left|right)|'
+    r'rotate-\w+|flip-\w+)$'
+)
+
+# FA5 names that were renamed in the FA6 free SVG set
+GLYPH_ALIASES = {
+    "search": "magnifying-glass",
+    "times": "xmark",
+    "map-marker-alt": "location-dot",
+    "phone-alt": "phone-flip",
+    "sign-in-alt": "right-to-bracket",
+    "external-link-alt": "up-right-from-square",
+    "heartbeat": "heart-pulse",
+}
+
+SYMBOL_PATTERN = re.compile(r'<symbol id="([^"]+)" viewBox="([^"]+)">(.*?)</symbol>', re.DOTALL)
+SYMBOL_ID_PATTERN = re.compile(r'^fa-(solid|regular|brands)-([\w-]+)$')
+ICON_PATTERN = re.compile(r'<i\s+([^>]*?\bclass="([^"]*\bfa-[^"]*)"[^>]*)>\s*</i>')
+FA_ASSET_PATTERN = re.compile(
+    r'\s*<(?:link[^>]+href|script[^>]+src)="[^"]*(?:font-?awesome|kit\.fontawesome\.com)[^"]*"[^>]*>(?:\s*</script>)?',
+    re.IGNORECASE
+)
+
+SUBSET_CSS = (
+    '<style data-fa-subset>'
+    '.fa-icon{display:inline-block;width:1em;height:1em;vertical-align:-.125em;fill:currentColor;overflow:visible}'
+    '.fa-icon.fa-fw{width:1.25em}.fa-icon.fa-lg{font-size:1.25em}'
+    '.fa-icon.fa-2x{font-size:2em}.fa-icon.fa-3x{font-size:3em}'
+    '</style>'
+)
+
+
+def parse_icon_classes(class_value):
+    """Split a class attribute into (style, glyph, modifiers, other classes)"""
+    style = "solid"
+    glyph = None
+    modifiers = []
+    other = []
+
+    for cls in class_value.split():
+        if cls in STYLE_PREFIXES:
+            style = STYLE_PREFIXES[cls]
+        elif cls.startswith("fa-") and MODIFIER_PATTERN.match(cls):
+            modifiers.append(cls)
+        elif cls.startswith("fa-") and glyph is None:
+            glyph = cls[3:]
+        else:
+            other.append(cls)
+
+    return style, glyph, modifiers, other
+
+
+def sprite_urls(manifest_path=MANIFEST_PATH):
+    """URLs pages may use for the sprite: the plain one and its fingerprinted name"""
+    urls = [SPRITE_URL]
+    path = Path(manifest_path)
+    if path.exists():
+        fingerprinted = json.loads(path.read_text(encoding='utf-8')).get(SPRITE_URL)
+        if fingerprinted:
+            urls.append(fingerprinted)
+    return urls
+
+
+def use_pattern(urls):
+    """<use href> references to any of the sprite URLs"""
+    alternatives = "|".join(re.escape(url) for url in urls)
+    return re.compile(r'<use href="(?:' + alternatives + r')#fa-(solid|regular|brands)-([\w-]+)"')
+
+
+def scan_icons(pages, urls=(SPRITE_URL,)):
+    """Collect every (style, glyph) pair used across the corpus, as <i> icons
+    or as <use> references to the sprite"""
+    used = set()
+    references = use_pattern(urls)
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        for match in ICON_PATTERN.finditer(content):
+            style, glyph, _, _ = parse_icon_classes(match.group(2))
+            if glyph:
+                used.add((style, glyph))
+        used.update(references.findall(content))
+    return used
+
+
+def read_sprite(path=SPRITE_PATH):
+    """Symbols of the existing sprite: {id: (viewBox, body)}"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return {sid: (view_box, body) for sid, view_box, body in SYMBOL_PATTERN.findall(path.read_text(encoding='utf-8'))}
+
+
+def load_glyph(svgs_dir, style, glyph):
+    """Return (viewBox, inner markup) for a glyph, or None if it is not available"""
+    for name in (glyph, GLYPH_ALIASES.get(glyph)):
+        if not name:
+            continue
+        path = Path(svgs_dir) / style / f"{name}.svg"
+        if path.exists():
+            svg = path.read_text(encoding='utf-8')
+            view_box = re.search(r'viewBox="([^"]+)"', svg)
+            inner = re.search(r'<svg[^>]*>(.*)</svg>', svg, re.DOTALL)
+            if view_box and inner:
+                body = re.sub(r'<!--.*?-->', '', inner.group(1), flags=re.DOTALL).strip()
+                return view_box.group(1), body
+    return None
+
+
+def symbol_id(style, glyph):
+    """Sprite symbol id for a glyph"""
+    return f"fa-{style}-{glyph}"
+
+
+def build_sprite(used, svgs_dir, existing=None):
+    """Build the sprite document; returns (sprite markup, set of resolved glyphs).
+    Glyphs missing from svgs_dir fall back to their symbol in the existing sprite."""
+    symbols = []
+    resolved = set()
+    existing = existing or {}
+
+    for style, glyph in sorted(used):
+        loaded = load_glyph(svgs_dir, style, glyph) or existing.get(symbol_id(style, glyph))
+        if not loaded:
+            print(f"  ⚠ Glyph not found: {style}/{glyph} (left as <i> icon)")
+            continue
+        view_box, body = loaded
+        symbols.append(f'<symbol id="{symbol_id(style, glyph)}" viewBox="{view_box}">{body}</symbol>')
+        resolved.add((style, glyph))
+
+    sprite = (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">\n'
+        + "\n".join(symbols)
+        + '\n</svg>\n'
+    )
+    return sprite, resolved
+
+
+def rewrite_icons(content, resolved):
+    """Replace resolved <i> icons with sprite references; returns (content, replaced count)"""
+    replaced = 0
+
+    def replace_icon(match):
+        nonlocal replaced
+        style, glyph, modifiers, other = parse_icon_classes(match.group(2))
+        if (style, glyph) not in resolved:
+            return match.group(0)
+
+        attrs = re.sub(r'\s*\bclass="[^"]*"', '', match.group(1)).strip()
+        if 'aria-hidden' not in attrs:
+            attrs = (attrs + ' aria-hidden="true"').strip()
+        classes = " ".join(["fa-icon"] + modifiers + other)
+
+        replaced += 1
+        return (
+            f'<svg class="{classes}" {attrs}>'
+            f'<use href="{SPRITE_URL}#{symbol_id(style, glyph)}"></use></svg>'
+        )
+
+    content = ICON_PATTERN.sub(replace_icon, content)
+    return content, replaced
+
+
+def subset_page(content, resolved):
+    """Rewrite icons and swap the Font Awesome stylesheet for the inline subset CSS"""
+    content, replaced = rewrite_icons(content, resolved)
+
+    remaining = any(
+        parse_icon_classes(m.group(2))[1] for m in ICON_PATTERN.finditer(content)
+    )
+    if not remaining:
+        content = FA_ASSET_PATTERN.sub('', content)
+
+    if replaced and 'data-fa-subset' not in content:
+        content = content.replace('</head>', f'    {SUBSET_CSS}\n</head>', 1)
+
+    return content, replaced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Subset Font Awesome to the glyphs in use")
+    parser.add_argument("--svgs", default=FA_SVGS_DIR, help="Font Awesome svgs/ directory")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("FONT AWESOME SUBSETTING")
+    print("=" * 70)
+    print()
+
+    pages = find_pages()
+    used = scan_icons(pages, sprite_urls())
+    print(f"Icons in use: {len(used)} across {len(pages)} pages")
+    for style, glyph in sorted(used):
+        print(f"  • {style}/{glyph}")
+    print()
+
+    if not used:
+        print("✅ No Font Awesome icons found, nothing to do")
+        return
+
+    existing = read_sprite()
+    # symbols already in the sprite stay even if no page references them directly
+    kept = {match.groups() for match in map(SYMBOL_ID_PATTERN.match, existing) if match}
+    sprite, resolved = build_sprite(used | kept, args.svgs, existing)
+    if write_if_changed(SPRITE_PATH, sprite):
+        print(f"  ✓ Wrote {SPRITE_PATH} ({len(resolved)} symbols, {len(sprite.encode())} bytes)")
+    print()
+
+    updated = 0
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        new_content, replaced = subset_page(content, resolved)
+        if write_if_changed(page, new_content):
+            print(f"  ✓ {page}: {replaced} icons")
+            updated += 1
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETED: {updated} pages updated, {len(used - resolved)} glyphs unresolved")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+// Generated by generate-service-worker.py - do not edit by hand.
+// Version $version: changes whenever a precached page or asset changes.
+const VERSION = "$version";
+const IMMUTABLE_CACHE = "cep-immutable";
+const PAGES_CACHE = "cep-pages-" + VERSION;
+
+// Fingerprinted assets (name.<hash>.ext): never change, cache-first forever
+const IMMUTABLE_ASSETS = $assets;
+
+// Fingerprinted assets too large to precache: cached on first use, kept while still current
+const RUNTIME_ASSETS = $runtime_assets;
+
+// Pages: served stale-while-revalidate, precached for offline use
+const PAGES = $pages;
+
+const FINGERPRINTED = /\.[0-9a-f]{$hash_length}\.[a-z0-9]+$$/;
+
+// "/contacto.html", "/cursos/" and "/cursos/index.html" share one cache entry
+function pageKey(url) {
+  let path = url.pathname.replace(/\/index\.html$$|\.html$$|\/$$/, "");
+  return path || "/";
+}
+
+self.addEventListener("install", (event) => {
+  event.waitUntil((async () => {
+    const immutable = await caches.open(IMMUTABLE_CACHE);
+    const cached = new Set((await immutable.keys()).map((request) => new URL(request.url).pathname));
+    await immutable.addAll(IMMUTABLE_ASSETS.filter((path) => !cached.has(path)));
+    const pages = await caches.open(PAGES_CACHE);
+    await pages.addAll(PAGES);
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil((async () => {
+    for (const name of await caches.keys()) {
+      if (name.startsWith("cep-pages-") && name !== PAGES_CACHE) {
+        await caches.delete(name);
+      }
+    }
+    // Drop fingerprinted assets no longer referenced by the current build
+    const keep = new Set([...IMMUTABLE_ASSETS, ...RUNTIME_ASSETS]);
+    const immutable = await caches.open(IMMUTABLE_CACHE);
+    for (const request of await immutable.keys()) {
+      if (!keep.has(new URL(request.url).pathname)) {
+        await immutable.delete(request);
+      }
+    }
+    await self.clients.claim();
+  })());
+});
+
+async function cacheFirst(request) {
+  const cache = await caches.open(IMMUTABLE_CACHE);
+  const cached = await cache.match(request, { ignoreSearch: true });
+  if (cached) {
+    return cached;
+  }
+  const response = await fetch(request);
+  if (response.ok) {
+    cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function staleWhileRevalidate(event, url) {
+  const cache = await caches.open(PAGES_CACHE);
+  const key = pageKey(url);
+  const cached = await cache.match(key);
+  const network = fetch(event.request).then((response) => {
+    if (response.ok && !response.redirected) {
+      cache.put(key, response.clone());
+    }
+    return response;
+  });
+
+  if (cached) {
+    event.waitUntil(network.catch(() => undefined));
+    return cached;
+  }
+  try {
+    return await network;
+  } catch (error) {
+    return (await cache.match("/")) || Response.error();
+  }
+}
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (request.method !== "GET" || url.origin !== self.location.origin) {
+    return;
+  }
+
+  if (FINGERPRINTED.test(url.pathname)) {
+    event.respondWith(cacheFirst(request));
+  } else if (request.mode === "navigate" || (request.headers.get("accept") || "").includes("text/html")) {
+    event.respondWith(staleWhileRevalidate(event, url));
+  }
+});
@@ -0,0 +1,29 @@
+"""
+The stage scripts run from the html root and import site_pipeline from the
+scripts directory; tests load them the same way inside a temporary site.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from site_pipeline import load_script  # noqa: E402
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """Empty html root as the working directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def run_script(monkeypatch):
+    """Run a script's main() with the given command-line arguments"""
+    def run(filename, *args):
+        monkeypatch.setattr(sys, "argv", [filename, *args])
+        load_script(filename).main()
+    return run
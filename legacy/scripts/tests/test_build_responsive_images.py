@@ -0,0 +1,34 @@
+from site_pipeline import load_script
+
+images = load_script("build-responsive-images.py")
+
+INDEX = {
+    "hero.jpg": {
+        "hash": "0123456789", "width": 1920, "height": 1080,
+        "variants": {"webp": [[480, "/img/hero-480w.webp"], [1280, "/img/hero-1280w.webp"]]},
+    },
+}
+
+
+def opening_style(html):
+    return html.split('style="', 1)[1].split('"', 1)[0]
+
+
+def test_shorthand_rest_is_dropped_and_later_declarations_kept():
+    html = (
+        '<section class="py-16 text-white" style="background: linear-gradient(rgba(0, 0, 0, 0.5), '
+        'rgba(242, 1, 75, 0.7)), url(\'/hero.jpg\') center/cover no-repeat; min-height: 400px; '
+        'background-attachment: fixed">'
+    )
+
+    rewritten = images.rewrite_backgrounds(html, INDEX)
+
+    assert opening_style(rewritten) == "position:relative;isolation:isolate;overflow:hidden;min-height: 400px"
+
+
+def test_background_only_style():
+    html = '<div class="bg-cover bg-center h-48" style="background-image: url(\'/hero.jpg\')">'
+
+    rewritten = images.rewrite_backgrounds(html, INDEX)
+
+    assert rewritten.startswith('<div class="h-48" style="position:relative;isolation:isolate;overflow:hidden">')
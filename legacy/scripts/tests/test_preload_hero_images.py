@@ -0,0 +1,33 @@
+from site_pipeline import load_script
+
+preload = load_script("preload-hero-images.py")
+
+HEAD = '<html><head><title>x</title></head><body><header><nav></nav></header>\n'
+
+
+def test_background_hero_gets_priority_and_preload():
+    page = HEAD + (
+        '<section class="py-16 text-white" style="background: linear-gradient(rgba(0, 0, 0, 0.5), '
+        'rgba(0, 0, 0, 0.5)), url(\'/hero.jpg\') center/cover no-repeat"><h1>Cursos</h1></section>\n'
+        '</body></html>'
+    )
+
+    content = preload.preload_hero(page, {})
+
+    assert '<link rel="preload" as="image" href="/hero.jpg" fetchpriority="high" data-hero-preload>' in content
+    assert content.count('fetchpriority="high"') == 2
+
+
+def test_section_without_hero_image_is_left_alone():
+    page = HEAD + (
+        '<section class="py-16"><div class="card">'
+        '<img src="/cep-logo.png" alt="CEP" loading="lazy">'
+        '<img src="/thumb.jpg" alt=""></div></section>\n'
+        '</body></html>'
+    )
+
+    content = preload.preload_hero(page, {})
+
+    assert content == page
+    assert "fetchpriority" not in content
+    assert "data-hero-preload" not in content
@@ -0,0 +1,34 @@
+import shutil
+
+from site_pipeline import SCRIPTS_DIR, load_site_data
+
+CORPUS = SCRIPTS_DIR / "golden" / "corpus"
+
+
+def test_renders_sedes_into_the_published_sedes_page(site, run_script):
+    shutil.copy(CORPUS / "sedes.html", site / "sedes.html")
+
+    run_script("render-sections.py")
+
+    content = (site / "sedes.html").read_text(encoding='utf-8')
+    assert content.count("<!-- Sedes Grid -->") == 1
+    assert "<!-- Locations -->" not in content
+    for campus in load_site_data()["campuses"]:
+        assert campus["name"] in content
+    assert content.count("<!-- CTA Section -->") == 1
+
+    # the rendered grid is its own anchor: re-running changes nothing
+    run_script("render-sections.py")
+    assert (site / "sedes.html").read_text(encoding='utf-8') == content
+
+
+def test_replaces_the_fix_sedes_direct_section(site, run_script):
+    shutil.copy(CORPUS / "sedes.html", site / "sedes.html")
+    run_script("fix-sedes-direct.py")
+    assert "<!-- Sedes Section -->" in (site / "sedes.html").read_text(encoding='utf-8')
+
+    run_script("render-sections.py")
+
+    content = (site / "sedes.html").read_text(encoding='utf-8')
+    assert "<!-- Sedes Section -->" not in content
+    assert content.count("<!-- Sedes Grid -->") == 1
@@ -0,0 +1,61 @@
+import json
+import re
+from pathlib import Path
+
+PAGE = '''<html><head>
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css">
+</head><body>
+<i class="fas fa-bars"></i>
+<i class="fas fa-clock"></i>
+</body></html>
+'''
+
+
+def glyph(svgs, name):
+    path = svgs / "solid" / f"{name}.svg"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 448 512"><path d="M0 {name}"/></svg>')
+
+
+def sprite_ids(path):
+    return set(re.findall(r'<symbol id="([^"]+)"', Path(path).read_text(encoding='utf-8')))
+
+
+def test_subset_fingerprint_subset_keeps_sprite(site, run_script, tmp_path_factory):
+    svgs = tmp_path_factory.mktemp("svgs")
+    glyph(svgs, "bars")
+    glyph(svgs, "clock")
+    (site / "index.html").write_text(PAGE, encoding='utf-8')
+
+    run_script("subset-font-awesome.py", "--svgs", str(svgs))
+    run_script("fingerprint-assets.py")
+    page = (site / "index.html").read_text(encoding='utf-8')
+    fingerprinted = json.loads((site / "asset-manifest.json").read_text())["/icons/fa-sprite.svg"]
+    assert f'href="{fingerprinted}#fa-solid-bars"' in page
+
+    # a new page with its own icon; clock's source is gone and must come from the sprite
+    glyph(svgs, "phone")
+    (svgs / "solid" / "clock.svg").unlink()
+    (site / "contacto.html").write_text(PAGE.replace("fa-bars", "fa-phone"), encoding='utf-8')
+    run_script("subset-font-awesome.py", "--svgs", str(svgs))
+    assert sprite_ids("icons/fa-sprite.svg") == {"fa-solid-bars", "fa-solid-clock", "fa-solid-phone"}
+
+    run_script("fingerprint-assets.py")
+    page = (site / "index.html").read_text(encoding='utf-8')
+    for url, symbol in re.findall(r'<use href="/([^"#]+)#([^"]+)"', page):
+        assert symbol in sprite_ids(url)
+
+
+def test_symbols_in_sprite_are_kept_without_references(site, run_script, tmp_path_factory):
+    svgs = tmp_path_factory.mktemp("svgs")
+    glyph(svgs, "bars")
+    (site / "index.html").write_text('<html><head></head><body><i class="fas fa-bars"></i></body></html>')
+    (site / "icons").mkdir()
+    (site / "icons" / "fa-sprite.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">\n'
+        '<symbol id="fa-solid-heart" viewBox="0 0 512 512"><path d="M0 heart"/></symbol>\n</svg>\n'
+    )
+
+    run_script("subset-font-awesome.py", "--svgs", str(svgs))
+
+    assert sprite_ids("icons/fa-sprite.svg") == {"fa-solid-bars", "fa-solid-heart"}
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+HTML well-formedness validation for rewritten pages
+1. Re-tokenize every page in parallel worker processes with a small
+   dedicated tokenizer (html.parser silently accepts the damage we look for)
+2. Report, per page:
+   - unbalanced tags: unclosed elements and stray end tags
+     (void elements and optional end tags like </p>, </li> are understood)
+   - duplicate attributes on one tag (style="..." style="...")
+   - unclosed quotes: a quoted value that runs to EOF or swallows markup,
+     what a truncated style= replacement leaves behind
+3. Compare with the pre-edit baseline in .build-cache/html-baseline.json and
+   fail only on issues the rewrites introduced; the legacy pages' existing
+   problems do not block a batch. A page with no baseline fails: only an
+   explicit --baseline run records one
+
+    validate-html.py --baseline   record the current state (before rewriting)
+    validate-html.py              check the pages after rewriting
+
+run-rules.py uses new_issues() to reject a rule's output page by page.
+"""
+
+import argparse
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from site_pipeline import find_pages, load_cache, save_cache
+
+BASELINE_CACHE = "html-baseline"
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+}
+# End tags HTML lets authors omit
+OPTIONAL_END = {
+    "html", "head", "body", "p", "li", "dt", "dd", "option", "optgroup",
+    "thead", "tbody", "tfoot", "tr", "td", "th", "colgroup", "rt", "rp",
+}
+RAW_TEXT = {"script", "style", "textarea", "title"}
+RAW_TEXT_END = {name: re.compile(rf'</{name}\s*>', re.IGNORECASE) for name in RAW_TEXT}
+
+MARKUP_PATTERN = re.compile(
+    r'<!--.*?-->|<![^>]*>|<\?[^>]*>|</\s*([a-zA-Z][\w:-]*)\s*>|<([a-zA-Z][\w:-]*)',
+    re.DOTALL
+)
+ATTR_NAME_PATTERN = re.compile(r'[^\s"\'>/=]+')
+SPACE_PATTERN = re.compile(r'\s*')
+UNQUOTED_VALUE_PATTERN = re.compile(r'[^\s>]*')
+# A quoted value containing a tag means the quote closed somewhere far later
+SWALLOWED_MARKUP = re.compile(r'<(?:/?[a-zA-Z][\w:-]*[\s>/]|!--)')
+
+
+def parse_attributes(text, pos, line_at):
+    """Scan a start tag's attributes from pos; returns (end offset, self-closing, issues)"""
+    issues = []
+    seen = set()
+    length = len(text)
+    while pos < length:
+        pos = SPACE_PATTERN.match(text, pos).end()
+        if text.startswith("/>", pos):
+            return pos + 2, True, issues
+        if pos >= length or text[pos] == ">":
+            return pos + 1, False, issues
+        if text[pos] == "<":
+            issues.append(("unclosed tag", "start tag runs into the next tag", line_at(pos)))
+            return pos, False, issues
+
+        name_match = ATTR_NAME_PATTERN.match(text, pos)
+        if not name_match:
+            pos += 1
+            continue
+        name = name_match.group(0).lower()
+        pos = name_match.end()
+        if name in seen:
+            issues.append(("duplicate attribute", name, line_at(name_match.start())))
+        seen.add(name)
+
+        after = SPACE_PATTERN.match(text, pos).end()
+        if after < length and text[after] == "=":
+            pos = SPACE_PATTERN.match(text, after + 1).end()
+            if pos < length and text[pos] in "\"'":
+                quote = text[pos]
+                close = text.find(quote, pos + 1)
+                if close == -1:
+                    issues.append(("unclosed quote", name, line_at(pos)))
+                    return length, False, issues
+                if SWALLOWED_MARKUP.search(text, pos + 1, close):
+                    issues.append(("unclosed quote", f"{name} value swallows markup", line_at(pos)))
+                pos = close + 1
+            else:
+                pos = UNQUOTED_VALUE_PATTERN.match(text, pos).end()
+    return length, False, issues
+
+
+def validate(text):
+    """Well-formedness issues in a page: [(kind, detail, line)]"""
+    issues = []
+    stack = []
+    newlines = [m.start() for m in re.finditer("\n", text)]
+
+    def line_at(offset):
+        # binary search over newline offsets
+        low, high = 0, len(newlines)
+        while low < high:
+            mid = (low + high) // 2
+            if newlines[mid] < offset:
+                low = mid + 1
+            else:
+                high = mid
+        return low + 1
+
+    pos = 0
+    while True:
+        match = MARKUP_PATTERN.search(text, pos)
+        if not match:
+            break
+        end_name, start_name = match.group(1), match.group(2)
+
+        if start_name:
+            name = start_name.lower()
+            pos, self_closing, attr_issues = parse_attributes(text, match.end(), line_at)
+            issues.extend(attr_issues)
+            if name in RAW_TEXT:
+                close = RAW_TEXT_END[name].search(text, pos)
+                if not close:
+                    issues.append(("unclosed element", name, line_at(match.start())))
+                    break
+                pos = close.end()
+            elif name not in VOID_ELEMENTS and not self_closing:
+                stack.append((name, line_at(match.start())))
+        elif end_name:
+            name = end_name.lower()
+            pos = match.end()
+            if name in VOID_ELEMENTS:
+                continue
+            if not any(open_name == name for open_name, _ in stack):
+                issues.append(("stray end tag", name, line_at(match.start())))
+                continue
+            while stack:
+                open_name, line = stack.pop()
+                if open_name == name:
+                    break
+                if open_name not in OPTIONAL_END:
+                    issues.append(("unclosed element", open_name, line))
+        else:
+            pos = match.end()
+
+    for open_name, line in stack:
+        if open_name not in OPTIONAL_END:
+            issues.append(("unclosed element", open_name, line))
+    return issues
+
+
+def signature(issues):
+    """Line-independent multiset of issues, comparable across edits"""
+    return Counter(f"{kind}: {detail}" for kind, detail, _ in issues)
+
+
+def new_issues(before, after):
+    """Issues present in `after` beyond those already in `before` (page texts)"""
+    issues = validate(after)
+    added = signature(issues) - signature(validate(before))
+    result = []
+    for kind, detail, line in issues:
+        key = f"{kind}: {detail}"
+        if added[key] > 0:
+            added[key] -= 1
+            result.append((kind, detail, line))
+    return result
+
+
+def validate_page(page):
+    """Worker: (page, issues, milliseconds)"""
+    started = time.perf_counter()
+    with open(page, encoding='utf-8') as f:
+        issues = validate(f.read())
+    return page, issues, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate page well-formedness against the baseline")
+    parser.add_argument("--baseline", action="store_true", help="record current issues as the baseline")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("HTML WELL-FORMEDNESS VALIDATION" + (" (RECORDING BASELINE)" if args.baseline else ""))
+    print("=" * 70)
+    print()
+
+    pages = [page.as_posix() for page in find_pages()]
+    baseline = load_cache(BASELINE_CACHE)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(validate_page, pages, chunksize=8))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    failed = 0
+    for page, issues, _ in results:
+        current = signature(issues)
+        if args.baseline:
+            baseline[page] = dict(current)
+            continue
+        if page not in baseline:
+            # without a baseline there is nothing to tell the rewrites' damage from
+            # the page's own problems; record one explicitly before rewriting
+            failed += 1
+            print(f"  ❌ {page}: no baseline (run validate-html.py --baseline before rewriting)")
+            for kind, detail, line in issues:
+                print(f"       line {line}: {kind}: {detail}")
+            continue
+
+        added = current - Counter(baseline[page])
+        if not added:
+            continue
+        failed += 1
+        print(f"  ❌ {page}")
+        for kind, detail, line in issues:
+            key = f"{kind}: {detail}"
+            if added[key] > 0:
+                added[key] -= 1
+                print(f"       line {line}: {kind}: {detail}")
+
+    if args.baseline:
+        save_cache(BASELINE_CACHE, baseline)
+    page_ms = sum(ms for _, _, ms in results) / max(len(results), 1)
+
+    print()
+    print("=" * 70)
+    if args.baseline:
+        print(f"✅ Baseline recorded for {len(results)} pages")
+    elif failed:
+        print(f"❌ {failed} pages gained well-formedness issues or have no baseline")
+    else:
+        print(f"✅ {len(results)} pages valid against the baseline")
+    print(f"{elapsed:.0f} ms total, {page_ms:.1f} ms per page")
+    print("=" * 70)
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()